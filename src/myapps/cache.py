@@ -0,0 +1,226 @@
+"""
+Inventar-Cache für MyApps
+Speichert Paketlisten und Filter-Ergebnisse pro Paketmanager unter ~/.cache/myapps,
+damit beim Start nichts neu abgefragt werden muss, solange sich die
+Paket-Datenbank nicht verändert hat
+"""
+
+import json
+import os
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .package_manager import Package
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedBackend:
+    """Gecachte Ergebnisse eines Paketmanagers"""
+    packages: List[Package]
+    user_apps: Optional[List[Package]]  # None wenn sich die Filter geändert haben
+
+
+class InventoryCache:
+    """Verwaltet den persistenten Inventar-Snapshot"""
+
+    # Format-Version der Cache-Datei (bei Änderungen erhöhen)
+    CACHE_VERSION = 1
+
+    # Dateien/Verzeichnisse, deren Änderung auf neue oder entfernte Pakete hinweist
+    BACKEND_DB_PATHS = {
+        "dpkg": ["/var/lib/dpkg/status"],
+        "pacman": ["/var/lib/pacman/local"],
+        "rpm": ["/var/lib/rpm", "/var/lib/rpm/rpmdb.sqlite", "/var/lib/rpm/Packages"],
+        "dnf": ["/var/lib/rpm", "/var/lib/rpm/rpmdb.sqlite", "/var/lib/rpm/Packages"],
+        "zypper": ["/var/lib/rpm", "/var/lib/rpm/rpmdb.sqlite", "/var/lib/rpm/Packages"],
+        "eopkg": ["/var/lib/eopkg/package"],
+        "snap": ["/var/lib/snapd/snaps"],
+        "flatpak": [
+            "/var/lib/flatpak/.changed",
+            "/var/lib/flatpak/app",
+            "~/.local/share/flatpak/.changed",
+            "~/.local/share/flatpak/app",
+        ],
+    }
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialisiert den InventoryCache
+
+        Args:
+            cache_dir: Cache-Verzeichnis (Standard: ~/.cache/myapps)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "myapps"
+        self.cache_path = self.cache_dir / "inventory.json"
+        self._backends: Dict[str, dict] = {}
+        self._loaded = False
+
+    def fingerprint(self, pm_name: str) -> Optional[List]:
+        """
+        Ermittelt den Fingerprint der Paket-Datenbank eines Paketmanagers
+
+        Args:
+            pm_name: Name des Paketmanagers (z.B. "dpkg")
+
+        Returns:
+            Liste aus (Pfad, mtime, Größe, Inode) oder None wenn nicht ermittelbar
+        """
+        paths = self.BACKEND_DB_PATHS.get(pm_name.lower())
+        if not paths:
+            return None
+
+        fingerprint = []
+        for path in paths:
+            expanded = os.path.expanduser(path)
+            try:
+                st = os.stat(expanded)
+                fingerprint.append([expanded, st.st_mtime_ns, st.st_size, st.st_ino])
+            except OSError:
+                fingerprint.append([expanded, None, None, None])
+
+        # Ohne eine einzige existierende Datei ist der Fingerprint wertlos
+        if all(entry[1] is None for entry in fingerprint):
+            return None
+
+        return fingerprint
+
+    def load(self) -> None:
+        """Lädt die Cache-Datei (Fehler führen zu einem leeren Cache)"""
+        self._loaded = True
+        self._backends = {}
+
+        if not self.cache_path.exists():
+            logger.debug("Keine Inventar-Cache-Datei gefunden")
+            return
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("version") != self.CACHE_VERSION:
+                logger.info("Inventar-Cache hat veraltetes Format, wird verworfen")
+                return
+
+            self._backends = data.get("backends", {})
+            logger.info(f"Inventar-Cache geladen: {', '.join(self._backends) or '-'}")
+        except Exception as e:
+            logger.warning(f"Fehler beim Laden des Inventar-Caches: {e}")
+            self._backends = {}
+
+    def lookup(self, pm_name: str, filter_signature: str) -> Optional[CachedBackend]:
+        """
+        Gibt die gecachten Pakete eines Paketmanagers zurück, falls noch aktuell
+
+        Args:
+            pm_name: Name des Paketmanagers
+            filter_signature: Signatur der aktuell geladenen Filter
+
+        Returns:
+            CachedBackend oder None wenn sich die Datenbank geändert hat
+        """
+        if not self._loaded:
+            self.load()
+
+        entry = self._backends.get(pm_name)
+        if not entry:
+            return None
+
+        fingerprint = self.fingerprint(pm_name)
+        if fingerprint is None or fingerprint != entry.get("fingerprint"):
+            logger.info(f"Inventar-Cache für {pm_name} veraltet")
+            return None
+
+        packages = [
+            Package(name=name, version=version, package_type=pkg_type, description=description)
+            for name, version, pkg_type, description in entry.get("packages", [])
+        ]
+
+        # Filter-Ergebnisse nur übernehmen, wenn die Filter unverändert sind
+        user_apps = None
+        if entry.get("filter_signature") == filter_signature:
+            user_apps = [packages[i] for i in entry.get("user_apps", [])]
+
+        return CachedBackend(packages=packages, user_apps=user_apps)
+
+    def store(self, pm_name: str, fingerprint: Optional[List], packages: List[Package],
+              user_apps: List[Package], filter_signature: str) -> None:
+        """
+        Übernimmt frische Ergebnisse eines Paketmanagers in den Cache
+
+        Args:
+            pm_name: Name des Paketmanagers
+            fingerprint: Fingerprint, der VOR der Abfrage ermittelt wurde
+            packages: Alle Pakete des Paketmanagers
+            user_apps: Davon als User-App erkannte Pakete
+            filter_signature: Signatur der verwendeten Filter
+        """
+        if fingerprint is None:
+            # Nicht cachebar (Datenbank unbekannt)
+            self._backends.pop(pm_name, None)
+            return
+
+        user_app_ids = {id(pkg) for pkg in user_apps}
+
+        self._backends[pm_name] = {
+            "fingerprint": fingerprint,
+            "filter_signature": filter_signature,
+            "packages": [
+                [pkg.name, pkg.version, pkg.package_type, pkg.description]
+                for pkg in packages
+            ],
+            "user_apps": [i for i, pkg in enumerate(packages) if id(pkg) in user_app_ids],
+        }
+
+    def save(self) -> bool:
+        """
+        Schreibt den Cache atomar auf die Festplatte
+
+        Danach werden die Einträge im Speicher freigegeben (siehe release).
+
+        Returns:
+            True bei Erfolg, False bei Fehler
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".json.tmp")
+
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": self.CACHE_VERSION,
+                    "backends": self._backends
+                }, f, ensure_ascii=False)
+
+            os.replace(tmp_path, self.cache_path)
+            logger.debug(f"Inventar-Cache gespeichert: {self.cache_path}")
+            self.release()
+            return True
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern des Inventar-Caches: {e}")
+            return False
+
+    def release(self) -> None:
+        """
+        Gibt die Einträge im Speicher frei
+
+        Die Paketlisten würden sonst das gesamte Inventar neben der PackageTable
+        ein zweites Mal im Speicher halten. Beim nächsten lookup wird die
+        Cache-Datei neu geladen, damit ein späteres save keine Paketmanager verliert.
+        """
+        self._backends = {}
+        self._loaded = False
+
+    def clear(self) -> None:
+        """Leert den Cache (Datei und Speicher)"""
+        self._backends = {}
+        self._loaded = True
+        try:
+            self.cache_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Fehler beim Löschen des Inventar-Caches: {e}")
+        logger.info("Inventar-Cache geleert")
@@ -0,0 +1,242 @@
+"""
+Kommandozeilen-Modus für MyApps
+Listet, exportiert und vergleicht das Inventar ohne GUI (kein GTK, Adwaita
+oder Pillow), z.B. für Cron-Jobs, SSH-Sitzungen und Skripte, und führt
+die Exporte vieler Rechner zu einer Host-Matrix zusammen
+"""
+
+import argparse
+import logging
+import signal
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .distro_detect import get_distro_info, get_filter_files
+from .export import Exporter
+from .filters import FilterManager
+from .inventory import PackageTable
+from .matrix import InventoryMatrix
+from .package_manager import Package, PackageManagerFactory
+from .snapshot import diff_snapshots, diff_to_json, format_diff, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Unterstützte Ausgabeformate (SQLite nur in Dateien, nicht auf der Standardausgabe)
+FORMATS = ("txt", "csv", "json", "jsonl", "sqlite")
+LIST_FORMATS = ("txt", "csv", "json", "jsonl")
+DIFF_FORMATS = ("txt", "json")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Erstellt den Argument-Parser für die Unterkommandos"""
+    parser = argparse.ArgumentParser(
+        prog="myapps",
+        description="Installierte Anwendungen auflisten und exportieren (ohne GUI)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Gemeinsame Optionen
+    common = argparse.ArgumentParser(add_help=False)
+    scope = common.add_mutually_exclusive_group()
+    scope.add_argument("--all", dest="include_all", action="store_true",
+                       help="Alle Pakete inklusive System-Pakete")
+    scope.add_argument("--user-apps", dest="include_all", action="store_false",
+                       help="Nur User-Apps (Standard)")
+    common.add_argument("--type", "-t", dest="types", action="append", metavar="TYP",
+                        help="Nur Pakete dieses Typs (deb, rpm, pkg, eopkg, snap, flatpak); "
+                             "mehrfach oder kommagetrennt angebbar")
+    common.add_argument("--verbose", "-v", action="store_true", help="Log-Ausgaben anzeigen")
+
+    list_parser = subparsers.add_parser("list", parents=[common], help="Pakete auf der Standardausgabe ausgeben")
+    list_parser.add_argument("--format", "-f", choices=LIST_FORMATS, help="Ausgabeformat (Standard: txt)")
+
+    export_parser = subparsers.add_parser("export", parents=[common], help="Pakete in eine Datei exportieren")
+    export_parser.add_argument("--format", "-f", choices=FORMATS,
+                               help="Ausgabeformat (Standard: aus der Dateiendung)")
+    export_parser.add_argument("output", help="Ausgabedatei (- für Standardausgabe, .gz/.xz/.bz2/.zst wird "
+                                              "komprimiert, .sqlite/.db als SQLite-Datenbank)")
+
+    diff_parser = subparsers.add_parser(
+        "diff", parents=[common],
+        help="Zwei Snapshots vergleichen (Exit-Code 0: gleich, 1: Unterschiede, 2: Fehler)"
+    )
+    diff_parser.add_argument("old", help="Älterer Snapshot (beliebiges Export-Format)")
+    diff_parser.add_argument("new", nargs="?",
+                             help="Neuerer Snapshot (Standard: aktuell installierte Pakete)")
+    diff_parser.add_argument("--format", "-f", choices=DIFF_FORMATS, default="txt",
+                             help="Ausgabeformat (Standard: txt)")
+
+    matrix_parser = subparsers.add_parser(
+        "matrix", help="Exporte mehrerer Rechner zu einer Paket × Host-Matrix zusammenführen"
+    )
+    matrix_parser.add_argument("inputs", nargs="+", metavar="EXPORT",
+                               help="Exporte, einer pro Host (Host aus SQLite-Metadaten oder Dateiname)")
+    query = matrix_parser.add_mutually_exclusive_group()
+    query.add_argument("--rare", type=int, metavar="K",
+                       help="Pakete, die auf weniger als K Hosts installiert sind")
+    query.add_argument("--lagging", action="store_true",
+                       help="Hosts, auf denen ein Paket älter ist als die neueste Version")
+    query.add_argument("--find", metavar="NAME", help="Hosts und Versionen eines Pakets")
+    matrix_parser.add_argument("--verbose", "-v", action="store_true", help="Log-Ausgaben anzeigen")
+
+    return parser
+
+
+def parse_types(values: Optional[List[str]]) -> Optional[set]:
+    """
+    Wandelt die --type-Angaben in eine Menge von Pakettypen um
+
+    Args:
+        values: Werte der --type-Optionen (ggf. kommagetrennt)
+
+    Returns:
+        Menge von Pakettypen oder None (alle Typen)
+    """
+    if not values:
+        return None
+    return {t.strip().lower() for value in values for t in value.split(",") if t.strip()}
+
+
+def load_packages(base_dir: Path, include_all: bool, types: Optional[set]) -> List[Package]:
+    """
+    Fragt alle Paketmanager der Distribution ab und filtert das Ergebnis
+
+    Args:
+        base_dir: Basis-Verzeichnis (enthält filters/)
+        include_all: Wenn True, werden System-Pakete nicht herausgefiltert
+        types: Erlaubte Pakettypen (None = alle)
+
+    Returns:
+        Liste von Package-Objekten
+    """
+    distro_info = get_distro_info()
+    packages = PackageManagerFactory.get_all_packages(distro_info.package_managers)
+
+    if types is not None:
+        packages = [pkg for pkg in packages if pkg.package_type in types]
+
+    if not include_all:
+        filter_manager = FilterManager(str(base_dir / "filters"))
+        filter_manager.load_filters(get_filter_files())
+        packages = filter_manager.filter_packages(packages)
+
+    return packages
+
+
+def main(argv: List[str], base_dir: Path) -> int:
+    """
+    Führt ein CLI-Unterkommando aus
+
+    Args:
+        argv: Argumente ohne Programmnamen (z.B. ["list", "--format", "csv"])
+        base_dir: Basis-Verzeichnis der Anwendung
+
+    Returns:
+        Exit-Code (0 bei Erfolg)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "export" and args.output == Exporter.STDOUT and args.format == "sqlite":
+        parser.error("SQLite kann nicht auf die Standardausgabe geschrieben werden")
+
+    # Bei "myapps list | head" still beenden statt Broken-Pipe-Fehler zu loggen
+    signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+
+    # Standardausgabe gehört den Daten: Nur Warnungen loggen (auf stderr)
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    if args.command == "diff":
+        return run_diff(args, base_dir)
+    if args.command == "matrix":
+        return run_matrix(args)
+
+    # Spaltenorientiert sortieren: Package-Objekte entstehen erst beim Schreiben
+    table = PackageTable.from_packages(load_packages(base_dir, args.include_all, parse_types(args.types)))
+    packages = (table.package(row) for row in table.sorted_rows(range(len(table))))
+
+    if args.command == "list":
+        output = Exporter.STDOUT
+        fmt = args.format or "txt"
+    else:
+        output = args.output
+        fmt = args.format  # None: Format aus Dateiendung
+
+    if not Exporter.export(packages, output, fmt, presorted=True):
+        print("myapps: Export fehlgeschlagen", file=sys.stderr)
+        return 1
+
+    if output != Exporter.STDOUT:
+        logger.info(f"{len(table)} Pakete exportiert nach {output}")
+    return 0
+
+
+def run_diff(args: argparse.Namespace, base_dir: Path) -> int:
+    """
+    Vergleicht zwei Snapshots und gibt die Unterschiede aus
+
+    Args:
+        args: Argumente des diff-Unterkommandos
+        base_dir: Basis-Verzeichnis der Anwendung
+
+    Returns:
+        Exit-Code wie diff(1): 0 ohne Unterschiede, 1 mit Unterschieden, 2 bei Fehlern
+    """
+    types = parse_types(args.types)
+    try:
+        old = list(load_snapshot(args.old))
+        if args.new is not None:
+            new = load_snapshot(args.new)
+        else:
+            new = load_packages(base_dir, args.include_all, types)
+
+        if types is not None:
+            old = [pkg for pkg in old if pkg.package_type in types]
+            new = (pkg for pkg in new if pkg.package_type in types)
+
+        diff = diff_snapshots(old, new)
+    except Exception as e:
+        print(f"myapps: Vergleich fehlgeschlagen: {e}", file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        print(diff_to_json(diff))
+    else:
+        for line in format_diff(diff):
+            print(line)
+
+    return 1 if diff.has_changes else 0
+
+
+def run_matrix(args: argparse.Namespace) -> int:
+    """
+    Führt Exporte zu einer Host-Matrix zusammen und beantwortet Abfragen
+
+    Ohne Abfrage wird die Matrix als CSV ausgegeben (eine Spalte pro Host).
+
+    Args:
+        args: Argumente des matrix-Unterkommandos
+
+    Returns:
+        Exit-Code (0 bei Erfolg, 2 wenn kein Export gelesen werden konnte)
+    """
+    matrix = InventoryMatrix.from_exports(args.inputs)
+    if not matrix.hosts:
+        print("myapps: Keine lesbaren Exporte", file=sys.stderr)
+        return 2
+
+    logger.info(f"Matrix: {len(matrix.hosts)} Hosts, {len(matrix)} eindeutige Pakete")
+
+    if args.rare is not None:
+        for package_type, name, hosts in matrix.rare_packages(args.rare):
+            print(f"{package_type} {name}: {', '.join(hosts)}")
+    elif args.lagging:
+        for entry in matrix.lagging():
+            print(f"{entry.host} {entry.package_type} {entry.name} ({entry.version} < {entry.newest_version})")
+    elif args.find is not None:
+        for host, version in sorted(matrix.find(args.find).items()):
+            print(f"{host} {version}")
+    else:
+        matrix.write_csv(sys.stdout)
+
+    return 0
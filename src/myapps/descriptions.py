@@ -0,0 +1,279 @@
+"""
+Lokalisierte Paketbeschreibungen für MyApps
+Liest die apt-Übersetzungsdateien (/var/lib/apt/lists/*_i18n_Translation-<lang>)
+einmal ein, statt pro Paket apt-cache zu starten
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# lz4 ist optional (Ubuntu/Mint speichern die Listen teilweise lz4-komprimiert)
+try:
+    import lz4.frame
+    HAS_LZ4 = True
+except ImportError:
+    HAS_LZ4 = False
+
+logger = logging.getLogger(__name__)
+
+
+def get_description_languages() -> List[str]:
+    """
+    Ermittelt die Sprachen für Paketbeschreibungen aus der Umgebung
+
+    Berücksichtigt LANGUAGE, LC_ALL, LC_MESSAGES und LANG (in dieser Reihenfolge).
+    Englisch wird ausgelassen, da dpkg die englische Beschreibung bereits liefert.
+
+    Returns:
+        Liste von Sprachcodes in Prioritätsreihenfolge (z.B. ["de_DE", "de"])
+    """
+    candidates = []
+    for var in ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG"):
+        value = os.environ.get(var, "")
+        if value:
+            candidates.extend(value.split(":"))
+
+    languages = []
+    for candidate in candidates:
+        # de_DE.UTF-8@euro -> de_DE
+        code = candidate.split(".")[0].split("@")[0]
+        if not code or code in ("C", "POSIX"):
+            continue
+
+        for lang in (code, code.split("_")[0]):
+            if lang != "en" and not lang.startswith("en_") and lang not in languages:
+                languages.append(lang)
+
+    return languages
+
+
+class LocalizedDescriptionIndex:
+    """Index lokalisierter Kurzbeschreibungen aus den apt-Übersetzungsdateien"""
+
+    # Verzeichnis der apt-Paketlisten
+    LISTS_DIR = "/var/lib/apt/lists"
+
+    # Format-Version der Cache-Datei (bei Änderungen erhöhen)
+    CACHE_VERSION = 1
+
+    # Unterstützte Kompressionen (Endung -> Öffner)
+    _OPENERS = {
+        "": lambda path: open(path, 'rb'),
+        ".gz": gzip.open,
+        ".xz": lzma.open,
+        ".bz2": bz2.open,
+    }
+    if HAS_LZ4:
+        _OPENERS[".lz4"] = lz4.frame.open
+
+    def __init__(self, languages: Optional[List[str]] = None, lists_dir: Optional[str] = None,
+                 cache_dir: Optional[str] = None):
+        """
+        Initialisiert den LocalizedDescriptionIndex
+
+        Args:
+            languages: Sprachcodes in Prioritätsreihenfolge (Standard: aus der Umgebung)
+            lists_dir: apt-Listen-Verzeichnis (Standard: /var/lib/apt/lists)
+            cache_dir: Cache-Verzeichnis (Standard: ~/.cache/myapps)
+        """
+        self.languages = languages if languages is not None else get_description_languages()
+        self.lists_dir = Path(lists_dir or self.LISTS_DIR)
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "myapps"
+        lang_key = "_".join(self.languages) or "none"
+        self.cache_path = self.cache_dir / f"descriptions-{lang_key}.json"
+
+        # Paketname -> {Description-md5 -> Kurzbeschreibung}
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._sources: Dict[str, List[int]] = {}
+        self.loaded = False
+
+    def _find_translation_files(self) -> List[Path]:
+        """
+        Sucht die Übersetzungsdateien für die konfigurierten Sprachen
+
+        Returns:
+            Dateien in Sprach-Prioritätsreihenfolge
+        """
+        if not self.lists_dir.is_dir():
+            return []
+
+        files = []
+        for lang in self.languages:
+            by_base: Dict[str, Path] = {}
+            for path in sorted(self.lists_dir.glob(f"*_i18n_Translation-{lang}*")):
+                base = path.name
+                suffix = ""
+                for ext in (".gz", ".xz", ".bz2", ".lz4"):
+                    if base.endswith(ext):
+                        base = base[:-len(ext)]
+                        suffix = ext
+                        break
+
+                # Nur exakt diese Sprache (Translation-de, nicht Translation-de_AT)
+                if not base.endswith(f"_i18n_Translation-{lang}"):
+                    continue
+                if suffix not in self._OPENERS:
+                    logger.debug(f"Übersetzungsdatei nicht lesbar (Kompression fehlt): {path.name}")
+                    continue
+
+                # Unkomprimierte Datei bevorzugen
+                if base not in by_base or suffix == "":
+                    by_base[base] = path
+
+            files.extend(by_base[base] for base in sorted(by_base))
+
+        return files
+
+    def _source_signature(self, files: List[Path]) -> Dict[str, List[int]]:
+        """Ermittelt mtime/Größe aller Übersetzungsdateien"""
+        signature = {}
+        for path in files:
+            try:
+                st = os.stat(path)
+                signature[str(path)] = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                continue
+        return signature
+
+    def load(self) -> None:
+        """
+        Lädt den Index aus dem Cache oder baut ihn aus den Übersetzungsdateien neu auf
+
+        Der Cache wird nur verwendet, wenn sich keine der Übersetzungsdateien
+        geändert hat. Bereits geladene, aktuelle Indizes werden nicht neu gelesen.
+        """
+        if not self.languages:
+            self.loaded = True
+            return
+
+        files = self._find_translation_files()
+        signature = self._source_signature(files)
+
+        if self.loaded and signature == self._sources:
+            return
+
+        if self._load_cache(signature):
+            self.loaded = True
+            return
+
+        self._build(files)
+        self._sources = signature
+        self.loaded = True
+        self._save_cache()
+
+    def _load_cache(self, signature: Dict[str, List[int]]) -> bool:
+        """Lädt den persistierten Index, falls er zu den aktuellen Dateien passt"""
+        if not self.cache_path.exists():
+            return False
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("version") != self.CACHE_VERSION or data.get("sources") != signature:
+                return False
+
+            self._entries = data.get("entries", {})
+            self._sources = signature
+            logger.info(f"Beschreibungs-Index aus Cache geladen: {len(self._entries)} Pakete")
+            return True
+        except Exception as e:
+            logger.warning(f"Fehler beim Laden des Beschreibungs-Caches: {e}")
+            return False
+
+    def _save_cache(self) -> None:
+        """Schreibt den Index atomar in den Cache"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".json.tmp")
+
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": self.CACHE_VERSION,
+                    "languages": self.languages,
+                    "sources": self._sources,
+                    "entries": self._entries
+                }, f, ensure_ascii=False)
+
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern des Beschreibungs-Caches: {e}")
+
+    def _build(self, files: List[Path]) -> None:
+        """
+        Baut den Index in einem Durchlauf über alle Übersetzungsdateien auf
+
+        Args:
+            files: Übersetzungsdateien in Sprach-Prioritätsreihenfolge
+        """
+        entries: Dict[str, Dict[str, str]] = {}
+
+        for path in files:
+            opener = self._OPENERS[path.suffix if path.suffix in self._OPENERS else ""]
+            try:
+                with opener(path) as f:
+                    self._parse_translation(f, entries)
+            except Exception as e:
+                logger.warning(f"Fehler beim Lesen von {path}: {e}")
+
+        self._entries = entries
+        logger.info(f"Beschreibungs-Index aufgebaut: {len(entries)} Pakete aus {len(files)} Dateien")
+
+    @staticmethod
+    def _parse_translation(f, entries: Dict[str, Dict[str, str]]) -> None:
+        """
+        Liest eine Übersetzungsdatei zeilenweise (Stanzas mit Package,
+        Description-md5 und Description-<lang>)
+
+        Bereits vorhandene Einträge (aus höher priorisierten Sprachen) bleiben erhalten.
+        """
+        name = None
+        md5 = ""
+
+        for line in f:
+            if line.startswith(b" "):
+                # Fortsetzung der Langbeschreibung
+                continue
+
+            if line.startswith(b"Package: "):
+                name = line[9:].strip().decode('utf-8', 'replace')
+                md5 = ""
+            elif line.startswith(b"Description-md5: "):
+                md5 = line[17:].strip().decode('ascii', 'replace')
+            elif line.startswith(b"Description-") and name:
+                _, _, value = line.partition(b": ")
+                description = value.strip().decode('utf-8', 'replace')
+                if description:
+                    entries.setdefault(name, {}).setdefault(md5, description)
+            elif not line.strip():
+                name = None
+                md5 = ""
+
+    def get(self, package_name: str, description_md5: Optional[str] = None) -> Optional[str]:
+        """
+        Gibt die lokalisierte Kurzbeschreibung eines Pakets zurück
+
+        Args:
+            package_name: Name des Pakets
+            description_md5: MD5 der englischen Beschreibung (falls bekannt)
+
+        Returns:
+            Lokalisierte Beschreibung oder None
+        """
+        translations = self._entries.get(package_name)
+        if not translations:
+            return None
+
+        if description_md5 and description_md5 in translations:
+            return translations[description_md5]
+
+        return next(iter(translations.values()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
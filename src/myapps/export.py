@@ -1,172 +1,773 @@
 """
 Export-Modul für MyApps
-Exportiert Paketlisten in verschiedene Formate (txt, csv, json)
+Exportiert Paketlisten in verschiedene Formate (txt, csv, json, jsonl, sqlite)
+und liest sie wieder ein
+
+Alle Formate werden zeilenweise geschrieben: Pakete laufen als Generator
+durch den Writer, Zähler (gesamt und pro Typ) entstehen im selben Durchlauf.
+Endet der Dateiname auf .gz, .xz, .bz2 oder .zst, wird komprimiert geschrieben
+bzw. gelesen (z.B. myapps-export.json.gz).
+
+SQLite-Exporte (.sqlite/.db) enthalten zusätzlich Host, Distribution und
+Zeitpunkt und lassen sich ohne erneutes Parsen per Index abfragen.
 """
 
+import bz2
+import gzip
 import json
 import csv
+import lzma
+import os
+import socket
+import sqlite3
+import sys
 import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from .distro_detect import DistroInfo, get_distro_info
+from .package_manager import Package, package_sort_key
+
+# zstandard ist optional (.zst nur wenn installiert)
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 logger = logging.getLogger(__name__)
 
+# Kompression anhand der Dateiendung (Endung -> Öffner im Textmodus)
+COMPRESSIONS = {
+    ".gz": lambda path, mode, **kwargs: gzip.open(path, mode, compresslevel=6, **kwargs),
+    ".xz": lzma.open,
+    ".bz2": bz2.open,
+}
+if HAS_ZSTD:
+    COMPRESSIONS[".zst"] = zstandard.open
+
+# Dateiendung -> Export-Format
+FORMAT_SUFFIXES = {
+    '.txt': 'txt',
+    '.csv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.sqlite': 'sqlite',
+    '.db': 'sqlite'
+}
+
+# Schema des SQLite-Exports: Typen normalisiert, Indizes werden nach dem Einfügen angelegt
+SQLITE_SCHEMA_VERSION = 1
+SQLITE_SCHEMA = """
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE package_types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE packages (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type_id INTEGER NOT NULL REFERENCES package_types(id),
+    description TEXT
+);
+"""
+SQLITE_INDEXES = """
+CREATE INDEX idx_packages_name ON packages(name);
+CREATE INDEX idx_packages_type ON packages(type_id, name);
+"""
+
+
+def split_compression(path: str) -> Tuple[str, Optional[str]]:
+    """
+    Trennt Format- und Kompressions-Endung eines Dateinamens
+
+    Args:
+        path: Dateipfad (z.B. "export.json.gz")
+
+    Returns:
+        Tupel (Format-Endung, Kompressions-Endung oder None), z.B. (".json", ".gz")
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    if suffixes and suffixes[-1] in (".gz", ".xz", ".bz2", ".zst"):
+        return (suffixes[-2] if len(suffixes) > 1 else ""), suffixes[-1]
+    return (suffixes[-1] if suffixes else ""), None
+
+
+def detect_format(path: str) -> str:
+    """Ermittelt das Export-Format aus der Dateiendung (Standard: txt)"""
+    return FORMAT_SUFFIXES.get(split_compression(path)[0], 'txt')
+
+
+def open_text(path: str, mode: str, newline: str = None):
+    """
+    Öffnet eine (ggf. komprimierte) Textdatei
+
+    Args:
+        path: Dateipfad, die Kompression ergibt sich aus der Endung
+        mode: 'r' oder 'w'
+        newline: newline-Parameter für open()
+
+    Returns:
+        Textdatei-Objekt (UTF-8)
+    """
+    compression = split_compression(path)[1]
+    if compression is None:
+        return open(path, mode, encoding='utf-8', newline=newline)
+
+    opener = COMPRESSIONS.get(compression)
+    if opener is None:
+        raise ValueError(f"Kompression {compression} nicht verfügbar (zstandard nicht installiert)")
+    return opener(path, mode + 't', encoding='utf-8', newline=newline)
+
+
+def inventory_metadata(distro_info: Optional[DistroInfo] = None) -> Dict[str, str]:
+    """
+    Ermittelt die Metadaten eines Exports (Host, Distribution, Zeitpunkt)
+
+    Args:
+        distro_info: Erkannte Distribution (None = jetzt erkennen)
+
+    Returns:
+        Dictionary mit host, distro, distro_name, distro_version und export_date
+    """
+    if distro_info is None:
+        distro_info = get_distro_info()
+    return {
+        'host': socket.gethostname(),
+        'distro': distro_info.name,
+        'distro_name': distro_info.pretty_name,
+        'distro_version': distro_info.version,
+        'export_date': datetime.now().isoformat(),
+    }
+
+
+def connect_sqlite_readonly(path: str) -> sqlite3.Connection:
+    """
+    Öffnet einen SQLite-Export nur lesend
+
+    Raises:
+        sqlite3.Error: Wenn die Datei fehlt oder keine SQLite-Datenbank ist
+    """
+    return sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+
+
+class ExportCancelled(Exception):
+    """Wird ausgelöst, wenn ein laufender Export abgebrochen wurde"""
+
+
+@dataclass
+class ExportStats:
+    """Zähler, die beim Schreiben im selben Durchlauf gesammelt werden"""
+    total: int = 0
+    by_type: Dict[str, int] = field(default_factory=dict)
+
+    def count(self, packages: Iterable[Package]) -> Iterator[Package]:
+        """
+        Reicht Pakete durch und zählt sie dabei
+
+        Args:
+            packages: Pakete
+
+        Yields:
+            Dieselben Pakete
+        """
+        by_type = self.by_type
+        for pkg in packages:
+            self.total += 1
+            by_type[pkg.package_type] = by_type.get(pkg.package_type, 0) + 1
+            yield pkg
+
+
+def package_record(pkg: Package) -> dict:
+    """Wandelt ein Package in ein Dictionary für JSON/JSONL um"""
+    return {
+        'name': pkg.name,
+        'version': pkg.version,
+        'type': pkg.package_type,
+        'description': pkg.description
+    }
+
 
 class Exporter:
     """Klasse zum Exportieren von Paketlisten"""
 
+    # Ausgabepfad für die Standardausgabe (CLI)
+    STDOUT = "-"
+
+    # Fortschritt melden / Abbruch prüfen alle N Pakete
+    PROGRESS_INTERVAL = 1000
+
     @staticmethod
-    def export_to_txt(packages: List, output_path: str) -> bool:
+    @contextmanager
+    def _atomic_path(output_path: str):
         """
-        Exportiert Pakete in eine Textdatei
+        Liefert einen temporären Pfad im Zielverzeichnis
+
+        Die temporäre Datei wird erst nach erfolgreichem Schreiben per os.replace
+        umbenannt. Ein Fehler oder Abbruch hinterlässt daher nie eine halb
+        geschriebene Datei.
 
         Args:
-            packages: Liste von Package-Objekten
             output_path: Pfad zur Ausgabedatei
 
+        Yields:
+            Pfad der temporären Datei (mit denselben Endungen wie output_path)
+        """
+        path = Path(output_path)
+        format_suffix, compression = split_compression(output_path)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=format_suffix + (compression or "")
+        )
+        os.close(fd)
+
+        try:
+            yield tmp_path
+
+            # mkstemp legt 0600 an: Rechte einer vorhandenen Datei übernehmen
+            try:
+                mode = os.stat(output_path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    @contextmanager
+    def _open_output(output_path: str, newline: str = None):
+        """
+        Öffnet die Ausgabedatei (oder die Standardausgabe bei "-")
+
+        Args:
+            output_path: Pfad zur Ausgabedatei oder "-"
+            newline: newline-Parameter für open()
+
+        Yields:
+            Textdatei-Objekt
+        """
+        if output_path == Exporter.STDOUT:
+            yield sys.stdout
+            sys.stdout.flush()
+            return
+
+        with Exporter._atomic_path(output_path) as tmp_path:
+            with open_text(tmp_path, 'w', newline=newline) as f:
+                yield f
+
+    @staticmethod
+    def _ordered(packages: Iterable[Package], presorted: bool) -> Iterable[Package]:
+        """
+        Liefert die Pakete nach Typ und Name sortiert
+
+        Args:
+            packages: Pakete
+            presorted: True wenn die Pakete bereits sortiert sind (z.B. Generator
+                über ein sortiertes Inventar) - dann wird nichts zwischengespeichert
+        """
+        if presorted:
+            return packages
+        return sorted(packages, key=package_sort_key)
+
+    @staticmethod
+    def _monitored(packages: Iterable[Package], progress: Optional[Callable[[int], None]],
+                   cancel_event: Optional[threading.Event]) -> Iterator[Package]:
+        """
+        Reicht Pakete durch, meldet den Fortschritt und prüft auf Abbruch
+
+        Args:
+            packages: Pakete
+            progress: Wird alle PROGRESS_INTERVAL Pakete und am Ende mit der Anzahl aufgerufen
+            cancel_event: Ist es gesetzt, wird ExportCancelled ausgelöst
+
+        Yields:
+            Dieselben Pakete
+        """
+        interval = Exporter.PROGRESS_INTERVAL
+        count = 0
+        for pkg in packages:
+            if count % interval == 0:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ExportCancelled()
+                if progress is not None and count:
+                    progress(count)
+            count += 1
+            yield pkg
+
+        if progress is not None:
+            progress(count)
+
+    @staticmethod
+    def write_txt(packages: Iterable[Package], f, stats: ExportStats) -> None:
+        """
+        Schreibt Pakete gruppiert nach Typ als Text (Pakete müssen sortiert sein)
+
+        Die Anzahl steht am Ende der Datei, da sie erst beim Schreiben gezählt wird.
+        """
+        f.write(f"# MyApps Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+        current_type = None
+        for pkg in stats.count(packages):
+            if pkg.package_type != current_type:
+                current_type = pkg.package_type
+                f.write(f"\n=== {current_type.upper()} Pakete ===\n\n")
+            f.write(f"{pkg.name} ({pkg.version})\n")
+
+        by_type = ", ".join(f"{pkg_type}: {count}" for pkg_type, count in stats.by_type.items())
+        f.write(f"\n# Anzahl Pakete: {stats.total}" + (f" ({by_type})" if by_type else "") + "\n")
+
+    @staticmethod
+    def write_csv(packages: Iterable[Package], f, stats: ExportStats) -> None:
+        """Schreibt Pakete als CSV mit Kopfzeile"""
+        writer = csv.writer(f, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
+
+        # Header
+        writer.writerow(['Name', 'Version', 'Typ', 'Beschreibung'])
+
+        # Daten
+        for pkg in stats.count(packages):
+            writer.writerow([
+                pkg.name,
+                pkg.version,
+                pkg.package_type,
+                pkg.description or ''
+            ])
+
+    @staticmethod
+    def write_json(packages: Iterable[Package], f, stats: ExportStats) -> None:
+        """
+        Schreibt Pakete als JSON-Dokument
+
+        Die Paketliste wird Eintrag für Eintrag geschrieben; total_packages und
+        packages_by_type folgen nach der Liste.
+        """
+        f.write('{\n')
+        f.write(f'  "export_date": {json.dumps(datetime.now().isoformat())},\n')
+        f.write('  "packages": [')
+
+        separator = '\n'
+        for pkg in stats.count(packages):
+            entry = json.dumps(package_record(pkg), indent=2, ensure_ascii=False)
+            f.write(separator + '    ' + entry.replace('\n', '\n    '))
+            separator = ',\n'
+
+        f.write('\n  ],\n' if stats.total else '],\n')
+        f.write(f'  "total_packages": {stats.total},\n')
+        f.write(f'  "packages_by_type": {json.dumps(stats.by_type, ensure_ascii=False)}\n')
+        f.write('}\n')
+
+    @staticmethod
+    def write_jsonl(packages: Iterable[Package], f, stats: ExportStats) -> None:
+        """Schreibt Pakete als JSON Lines (ein Objekt pro Zeile, zum Weiterverarbeiten per Pipe)"""
+        for pkg in stats.count(packages):
+            f.write(json.dumps(package_record(pkg), ensure_ascii=False))
+            f.write('\n')
+
+    @staticmethod
+    def write_sqlite(packages: Iterable[Package], path: str, stats: ExportStats,
+                     metadata: Optional[Dict[str, str]] = None) -> None:
+        """
+        Schreibt Pakete in eine neue SQLite-Datenbank
+
+        Alle Zeilen werden in einer einzigen Transaktion per executemany
+        eingefügt, die Indizes erst danach angelegt.
+
+        Args:
+            packages: Pakete
+            path: Pfad der (leeren) Datenbankdatei
+            stats: Zähler
+            metadata: Metadaten (None = inventory_metadata())
+        """
+        if metadata is None:
+            metadata = inventory_metadata()
+
+        connection = sqlite3.connect(path, isolation_level=None)
+        try:
+            # Die Datei wird erst nach dem Schreiben umbenannt: kein Journal nötig
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.execute("BEGIN")
+            for statement in SQLITE_SCHEMA.split(";"):
+                if statement.strip():
+                    connection.execute(statement)
+
+            type_ids: Dict[str, int] = {}
+
+            def rows():
+                for pkg in stats.count(packages):
+                    type_id = type_ids.get(pkg.package_type)
+                    if type_id is None:
+                        type_id = type_ids[pkg.package_type] = len(type_ids) + 1
+                    yield pkg.name, pkg.version, type_id, pkg.description
+
+            connection.executemany(
+                "INSERT INTO packages (name, version, type_id, description) VALUES (?, ?, ?, ?)",
+                rows()
+            )
+            connection.executemany(
+                "INSERT INTO package_types (name, id) VALUES (?, ?)", type_ids.items()
+            )
+            for statement in SQLITE_INDEXES.split(";"):
+                if statement.strip():
+                    connection.execute(statement)
+
+            metadata = dict(metadata, total_packages=str(stats.total),
+                            schema_version=str(SQLITE_SCHEMA_VERSION))
+            connection.executemany("INSERT INTO metadata (key, value) VALUES (?, ?)", metadata.items())
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _export_with(writer, label: str, packages: Iterable[Package], output_path: str,
+                     presorted: bool, opener=None,
+                     progress: Optional[Callable[[int], None]] = None,
+                     cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Öffnet die Ausgabe und schreibt die Pakete mit dem angegebenen Writer
+
+        Args:
+            writer: Eine der write_*-Funktionen
+            label: Formatname für Log-Ausgaben
+            packages: Pakete
+            output_path: Pfad zur Ausgabedatei
+            presorted: True wenn die Pakete bereits nach Typ und Name sortiert sind
+            opener: Context-Manager-Funktion für die Ausgabe (Standard: _open_output)
+            progress: Fortschritts-Callback (Anzahl geschriebener Pakete)
+            cancel_event: Bricht den Export ab, sobald es gesetzt ist
+
         Returns:
-            True bei Erfolg, False bei Fehler
+            True bei Erfolg, False bei Fehler oder Abbruch
         """
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"# MyApps Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Anzahl Pakete: {len(packages)}\n\n")
-
-                # Gruppiere nach Pakettyp
-                grouped = {}
-                for pkg in packages:
-                    if pkg.package_type not in grouped:
-                        grouped[pkg.package_type] = []
-                    grouped[pkg.package_type].append(pkg)
-
-                # Schreibe gruppiert
-                for pkg_type, pkgs in sorted(grouped.items()):
-                    f.write(f"\n=== {pkg_type.upper()} Pakete ({len(pkgs)}) ===\n\n")
-                    for pkg in sorted(pkgs, key=lambda p: p.name):
-                        f.write(f"{pkg.name} ({pkg.version})\n")
-
-            logger.info(f"Export nach {output_path} erfolgreich (TXT)")
+            stats = ExportStats()
+            rows = Exporter._ordered(packages, presorted)
+            if progress is not None or cancel_event is not None:
+                rows = Exporter._monitored(rows, progress, cancel_event)
+
+            with (opener or Exporter._open_output)(output_path) as f:
+                writer(rows, f, stats)
+
+            logger.info(f"Export nach {output_path} erfolgreich ({label}, {stats.total} Pakete)")
             return True
+        except ExportCancelled:
+            logger.info(f"Export nach {output_path} abgebrochen")
+            return False
         except Exception as e:
-            logger.error(f"Fehler beim TXT-Export: {e}")
+            logger.error(f"Fehler beim {label}-Export: {e}")
             return False
 
     @staticmethod
-    def export_to_csv(packages: List, output_path: str) -> bool:
+    @contextmanager
+    def _sqlite_output(output_path: str):
+        """
+        Liefert den temporären Pfad für einen SQLite-Export
+
+        Raises:
+            ValueError: Bei Standardausgabe oder Kompressions-Endung
+        """
+        if output_path == Exporter.STDOUT:
+            raise ValueError("SQLite-Export kann nicht auf die Standardausgabe geschrieben werden")
+        if split_compression(output_path)[1] is not None:
+            raise ValueError("SQLite-Exporte werden nicht komprimiert")
+
+        with Exporter._atomic_path(output_path) as tmp_path:
+            yield tmp_path
+
+    @staticmethod
+    def export_to_txt(packages: Iterable[Package], output_path: str, presorted: bool = False) -> bool:
+        """
+        Exportiert Pakete in eine Textdatei
+
+        Args:
+            packages: Package-Objekte (Liste oder Generator)
+            output_path: Pfad zur Ausgabedatei
+            presorted: True wenn die Pakete bereits nach Typ und Name sortiert sind
+
+        Returns:
+            True bei Erfolg, False bei Fehler
+        """
+        return Exporter.export(packages, output_path, 'txt', presorted)
+
+    @staticmethod
+    def export_to_csv(packages: Iterable[Package], output_path: str, presorted: bool = False) -> bool:
         """
         Exportiert Pakete in eine CSV-Datei
 
         Args:
-            packages: Liste von Package-Objekten
+            packages: Package-Objekte (Liste oder Generator)
             output_path: Pfad zur Ausgabedatei
+            presorted: True wenn die Pakete bereits nach Typ und Name sortiert sind
 
         Returns:
             True bei Erfolg, False bei Fehler
         """
-        try:
-            with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
-
-                # Header
-                writer.writerow(['Name', 'Version', 'Typ', 'Beschreibung'])
-
-                # Daten
-                for pkg in sorted(packages, key=lambda p: (p.package_type, p.name)):
-                    writer.writerow([
-                        pkg.name,
-                        pkg.version,
-                        pkg.package_type,
-                        pkg.description or ''
-                    ])
-
-            logger.info(f"Export nach {output_path} erfolgreich (CSV)")
-            return True
-        except Exception as e:
-            logger.error(f"Fehler beim CSV-Export: {e}")
-            return False
+        return Exporter.export(packages, output_path, 'csv', presorted)
 
     @staticmethod
-    def export_to_json(packages: List, output_path: str) -> bool:
+    def export_to_json(packages: Iterable[Package], output_path: str, presorted: bool = False) -> bool:
         """
         Exportiert Pakete in eine JSON-Datei
 
         Args:
-            packages: Liste von Package-Objekten
+            packages: Package-Objekte (Liste oder Generator)
             output_path: Pfad zur Ausgabedatei
+            presorted: True wenn die Pakete bereits nach Typ und Name sortiert sind
 
         Returns:
             True bei Erfolg, False bei Fehler
         """
-        try:
-            # Konvertiere Packages zu Dictionaries
-            packages_data = []
-            for pkg in packages:
-                packages_data.append({
-                    'name': pkg.name,
-                    'version': pkg.version,
-                    'type': pkg.package_type,
-                    'description': pkg.description
-                })
-
-            # Sortiere nach Typ und Name
-            packages_data.sort(key=lambda p: (p['type'], p['name']))
-
-            # Erstelle Export-Struktur
-            export_data = {
-                'export_date': datetime.now().isoformat(),
-                'total_packages': len(packages),
-                'packages_by_type': {},
-                'packages': packages_data
-            }
-
-            # Zähle Pakete nach Typ
-            for pkg in packages:
-                pkg_type = pkg.package_type
-                if pkg_type not in export_data['packages_by_type']:
-                    export_data['packages_by_type'][pkg_type] = 0
-                export_data['packages_by_type'][pkg_type] += 1
-
-            # Schreibe JSON
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-
-            logger.info(f"Export nach {output_path} erfolgreich (JSON)")
-            return True
-        except Exception as e:
-            logger.error(f"Fehler beim JSON-Export: {e}")
-            return False
+        return Exporter.export(packages, output_path, 'json', presorted)
 
     @staticmethod
-    def export(packages: List, output_path: str, format: str = None) -> bool:
+    def export_to_jsonl(packages: Iterable[Package], output_path: str, presorted: bool = False) -> bool:
         """
-        Exportiert Pakete im angegebenen Format
+        Exportiert Pakete als JSON Lines (ein Objekt pro Zeile)
+
+        Args:
+            packages: Package-Objekte (Liste oder Generator)
+            output_path: Pfad zur Ausgabedatei
+            presorted: True wenn die Pakete bereits nach Typ und Name sortiert sind
+
+        Returns:
+            True bei Erfolg, False bei Fehler
+        """
+        return Exporter.export(packages, output_path, 'jsonl', presorted)
+
+    @staticmethod
+    def export_to_sqlite(packages: Iterable[Package], output_path: str, presorted: bool = False) -> bool:
+        """
+        Exportiert Pakete in eine SQLite-Datenbank (mit Host, Distribution und Zeitpunkt)
 
         Args:
-            packages: Liste von Package-Objekten
+            packages: Package-Objekte (Liste oder Generator)
             output_path: Pfad zur Ausgabedatei
-            format: Export-Format ('txt', 'csv', 'json') - wird aus Dateiendung ermittelt falls None
+            presorted: True wenn die Pakete bereits nach Typ und Name sortiert sind
 
         Returns:
             True bei Erfolg, False bei Fehler
         """
-        # Ermittle Format aus Dateiendung falls nicht angegeben
+        return Exporter.export(packages, output_path, 'sqlite', presorted)
+
+    @staticmethod
+    def export(packages: Iterable[Package], output_path: str, format: str = None,
+               presorted: bool = False, progress: Optional[Callable[[int], None]] = None,
+               cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Exportiert Pakete im angegebenen Format
+
+        Args:
+            packages: Package-Objekte (Liste oder Generator)
+            output_path: Pfad zur Ausgabedatei
+            format: Export-Format ('txt', 'csv', 'json', 'jsonl', 'sqlite') - wird aus Dateiendung ermittelt falls None
+            presorted: True wenn die Pakete bereits nach Typ und Name sortiert sind. Nur dann
+                wird gestreamt; unsortierte Pakete werden zum Sortieren vollständig eingelesen
+            progress: Fortschritts-Callback (Anzahl geschriebener Pakete, aus dem schreibenden Thread)
+            cancel_event: Bricht den Export ab, sobald es gesetzt ist (Ergebnis False)
+
+        Returns:
+            True bei Erfolg, False bei Fehler oder Abbruch
+        """
+        # Ermittle Format aus Dateiendung falls nicht angegeben (export.csv.xz -> csv)
         if format is None:
-            suffix = Path(output_path).suffix.lower()
-            format_map = {
-                '.txt': 'txt',
-                '.csv': 'csv',
-                '.json': 'json'
-            }
-            format = format_map.get(suffix, 'txt')
-
-        # Rufe entsprechende Export-Methode auf
-        if format == 'txt':
-            return Exporter.export_to_txt(packages, output_path)
-        elif format == 'csv':
-            return Exporter.export_to_csv(packages, output_path)
-        elif format == 'json':
-            return Exporter.export_to_json(packages, output_path)
-        else:
+            format = detect_format(output_path)
+
+        # Writer, Log-Name und Öffner der Ausgabe pro Format
+        writers = {
+            'txt': (Exporter.write_txt, "TXT", None),
+            'csv': (Exporter.write_csv, "CSV", lambda path: Exporter._open_output(path, newline='')),
+            'json': (Exporter.write_json, "JSON", None),
+            'jsonl': (Exporter.write_jsonl, "JSONL", None),
+            'sqlite': (Exporter.write_sqlite, "SQLite", Exporter._sqlite_output),
+        }
+        if format not in writers:
             logger.error(f"Unbekanntes Export-Format: {format}")
             return False
+
+        writer, label, opener = writers[format]
+        return Exporter._export_with(
+            writer, label, packages, output_path, presorted, opener, progress, cancel_event
+        )
+
+
+class ExportReader:
+    """Liest Exporte (auch komprimiert) wieder als Package-Objekte ein"""
+
+    @staticmethod
+    def read_txt(f) -> Iterator[Package]:
+        """Liest den Text-Export (Abschnitte "=== TYP Pakete ===" mit "Name (Version)")"""
+        package_type = None
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            if line.startswith("=== ") and line.endswith(" ==="):
+                package_type = line[4:].split(" ", 1)[0].lower()
+                continue
+
+            # Letztes " (" trennt: Namen dürfen selbst " (" enthalten, Versionen nicht
+            name, separator, version = line.rpartition(" (")
+            if package_type and separator and version.endswith(")"):
+                yield Package(name=name, version=version[:-1], package_type=package_type)
+
+    @staticmethod
+    def read_csv(f) -> Iterator[Package]:
+        """Liest den CSV-Export (Kopfzeile Name, Version, Typ, Beschreibung)"""
+        reader = csv.reader(f)
+        next(reader, None)  # Header
+        for row in reader:
+            if len(row) >= 3:
+                yield Package(
+                    name=row[0],
+                    version=row[1],
+                    package_type=row[2],
+                    description=(row[3] if len(row) > 3 else "") or None
+                )
+
+    @staticmethod
+    def _from_record(record: dict) -> Package:
+        """Wandelt einen JSON-Eintrag in ein Package um"""
+        return Package(
+            name=record['name'],
+            version=record.get('version', ''),
+            package_type=record.get('type', ''),
+            description=record.get('description')
+        )
+
+    @staticmethod
+    def read_json(f) -> Iterator[Package]:
+        """Liest den JSON-Export (das Dokument wird als Ganzes geparst)"""
+        for record in json.load(f).get('packages', []):
+            yield ExportReader._from_record(record)
+
+    @staticmethod
+    def read_jsonl(f) -> Iterator[Package]:
+        """Liest den JSON-Lines-Export zeilenweise"""
+        for line in f:
+            if line.strip():
+                yield ExportReader._from_record(json.loads(line))
+
+    @staticmethod
+    def read_sqlite(input_path: str) -> Iterator[Package]:
+        """Liest den SQLite-Export (sortiert nach Typ und Name)"""
+        connection = connect_sqlite_readonly(input_path)
+        try:
+            cursor = connection.execute(
+                "SELECT p.name, p.version, t.name, p.description "
+                "FROM packages p JOIN package_types t ON t.id = p.type_id "
+                "ORDER BY t.name, p.name"
+            )
+            for name, version, package_type, description in cursor:
+                yield Package(name=name, version=version, package_type=package_type,
+                              description=description)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def read_metadata(input_path: str) -> Dict[str, str]:
+        """
+        Liest die Metadaten eines SQLite-Exports
+
+        Args:
+            input_path: Pfad zum SQLite-Export
+
+        Returns:
+            Dictionary (host, distro, distro_name, distro_version, export_date, total_packages, ...)
+        """
+        connection = connect_sqlite_readonly(input_path)
+        try:
+            return dict(connection.execute("SELECT key, value FROM metadata"))
+        finally:
+            connection.close()
+
+    @staticmethod
+    def find_package(input_paths: Iterable[str], name: str) -> List[Tuple[str, Package]]:
+        """
+        Sucht ein Paket in mehreren SQLite-Exporten ("Welche Rechner haben X?")
+
+        Pro Datei ist das eine Index-Abfrage über packages.name; Dateien, die
+        nicht gelesen werden können, werden übersprungen.
+
+        Args:
+            input_paths: Pfade zu SQLite-Exporten
+            name: Exakter Paketname
+
+        Returns:
+            Liste von (Host, Package)
+        """
+        results = []
+        for input_path in input_paths:
+            try:
+                connection = connect_sqlite_readonly(input_path)
+                try:
+                    host = connection.execute(
+                        "SELECT value FROM metadata WHERE key = 'host'"
+                    ).fetchone()
+                    rows = connection.execute(
+                        "SELECT p.name, p.version, t.name, p.description "
+                        "FROM packages p JOIN package_types t ON t.id = p.type_id "
+                        "WHERE p.name = ?",
+                        (name,)
+                    ).fetchall()
+                finally:
+                    connection.close()
+            except sqlite3.Error as e:
+                logger.warning(f"SQLite-Export {input_path} konnte nicht gelesen werden: {e}")
+                continue
+
+            host = host[0] if host else input_path
+            for pkg_name, version, package_type, description in rows:
+                results.append((host, Package(name=pkg_name, version=version,
+                                              package_type=package_type, description=description)))
+        return results
+
+    @staticmethod
+    def read(input_path: str, format: str = None) -> Iterator[Package]:
+        """
+        Liest einen Export ein
+
+        Args:
+            input_path: Pfad zur Export-Datei (Kompression aus der Endung)
+            format: Export-Format ('txt', 'csv', 'json', 'jsonl', 'sqlite') - wird aus Dateiendung ermittelt falls None
+
+        Yields:
+            Package-Objekte
+
+        Raises:
+            ValueError: Bei unbekanntem Format oder fehlender Kompression
+            OSError: Wenn die Datei nicht gelesen werden kann
+            sqlite3.Error: Wenn ein SQLite-Export nicht gelesen werden kann
+        """
+        if format is None:
+            format = detect_format(input_path)
+
+        if format == 'sqlite':
+            yield from ExportReader.read_sqlite(input_path)
+            return
+
+        readers = {
+            'txt': ExportReader.read_txt,
+            'csv': ExportReader.read_csv,
+            'json': ExportReader.read_json,
+            'jsonl': ExportReader.read_jsonl,
+        }
+        reader = readers.get(format)
+        if reader is None:
+            raise ValueError(f"Unbekanntes Export-Format: {format}")
+
+        with open_text(input_path, 'r', newline='' if format == 'csv' else None) as f:
+            yield from reader(f)
@@ -5,13 +5,102 @@ Lädt und wendet Systemapp-Filter an, um User-Apps von System-Apps zu trennen
 
 import json
 import os
+import hashlib
 import logging
-from typing import List, Set
+from typing import Dict, Iterable, List, Set
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+class KeywordMatcher:
+    """
+    Aho-Corasick-Automat für die Filter-Keywords
+
+    Prüft in einem einzigen Durchlauf über den Paketnamen, ob irgendein
+    Keyword als Teilstring darin vorkommt (statt jedes Keyword einzeln zu testen).
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        """
+        Initialisiert den KeywordMatcher
+
+        Args:
+            keywords: Keywords (bereits in Kleinbuchstaben)
+        """
+        self.build(keywords)
+
+    def build(self, keywords: Iterable[str]) -> None:
+        """
+        Baut den Automaten für die angegebenen Keywords (neu) auf
+
+        Args:
+            keywords: Keywords (bereits in Kleinbuchstaben)
+        """
+        # Trie aufbauen: goto[state][zeichen] -> state
+        goto: List[Dict[str, int]] = [{}]
+        out: List[bool] = [False]
+
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    out.append(False)
+                state = next_state
+            out[state] = True
+
+        # Fehler-Links per Breitensuche und vollständige Übergangsfunktion
+        # (delta enthält nur Übergänge ungleich dem Startzustand)
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(goto[0])
+
+        queue = list(goto[0].values())
+        for state in queue:
+            fail_state = fail[state]
+            # Treffer des längsten echten Suffixes übernehmen
+            out[state] = out[state] or out[fail_state]
+
+            transitions = dict(delta[fail_state])
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail_state].get(ch, 0)
+                transitions[ch] = child
+                queue.append(child)
+            delta[state] = transitions
+
+        self._delta = delta
+        self._out = out
+        # Ein leeres Keyword passt auf jeden Namen
+        self._match_all = out[0]
+
+    def matches(self, text: str) -> bool:
+        """
+        Prüft, ob ein Keyword im Text vorkommt
+
+        Args:
+            text: Zu prüfender Text (in Kleinbuchstaben)
+
+        Returns:
+            True wenn mindestens ein Keyword enthalten ist
+        """
+        if self._match_all:
+            return True
+
+        delta = self._delta
+        out = self._out
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                return True
+
+        return False
+
+
 class FilterManager:
     """Verwaltet Filter für System-Apps"""
 
@@ -24,6 +113,7 @@ class FilterManager:
         """
         self.filter_dir = Path(filter_dir)
         self.system_keywords: Set[str] = set()
+        self._matcher = KeywordMatcher()
         self.user_filters_path = Path.home() / ".config" / "myapps" / "user-filters.json"
 
     def load_filters(self, filter_files: List[str]) -> None:
@@ -54,6 +144,9 @@ class FilterManager:
         # Lade User-Filter
         self._load_user_filters()
 
+        # Automat für schnelle Klassifizierung aufbauen
+        self._matcher.build(self.system_keywords)
+
         logger.info(f"Insgesamt {len(self.system_keywords)} Filter-Keywords geladen")
 
     def _load_user_filters(self) -> None:
@@ -109,6 +202,7 @@ class FilterManager:
 
                 # Füge auch zum aktuellen Filter-Set hinzu
                 self.system_keywords.add(package_lower)
+                self._matcher.build(self.system_keywords)
 
                 logger.info(f"Paket '{package_name}' zur User-Filter-Liste hinzugefügt")
                 return True
@@ -129,14 +223,31 @@ class FilterManager:
         Returns:
             True wenn es eine User-App ist, False wenn es gefiltert werden soll
         """
-        package_lower = package_name.lower()
-
         # Prüfe ob ein Filter-Keyword im Paketnamen vorkommt
-        for keyword in self.system_keywords:
-            if keyword in package_lower:
-                return False
+        return not self._matcher.matches(package_name.lower())
+
+    def classify(self, package_names: Iterable[str]) -> List[bool]:
+        """
+        Klassifiziert viele Paketnamen auf einmal
+
+        Args:
+            package_names: Paketnamen
 
-        return True
+        Returns:
+            Liste mit True (User-App) bzw. False (System-App) pro Name
+        """
+        matches = self._matcher.matches
+        verdicts: Dict[str, bool] = {}
+        result = []
+
+        for name in package_names:
+            verdict = verdicts.get(name)
+            if verdict is None:
+                verdict = not matches(name.lower())
+                verdicts[name] = verdict
+            result.append(verdict)
+
+        return result
 
     def filter_packages(self, packages: List) -> List:
         """
@@ -148,13 +259,30 @@ class FilterManager:
         Returns:
             Gefilterte Liste mit nur User-Apps
         """
-        user_apps = [pkg for pkg in packages if self.is_user_app(pkg.name)]
+        verdicts = self.classify(pkg.name for pkg in packages)
+        user_apps = [pkg for pkg, is_user_app in zip(packages, verdicts) if is_user_app]
 
         filtered_count = len(packages) - len(user_apps)
         logger.info(f"{filtered_count} System-Pakete gefiltert, {len(user_apps)} User-Apps übrig")
 
         return user_apps
 
+    def get_signature(self) -> str:
+        """
+        Gibt eine Signatur der aktuell geladenen Filter-Keywords zurück
+
+        Ändert sich, sobald ein Keyword hinzukommt oder wegfällt
+        (z.B. für den Inventar-Cache).
+
+        Returns:
+            Hex-Digest über alle Keywords
+        """
+        digest = hashlib.sha1()
+        for keyword in sorted(self.system_keywords):
+            digest.update(keyword.encode('utf-8'))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     def get_stats(self) -> dict:
         """
         Gibt Statistiken über geladene Filter zurück
@@ -60,7 +60,7 @@ except ImportError:
 
     TTKBOOTSTRAP_AVAILABLE = False
 
-from .package_manager import Package, PackageManagerFactory
+from .package_manager import Package, PackageManagerFactory, package_sort_key
 from .filters import FilterManager
 from .icons import IconManager
 from .export import Exporter
@@ -459,6 +459,9 @@ class MyAppsGUI:
                 self._set_status(_("Filtere System-Apps..."))
                 self.filtered_packages = self.filter_manager.filter_packages(self.packages)
 
+                # Einmal sortieren, Seiten sind danach nur noch Slices
+                self.filtered_packages.sort(key=package_sort_key)
+
                 # Icon-Preloading deaktiviert (verursacht X-Server Memory-Fehler bei vielen Paketen)
                 # Icons werden lazy on-demand geladen via get_icon() mit Cache
                 # self.icon_manager.preload_icons(self.filtered_packages)
@@ -497,9 +500,8 @@ class MyAppsGUI:
         start_idx = self.current_page * self.items_per_page
         end_idx = min(start_idx + self.items_per_page, len(self.filtered_packages))
 
-        # Sortiere und zeige nur aktuelle Seite
-        sorted_packages = sorted(self.filtered_packages, key=lambda p: (p.package_type, p.name))
-        page_packages = sorted_packages[start_idx:end_idx]
+        # Zeige nur aktuelle Seite (filtered_packages ist bereits sortiert)
+        page_packages = self.filtered_packages[start_idx:end_idx]
 
         for pkg in page_packages:
             self.tree.insert(
@@ -519,9 +521,8 @@ class MyAppsGUI:
         start_idx = self.current_page * self.items_per_page
         end_idx = min(start_idx + self.items_per_page, len(self.filtered_packages))
 
-        # Hole nur Pakete für aktuelle Seite
-        sorted_packages = sorted(self.filtered_packages, key=lambda p: (p.package_type, p.name))
-        page_packages = sorted_packages[start_idx:end_idx]
+        # Hole nur Pakete für aktuelle Seite (filtered_packages ist bereits sortiert)
+        page_packages = self.filtered_packages[start_idx:end_idx]
 
         # Gruppiere nach Typ (nur aktuelle Seite)
         grouped = {}
@@ -532,11 +533,11 @@ class MyAppsGUI:
 
         # Erstelle Queue mit allen zu erstellenden Items
         item_queue = []
-        for pkg_type, pkgs in sorted(grouped.items()):
+        for pkg_type, pkgs in grouped.items():
             # Header als erstes Item in der Gruppe
             item_queue.append(('header', pkg_type, len(pkgs)))
-            # Dann alle Pakete
-            for pkg in sorted(pkgs, key=lambda p: p.name):
+            # Dann alle Pakete (bereits nach Name sortiert)
+            for pkg in pkgs:
                 item_queue.append(('package', pkg))
 
         # Starte Batch-Rendering (max. 100 items pro Seite, kein X-Server Overload mehr)
@@ -693,6 +694,7 @@ class MyAppsGUI:
         self.current_page = 0
         if self.icon_manager:
             self.icon_manager.clear_cache()
+            self.icon_manager.refresh_index()
         self._load_packages_async()
 
     def _show_export_dialog(self) -> None:
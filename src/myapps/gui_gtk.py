@@ -5,8 +5,11 @@ Native Linux Desktop Integration mit Virtual Scrolling
 
 import logging
 import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # GTK4 + Libadwaita
 import gi
@@ -15,9 +18,14 @@ gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, Gio, GLib, GdkPixbuf, GObject
 
 # MyApps Modules (bleiben gleich!)
-from .package_manager import Package, PackageManagerFactory
+from .package_manager import PackageManagerFactory
+from .inventory import PackageTable
 from .filters import FilterManager
-from .export import Exporter
+from .export import Exporter, COMPRESSIONS, FORMAT_SUFFIXES
+from .cache import InventoryCache
+from .descriptions import LocalizedDescriptionIndex
+from .search import SearchIndex
+from .snapshot import diff_snapshots, load_snapshot
 from .distro_detect import get_distro_info
 from .i18n import _
 from .icons import IconManagerGTK
@@ -134,27 +142,107 @@ def get_whats_new(version: str) -> List[str]:
 
 
 class PackageItem(GObject.Object):
-    """GObject-Wrapper für Package-Objekte (für Gio.ListStore)"""
+    """GObject-Wrapper für eine Zeile der PackageTable (wird von PackageListModel erzeugt)"""
 
-    def __init__(self, package: Package):
+    def __init__(self, table: PackageTable, row: int, description: Optional[str] = None):
+        """
+        Args:
+            table: Inventar-Tabelle
+            row: Zeilen-ID des Pakets
+            description: Anzuzeigende Beschreibung (z.B. lokalisiert, Standard: aus der Tabelle)
+        """
         super().__init__()
-        self.package = package
+        self.table = table
+        self.row = row
+        self.name = table.names[row]
+        self.version = table.versions[row]
+        self.package_type = table.package_type(row)
+        self.description = description or table.descriptions[row] or ""
+
+        # Anzeige-Texte einmal pro Paket statt bei jedem Bind
+        self.type_label = self.package_type.upper()
+        self.info_text = f"{self.version}  •  {self.type_label}"
+        if self.description:
+            # Beschreibung vorhanden: Zeige nur diese (Info ist bereits sichtbar in der Liste)
+            self.tooltip = self.description
+        else:
+            # Keine Beschreibung: Zeige zumindest Paketname als Fallback
+            self.tooltip = f"{self.name}\n(Keine Beschreibung verfügbar)"
+
+
+class PackageListModel(GObject.Object, Gio.ListModel):
+    """
+    Gio.ListModel über Zeilen-IDs der PackageTable
+
+    PackageItems werden erst erzeugt, wenn GTK eine Position abfragt, und
+    bis zum nächsten Neufüllen wiederverwendet. Jede Änderung löst genau
+    ein items-changed aus.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.table = PackageTable()
+        self.rows = array('I')
+        self.source = None  # Zeilen-IDs, aus denen das Model gefüllt wurde (Endlos-Modus)
+        self._descriptions: Dict[int, str] = {}  # Zeilen-ID -> lokalisierte Beschreibung
+        self._items: Dict[int, PackageItem] = {}
+
+    def do_get_item_type(self):
+        return PackageItem.__gtype__
+
+    def do_get_n_items(self):
+        return len(self.rows)
+
+    def do_get_item(self, position):
+        if position >= len(self.rows):
+            return None
+
+        row = self.rows[position]
+        item = self._items.get(row)
+        if item is None:
+            item = self._items[row] = PackageItem(self.table, row, self._descriptions.get(row))
+        return item
+
+    def set_rows(self, table: PackageTable, rows, descriptions: Optional[Dict[int, str]] = None,
+                 source=None):
+        """
+        Ersetzt den Inhalt des Models
+
+        Args:
+            table: Inventar-Tabelle
+            rows: Anzuzeigende Zeilen-IDs
+            descriptions: Bereits bekannte lokalisierte Beschreibungen pro Zeilen-ID
+            source: Quelle der Zeilen (zum Erkennen unveränderter Inhalte)
+        """
+        removed = len(self.rows)
+        self.table = table
+        self.rows = rows
+        self.source = source
+        self._descriptions = descriptions or {}
+        self._items = {}
 
-    @property
-    def name(self) -> str:
-        return self.package.name
+        if removed or rows:
+            self.items_changed(0, removed, len(rows))
+
+    def set_descriptions(self, descriptions: Dict[int, str]):
+        """
+        Übernimmt lokalisierte Beschreibungen für einzelne Zeilen
 
-    @property
-    def version(self) -> str:
-        return self.package.version
+        Args:
+            descriptions: Zeilen-ID -> lokalisierte Beschreibung
+        """
+        positions = [position for position, row in enumerate(self.rows) if row in descriptions]
+        if not positions:
+            return
 
-    @property
-    def package_type(self) -> str:
-        return self.package.package_type
+        self._descriptions.update(descriptions)
+        for row in descriptions:
+            self._items.pop(row, None)
 
-    @property
-    def description(self) -> str:
-        return self.package.description or ""
+        # Ein items-changed über den gesamten betroffenen Bereich
+        first = positions[0]
+        count = positions[-1] - first + 1
+        self.items_changed(first, count, count)
 
 
 class MyAppsGUI(Adw.Application):
@@ -173,17 +261,22 @@ class MyAppsGUI(Adw.Application):
         )
 
         self.base_dir = Path(base_dir)
-        self.packages: List[Package] = []
-        self.filtered_packages: List[Package] = []
-        self.search_filtered_packages: List[Package] = []  # Nach Suche gefiltert
+        self.table = PackageTable()  # Alle Pakete (spaltenorientiert)
+        self.filtered_rows = array('I')  # Zeilen-IDs der User-Apps, sortiert
+        self.search_rows = array('I')  # Nach Suche gefiltert (Zeilen-IDs)
+        self.search_index: Optional[SearchIndex] = None  # Trigramm-Index über filtered_rows
 
         # Pagination (gleiche Logik wie tkinter)
         self.current_page = 0
         self.items_per_page = 100
         self.total_pages = 0
 
+        # Endlos-Modus: Alle Apps in einem Model, ohne Seiten
+        self.continuous_mode = False
+
         # Suche
         self.search_query = ""
+        self.fuzzy_search = True  # Tippfehler-tolerante Suche (benötigt search_index)
 
         # Manager initialisieren (UNVERÄNDERT!)
         self.distro_info = get_distro_info()
@@ -197,6 +290,13 @@ class MyAppsGUI(Adw.Application):
         # Icon Manager initialisieren
         self.icon_manager = IconManagerGTK(icon_size=32)
 
+        # Inventar-Cache (Pakete + Filter-Ergebnisse pro Paketmanager)
+        self.inventory_cache = InventoryCache()
+
+        # Lokalisierte Beschreibungen (aus apt-Übersetzungsdateien)
+        self.description_index = LocalizedDescriptionIndex()
+        self.description_index_ready = threading.Event()
+
         logger.info(f"MyApps GTK4 {VERSION} initialisiert")
 
     def do_activate(self):
@@ -208,42 +308,192 @@ class MyAppsGUI(Adw.Application):
         # Lade Pakete asynchron
         GLib.idle_add(self._start_loading_packages)
 
-    def _start_loading_packages(self):
-        """Startet asynchrones Laden der Pakete"""
-        thread = threading.Thread(target=self._load_packages_worker, daemon=True)
+    def _start_loading_packages(self, force: bool = False):
+        """
+        Startet asynchrones Laden der Pakete
+
+        Args:
+            force: Wenn True, wird der Inventar-Cache ignoriert
+        """
+        thread = threading.Thread(target=self._load_packages_worker, args=(force,), daemon=True)
         thread.start()
         return GLib.SOURCE_REMOVE  # Nur einmal ausführen
 
-    def _load_packages_worker(self):
-        """Worker-Thread: Lädt Pakete im Hintergrund"""
+    def _load_packages_worker(self, force: bool = False):
+        """
+        Worker-Thread: Lädt Pakete im Hintergrund
+
+        Paketmanager, deren Datenbank sich seit dem letzten Start nicht geändert
+        hat, werden aus dem Inventar-Cache bedient. Die gecachte Liste wird sofort
+        angezeigt, nur veraltete Paketmanager werden danach neu abgefragt.
+
+        Args:
+            force: Wenn True, werden alle Paketmanager neu abgefragt
+        """
         try:
             logger.info("Lade Pakete...")
 
-            # Package Manager (UNVERÄNDERT!)
+            # Icon-Index im Hintergrund aufbauen bzw. bei Änderungen erneuern
+            self.icon_manager.refresh_index()
+            logger.info(f"Icon-Cache: {self.icon_manager.get_cache_stats()}")
+
             package_managers = self.distro_info.package_managers
-            self.packages = PackageManagerFactory.get_all_packages(package_managers)
-            logger.info(f"{len(self.packages)} Pakete geladen")
+            filter_signature = self.filter_manager.get_signature()
+
+            # Cache prüfen
+            results = {}
+            stale = []
+            cache_changed = False
+            for pm_name in package_managers:
+                cached = None if force else self.inventory_cache.lookup(pm_name, filter_signature)
+                if cached is None:
+                    stale.append(pm_name)
+                    continue
 
-            # Filtern (UNVERÄNDERT!)
-            self.filtered_packages = self.filter_manager.filter_packages(self.packages)
-            logger.info(f"{len(self.filtered_packages)} Apps nach Filterung")
+                user_apps = cached.user_apps
+                if user_apps is None:
+                    # Filter haben sich geändert: Nur neu filtern, nicht neu abfragen
+                    user_apps = self.filter_manager.filter_packages(cached.packages)
+                    self.inventory_cache.store(
+                        pm_name, self.inventory_cache.fingerprint(pm_name),
+                        cached.packages, user_apps, filter_signature
+                    )
+                    cache_changed = True
+                results[pm_name] = (cached.packages, user_apps)
+
+            if results:
+                logger.info(f"Aus Inventar-Cache: {', '.join(results)}")
+
+                # Gecachte Liste sofort anzeigen, falls noch etwas nachgeladen wird
+                if stale:
+                    self._publish_results(package_managers, results)
+                    GLib.idle_add(self.win._on_packages_loaded, self.filtered_rows)
+
+            # Nur veraltete Paketmanager neu abfragen
+            if stale:
+                logger.info(f"Frage Paketmanager ab: {', '.join(stale)}")
+                fingerprints = {pm_name: self.inventory_cache.fingerprint(pm_name) for pm_name in stale}
+                fresh = PackageManagerFactory.get_packages_by_manager(stale)
+
+                for pm_name, packages in fresh.items():
+                    if packages is None:
+                        # Abfrage fehlgeschlagen: Nicht als leeres Inventar cachen
+                        logger.warning(f"{pm_name} nicht abgefragt, wird beim nächsten Start erneut versucht")
+                        continue
+
+                    user_apps = self.filter_manager.filter_packages(packages)
+                    self.inventory_cache.store(
+                        pm_name, fingerprints[pm_name], packages, user_apps, filter_signature
+                    )
+                    results[pm_name] = (packages, user_apps)
+                    cache_changed = True
+
+            if cache_changed:
+                self.inventory_cache.save()
+            else:
+                self.inventory_cache.release()  # Nur die PackageTable behält das Inventar
+
+            self._publish_results(package_managers, results)
+            logger.info(f"{len(self.table)} Pakete geladen")
+            logger.info(f"{len(self.filtered_rows)} Apps nach Filterung")
 
             # Update GUI im Main Thread
-            GLib.idle_add(self.win._on_packages_loaded, self.filtered_packages)
+            GLib.idle_add(self.win._on_packages_loaded, self.filtered_rows)
+
+            # Such-Index im Hintergrund aufbauen (bis dahin wird linear gesucht)
+            threading.Thread(
+                target=self._build_search_index_worker, args=(self.table, self.filtered_rows), daemon=True
+            ).start()
+
+            # Lokalisierte Beschreibungen für DEB-Pakete im Hintergrund laden
+            if "dpkg" in package_managers:
+                threading.Thread(target=self._load_description_index_worker, daemon=True).start()
+            else:
+                self.description_index_ready.set()
 
         except Exception as e:
             logger.error(f"Fehler beim Laden der Pakete: {e}")
             GLib.idle_add(self.win._on_loading_error, str(e))
 
+    def _build_search_index_worker(self, table: PackageTable, rows: array):
+        """Worker-Thread: Baut den Trigramm-Such-Index für die geladenen Apps auf"""
+        try:
+            index = SearchIndex(table, rows)
+            # Nur übernehmen, wenn inzwischen nicht neu geladen wurde
+            if rows is self.filtered_rows:
+                self.search_index = index
+        except Exception as e:
+            logger.error(f"Fehler beim Aufbau des Such-Index: {e}")
+
+    def _load_description_index_worker(self):
+        """Worker-Thread: Lädt den Beschreibungs-Index (ein Durchlauf, kein apt-cache)"""
+        try:
+            self.description_index.load()
+        except Exception as e:
+            logger.error(f"Fehler beim Laden der lokalisierten Beschreibungen: {e}")
+        finally:
+            self.description_index_ready.set()
+
+    def _publish_results(self, package_managers: List[str], results: dict):
+        """
+        Baut table/filtered_rows aus den Ergebnissen pro Paketmanager auf
+
+        Args:
+            package_managers: Paketmanager in Anzeigereihenfolge
+            results: Dictionary Paketmanager-Name -> (Pakete, User-Apps)
+        """
+        table = PackageTable()
+        user_rows = []
+        for pm_name in package_managers:
+            if pm_name in results:
+                packages, user_apps = results[pm_name]
+                rows = table.extend(packages)
+                row_of = {id(pkg): row for pkg, row in zip(packages, rows)}
+                user_rows.extend(row_of[id(pkg)] for pkg in user_apps)
+
+        # Einmal nach dem Laden sortieren: Suche erhält die Reihenfolge,
+        # Seiten sind danach nur noch Slices
+        start = time.perf_counter()
+        filtered_rows = table.sorted_rows(user_rows)
+        logger.info(f"{len(filtered_rows)} Apps sortiert in {time.perf_counter() - start:.3f}s")
+
+        self.table = table
+        self.filtered_rows = filtered_rows
+
 
 class MyAppsWindow(Adw.ApplicationWindow):
     """GTK4 Hauptfenster"""
 
+    # Tipp-Pause, nach der die Suche startet (ms)
+    SEARCH_DEBOUNCE_MS = 150
+
+    # Maximal angezeigte Einträge pro Abschnitt im Snapshot-Vergleich
+    DIFF_SECTION_LIMIT = 500
+
     def __init__(self, application, gui):
         super().__init__(application=application)
 
         self.gui = gui  # Referenz zur App
 
+        # Worker für Icon-Laden (hält den Main-Thread beim Scrollen frei)
+        self._icon_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="myapps-icons")
+
+        # Lokalisierte Beschreibungen: asynchron pro Seite, Ergebnisse seitenübergreifend gecacht
+        self._description_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="myapps-descriptions")
+        self._description_generation = 0
+        self._description_future = None
+        self._localized_cache = {}  # Paketname -> Beschreibung (oder None)
+
+        # Suche: im Worker, Tastenanschläge werden gebündelt, veraltete Ergebnisse verworfen
+        self._search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="myapps-search")
+        self._search_generation = 0
+        self._search_future = None
+        self._search_timeout_id = None
+
+        # Export: läuft im Hintergrund, abbrechbar über dieses Event
+        self._export_cancel: Optional[threading.Event] = None
+        self.connect("close-request", self._on_close_request)
+
         # Fenster-Einstellungen
         self.set_title(f"MyApps v{VERSION}")
         self.set_default_size(1200, 850)
@@ -251,6 +501,9 @@ class MyAppsWindow(Adw.ApplicationWindow):
         # CSS Styling laden
         self._load_css()
 
+        # Kontextmenü-Actions (einmalig, nicht pro Rechtsklick)
+        self._create_row_actions()
+
         # UI aufbauen
         self._build_ui()
 
@@ -290,6 +543,14 @@ class MyAppsWindow(Adw.ApplicationWindow):
         self.pagination_bar = self._create_pagination_bar()
         main_box.append(self.pagination_bar)
 
+        # Suche und Sortierung der Views (im Endlos-Modus per Gtk.FilterListModel/SortListModel)
+        self.search_filter = Gtk.CustomFilter.new(self._search_filter_func)
+        self.sorter = Gtk.CustomSorter.new(self._compare_items)
+        # Rang pro Zeilen-ID (0 = kein Treffer, 1 = Name, 2 = Beschreibung, 3+ = Tippfehler), None ohne Suche
+        self._search_ranks: Optional[bytearray] = None
+        self._last_search = ("", None)  # (Suchanfrage, durchsuchte Zeilen-IDs)
+        self._search_tolerance = 0  # Tippfehler-Toleranz der übernommenen Suche (0 = exakt)
+
         # Content Area (Stack für Views)
         self.stack = Gtk.Stack()
         self.stack.set_transition_type(Gtk.StackTransitionType.SLIDE_LEFT_RIGHT)
@@ -322,10 +583,27 @@ class MyAppsWindow(Adw.ApplicationWindow):
 
         main_box.append(self.stack)
 
-        # Status Bar
+        # Status Bar (mit Fortschritt und Abbrechen-Button während eines Exports)
+        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+
         self.statusbar = Gtk.Statusbar()
+        self.statusbar.set_hexpand(True)
         self.status_context = self.statusbar.get_context_id("main")
-        main_box.append(self.statusbar)
+        status_box.append(self.statusbar)
+
+        self.export_progress = Gtk.ProgressBar()
+        self.export_progress.set_valign(Gtk.Align.CENTER)
+        self.export_progress.set_size_request(200, -1)
+        self.export_progress.set_visible(False)
+        status_box.append(self.export_progress)
+
+        self.export_cancel_btn = Gtk.Button(label=_("Abbrechen"))
+        self.export_cancel_btn.set_margin_end(6)
+        self.export_cancel_btn.connect("clicked", self._on_export_cancel_clicked)
+        self.export_cancel_btn.set_visible(False)
+        status_box.append(self.export_cancel_btn)
+
+        main_box.append(status_box)
 
         # Set Content
         self.set_content(main_box)
@@ -340,10 +618,10 @@ class MyAppsWindow(Adw.ApplicationWindow):
         refresh_btn.connect("clicked", self._on_refresh_clicked)
         header.pack_start(refresh_btn)
 
-        export_btn = Gtk.Button(label=_("Exportieren"))
-        export_btn.set_icon_name("document-save-symbolic")
-        export_btn.connect("clicked", self._on_export_clicked)
-        header.pack_start(export_btn)
+        self.export_btn = Gtk.Button(label=_("Exportieren"))
+        self.export_btn.set_icon_name("document-save-symbolic")
+        self.export_btn.connect("clicked", self._on_export_clicked)
+        header.pack_start(self.export_btn)
 
         # Search Entry (zentral im Title-Bereich)
         self.search_entry = Gtk.SearchEntry(placeholder_text=_("Apps durchsuchen..."))
@@ -363,6 +641,12 @@ class MyAppsWindow(Adw.ApplicationWindow):
         """Erstellt das Hauptmenü"""
         menu = Gio.Menu()
 
+        # Unscharfe Suche
+        menu.append(_("Tippfehler-tolerante Suche"), "app.fuzzy-search")
+
+        # Snapshot-Vergleich
+        menu.append(_("Mit Snapshot vergleichen..."), "app.compare-snapshot")
+
         # About
         menu.append(_("Über MyApps"), "app.about")
 
@@ -370,6 +654,16 @@ class MyAppsWindow(Adw.ApplicationWindow):
         menu.append(_("Beenden"), "app.quit")
 
         # Actions registrieren
+        fuzzy_action = Gio.SimpleAction.new_stateful(
+            "fuzzy-search", None, GLib.Variant.new_boolean(self.gui.fuzzy_search)
+        )
+        fuzzy_action.connect("change-state", self._on_fuzzy_search_toggled)
+        self.gui.add_action(fuzzy_action)
+
+        compare_action = Gio.SimpleAction.new("compare-snapshot", None)
+        compare_action.connect("activate", self._on_compare_snapshot)
+        self.gui.add_action(compare_action)
+
         about_action = Gio.SimpleAction.new("about", None)
         about_action.connect("activate", self._on_about)
         self.gui.add_action(about_action)
@@ -389,10 +683,17 @@ class MyAppsWindow(Adw.ApplicationWindow):
         box.set_margin_bottom(6)
 
         # Info Label (links)
-        info_label = Gtk.Label(label="ℹ️  " + _("Zeigt 100 Apps pro Seite"))
-        info_label.add_css_class("dim-label")
-        info_label.set_halign(Gtk.Align.START)
-        box.append(info_label)
+        self.pagination_info_label = Gtk.Label(label="ℹ️  " + _("Zeigt 100 Apps pro Seite"))
+        self.pagination_info_label.add_css_class("dim-label")
+        self.pagination_info_label.set_halign(Gtk.Align.START)
+        box.append(self.pagination_info_label)
+
+        # Umschalter: Seiten <-> alle Apps in einer Liste
+        continuous_btn = Gtk.ToggleButton(label=_("Alle anzeigen"))
+        continuous_btn.set_tooltip_text(_("Alle Apps ohne Seiten in einer Liste anzeigen"))
+        continuous_btn.set_active(self.gui.continuous_mode)
+        continuous_btn.connect("toggled", self._on_continuous_toggled)
+        box.append(continuous_btn)
 
         # Spacer
         spacer = Gtk.Box()
@@ -402,6 +703,7 @@ class MyAppsWindow(Adw.ApplicationWindow):
         # Navigation (rechts)
         nav_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         nav_box.set_halign(Gtk.Align.END)
+        self.pagination_nav_box = nav_box
 
         self.prev_btn = Gtk.Button(label="◀ " + _("Zurück"))
         self.prev_btn.set_sensitive(False)
@@ -425,16 +727,18 @@ class MyAppsWindow(Adw.ApplicationWindow):
 
     def _create_list_view(self):
         """Erstellt die ListView mit Virtual Scrolling"""
-        # Model: Gio.ListStore für PackageItem-Objekte
-        self.list_store = Gio.ListStore.new(PackageItem)
+        # Model: Erzeugt PackageItem-Objekte erst bei Bedarf
+        self.list_model = PackageListModel()
 
-        # Selection Model
-        selection = Gtk.NoSelection.new(self.list_store)
+        # Selection Model (über Such-Filter und Sortierung)
+        selection = Gtk.NoSelection.new(self._create_view_model(self.list_model))
 
         # Factory für Item-Rendering
         factory = Gtk.SignalListItemFactory()
         factory.connect("setup", self._on_list_setup)
         factory.connect("bind", self._on_list_bind)
+        factory.connect("unbind", self._on_list_unbind)
+        factory.connect("teardown", self._on_list_teardown)
 
         # ListView
         list_view = Gtk.ListView.new(selection, factory)
@@ -481,16 +785,24 @@ class MyAppsWindow(Adw.ApplicationWindow):
 
         box.append(text_box)
 
-        # Context Menu Setup
+        # Context Menu Setup: Handler und Popover einmal pro Zeile, nicht pro Bind
         gesture = Gtk.GestureClick.new()
         gesture.set_button(3)  # Rechtsklick
+        gesture.connect("pressed", self._on_row_right_click, box)
         box.add_controller(gesture)
 
+        popover = Gtk.PopoverMenu()
+        popover.set_parent(box)
+
         # Store widgets für später
         box.icon = icon
         box.name_label = name_label
         box.info_label = info_label
         box.gesture = gesture
+        box.popover = popover
+        box.item = None  # Gebundenes PackageItem
+        box.icon_key = None  # (Name, Typ) des gebundenen Pakets
+        box.icon_future = None  # Laufender Icon-Ladeauftrag
 
         list_item.set_child(box)
 
@@ -498,37 +810,80 @@ class MyAppsWindow(Adw.ApplicationWindow):
         """Bind: Verknüpft Package-Daten mit Widget"""
         pkg = list_item.get_item()  # PackageItem-Objekt
         box = list_item.get_child()
+        box.item = pkg
+
+        # Icon: Aus Cache oder Platzhalter + Laden im Hintergrund
+        icon_key = (pkg.name, pkg.package_type)
+        box.icon_key = icon_key
+        pixbuf = self.gui.icon_manager.get_cached_icon(*icon_key)
+        if pixbuf is not None:
+            box.icon.set_from_pixbuf(pixbuf)
+        else:
+            box.icon.set_from_pixbuf(self.gui.icon_manager.get_placeholder_icon())
+            box.icon_future = self._icon_executor.submit(self._load_icon_worker, box, icon_key)
 
-        # Icon laden
-        pixbuf = self.gui.icon_manager.get_icon(pkg.name, pkg.package_type)
-        box.icon.set_from_pixbuf(pixbuf)
-
-        # Set Data
+        # Set Data (Anzeige-Texte sind im PackageItem vorberechnet)
         box.name_label.set_text(pkg.name)
-        box.info_label.set_text(f"{pkg.version}  •  {pkg.package_type.upper()}")
+        box.info_label.set_text(pkg.info_text)
 
         # Tooltip: Zeigt Paketbeschreibung (Funktion des Pakets)
-        if pkg.description:
-            # Beschreibung vorhanden: Zeige nur diese (Info ist bereits sichtbar in der Liste)
-            tooltip = pkg.description
-        else:
-            # Keine Beschreibung: Zeige zumindest Paketname als Fallback
-            tooltip = f"{pkg.name}\n(Keine Beschreibung verfügbar)"
-
         box.set_has_tooltip(True)
-        box.set_tooltip_text(tooltip)
+        box.set_tooltip_text(pkg.tooltip)
 
-        # Context Menu Handler
-        def on_right_click(gesture, n_press, x, y):
-            self._show_context_menu(box, pkg, x, y)
+    def _on_list_unbind(self, factory, list_item):
+        """Unbind: Löst das Item von der Zeile und bricht noch nicht gestartetes Icon-Laden ab"""
+        box = list_item.get_child()
+        if box.icon_future is not None:
+            box.icon_future.cancel()
+            box.icon_future = None
+        box.icon_key = None
+        box.item = None
+        box.popover.popdown()
+
+    def _on_list_teardown(self, factory, list_item):
+        """Teardown: Gibt das Popover der Zeile frei, bevor das Widget zerstört wird"""
+        box = list_item.get_child()
+        if box is not None and box.popover is not None:
+            box.popover.unparent()
+            box.popover = None
 
-        box.gesture.connect("pressed", on_right_click)
+    def _on_row_right_click(self, gesture, n_press, x, y, box):
+        """Rechtsklick auf eine Zeile: Kontextmenü für das aktuell gebundene Paket"""
+        if box.item is not None:
+            self._show_context_menu(box, box.item, x, y)
+
+    def _load_icon_worker(self, box, icon_key):
+        """Worker-Thread: Lädt ein Icon und übergibt es an den Main-Thread"""
+        try:
+            pixbuf = self.gui.icon_manager.get_icon(*icon_key)
+        except Exception as e:
+            logger.debug(f"Fehler beim Laden des Icons für {icon_key[0]}: {e}")
+            return
+        GLib.idle_add(self._on_icon_loaded, box, icon_key, pixbuf)
+
+    def _on_icon_loaded(self, box, icon_key, pixbuf):
+        """Setzt ein geladenes Icon, falls die Zeile noch dasselbe Paket zeigt"""
+        if box.icon_key == icon_key:
+            box.icon.set_from_pixbuf(pixbuf)
+            box.icon_future = None
+        return GLib.SOURCE_REMOVE
+
+    def _on_close_request(self, window):
+        """Beendet Hintergrund-Worker beim Schließen des Fensters"""
+        self._icon_executor.shutdown(wait=False, cancel_futures=True)
+        self._description_executor.shutdown(wait=False, cancel_futures=True)
+        self._search_generation += 1  # Laufende Suche abbrechen
+        self._search_executor.shutdown(wait=False, cancel_futures=True)
+        if self._export_cancel is not None:
+            self._export_cancel.set()  # Temporäre Exportdatei wird verworfen
+        self.gui.description_index_ready.set()  # Wartende Worker freigeben
+        return False  # Schließen fortsetzen
 
     def _create_table_view(self):
         """Erstellt die ColumnView (Table)"""
         # Model
-        self.table_store = Gio.ListStore.new(PackageItem)
-        selection = Gtk.NoSelection.new(self.table_store)
+        self.table_model = PackageListModel()
+        selection = Gtk.NoSelection.new(self._create_view_model(self.table_model))
 
         # ColumnView
         column_view = Gtk.ColumnView.new(selection)
@@ -547,6 +902,43 @@ class MyAppsWindow(Adw.ApplicationWindow):
 
         return scrolled
 
+    def _create_view_model(self, store):
+        """
+        Legt Such-Filter und Sortierung über ein PackageListModel
+
+        Args:
+            store: PackageListModel
+
+        Returns:
+            Gtk.SortListModel für das Selection Model
+        """
+        filter_model = Gtk.FilterListModel.new(store, self.search_filter)
+        filter_model.set_incremental(True)
+
+        sort_model = Gtk.SortListModel.new(filter_model, self.sorter)
+        sort_model.set_incremental(True)
+        return sort_model
+
+    def _search_filter_func(self, item):
+        """Gtk.CustomFilter: Prüft ob ein Item zu den aktuellen Suchtreffern gehört"""
+        if self._search_ranks is None:
+            return True
+        return self._search_ranks[item.row] != 0
+
+    def _compare_items(self, item_a, item_b, *args):
+        """Gtk.CustomSorter: Sortiert nach Rang (bei Suche), dann Typ und Name (wie die Seitenansicht)"""
+        key_a = (item_a.package_type, item_a.name)
+        key_b = (item_b.package_type, item_b.name)
+        ranks = self._search_ranks
+        if ranks is not None:
+            key_a = (ranks[item_a.row],) + key_a
+            key_b = (ranks[item_b.row],) + key_b
+        if key_a < key_b:
+            return Gtk.Ordering.SMALLER
+        if key_a > key_b:
+            return Gtk.Ordering.LARGER
+        return Gtk.Ordering.EQUAL
+
     def _add_column(self, column_view, title, attr_name, expand=False):
         """Fügt eine Spalte zur ColumnView hinzu"""
         factory = Gtk.SignalListItemFactory()
@@ -562,10 +954,10 @@ class MyAppsWindow(Adw.ApplicationWindow):
         def on_bind(factory, list_item):
             pkg = list_item.get_item()
             label = list_item.get_child()
-            value = getattr(pkg, attr_name, "")
-
             if attr_name == "package_type":
-                value = value.upper() if value else ""
+                value = pkg.type_label
+            else:
+                value = getattr(pkg, attr_name, "")
 
             label.set_text(str(value or ""))
 
@@ -583,33 +975,39 @@ class MyAppsWindow(Adw.ApplicationWindow):
 
         column_view.append_column(column)
 
+    def _create_row_actions(self):
+        """Registriert die Kontextmenü-Actions einmalig (Paketname als Parameter)"""
+        mark_action = Gio.SimpleAction.new("mark-system", GLib.VariantType.new("s"))
+        mark_action.connect("activate", lambda action, param: self._mark_as_system(param.get_string()))
+        self.add_action(mark_action)
+
+        copy_action = Gio.SimpleAction.new("copy-name", GLib.VariantType.new("s"))
+        copy_action.connect("activate", lambda action, param: self._copy_to_clipboard(param.get_string()))
+        self.add_action(copy_action)
+
     def _show_context_menu(self, widget, pkg, x, y):
-        """Zeigt Kontextmenü für Package"""
+        """Zeigt Kontextmenü für Package (im Popover der Zeile)"""
+        target = GLib.Variant.new_string(pkg.name)
         menu = Gio.Menu()
-        menu.append(_("Als System-App markieren"), "win.mark-system")
-        menu.append(_("Namen kopieren"), "win.copy-name")
 
-        # Actions
-        mark_action = Gio.SimpleAction.new("mark-system", None)
-        mark_action.connect("activate", lambda *_: self._mark_as_system(pkg.name))
-        self.add_action(mark_action)
+        mark_item = Gio.MenuItem.new(_("Als System-App markieren"), None)
+        mark_item.set_action_and_target_value("win.mark-system", target)
+        menu.append_item(mark_item)
 
-        copy_action = Gio.SimpleAction.new("copy-name", None)
-        copy_action.connect("activate", lambda *_: self._copy_to_clipboard(pkg.name))
-        self.add_action(copy_action)
+        copy_item = Gio.MenuItem.new(_("Namen kopieren"), None)
+        copy_item.set_action_and_target_value("win.copy-name", target)
+        menu.append_item(copy_item)
 
         # Popover
-        popover = Gtk.PopoverMenu()
-        popover.set_menu_model(menu)
-        popover.set_parent(widget)
-        popover.popup()
+        widget.popover.set_menu_model(menu)
+        widget.popover.popup()
 
     def _mark_as_system(self, package_name):
         """Markiert Paket als System-App"""
         if self.gui.filter_manager.save_user_filter(package_name):
             self._set_status(f"'{package_name}' " + _("als System-App markiert"))
-            # Neu laden
-            self._on_refresh_clicked(None)
+            # Neu filtern (Paketlisten kommen aus dem Inventar-Cache)
+            self._reload_packages(force=False)
         else:
             self._set_status(_("Fehler beim Markieren"))
 
@@ -619,51 +1017,215 @@ class MyAppsWindow(Adw.ApplicationWindow):
         clipboard.set(text)
         self._set_status(f"'{text}' " + _("kopiert"))
 
-    def _on_packages_loaded(self, packages):
+    def _on_packages_loaded(self, rows):
         """Callback wenn Pakete geladen sind"""
+        self._search_generation += 1  # Suchergebnisse für die alte Liste verwerfen
         self._apply_search_filter()
         self._update_pagination_controls()
         self._populate_current_view()
-        self._set_status(f"{len(packages)} Apps " + _("geladen"))
+        self._set_status(f"{len(rows)} Apps " + _("geladen"))
         return GLib.SOURCE_REMOVE
 
     def _on_search_changed(self, search_entry):
-        """Callback wenn Suchtext geändert wird"""
+        """Callback wenn Suchtext geändert wird (Suche startet erst nach kurzer Tipp-Pause)"""
         self.gui.search_query = search_entry.get_text().lower().strip()
+        self._search_generation += 1
+
+        # Bereits geplante oder noch wartende Suche verwerfen
+        if self._search_timeout_id is not None:
+            GLib.source_remove(self._search_timeout_id)
+        if self._search_future is not None:
+            self._search_future.cancel()
+            self._search_future = None
+
+        self._search_timeout_id = GLib.timeout_add(
+            self.SEARCH_DEBOUNCE_MS, self._start_search, self._search_generation
+        )
+
+    def _on_fuzzy_search_toggled(self, action, value):
+        """Schaltet die Tippfehler-tolerante Suche um und wiederholt die aktuelle Suche"""
+        action.set_state(value)
+        self.gui.fuzzy_search = value.get_boolean()
+        self._on_search_changed(self.search_entry)
+
+    def _start_search(self, generation):
+        """Übergibt die aktuelle Suchanfrage an den Such-Worker"""
+        self._search_timeout_id = None
+        if generation == self._search_generation:
+            self._search_future = self._search_executor.submit(
+                self._search_worker, generation, self.gui.search_query, self.gui.table,
+                self.gui.filtered_rows, self._last_search, self.gui.search_rows
+            )
+        return GLib.SOURCE_REMOVE
+
+    def _search_worker(self, generation, query, table, rows, last_search, previous_results):
+        """Worker-Thread: Führt die Suche aus und übergibt das Ergebnis an den Main-Thread"""
+        try:
+            result = self._run_search(query, table, rows, last_search, previous_results, generation)
+            if result is not None:
+                GLib.idle_add(self._on_search_results, generation, query, table, rows, *result)
+        except Exception as e:
+            logger.error(f"Fehler bei der Suche: {e}")
+
+    def _on_search_results(self, generation, query, table, rows, name_rows, description_rows, fuzzy_rows):
+        """Callback im Main-Thread: Übernimmt das Suchergebnis, falls es noch aktuell ist"""
+        if generation != self._search_generation or rows is not self.gui.filtered_rows:
+            return GLib.SOURCE_REMOVE  # Veraltet (weitergetippt oder neu geladen)
+
+        self._search_future = None
+        previous_query = self._last_search[0]
+        previous_tolerance = self._search_tolerance
+        self._set_search_results(query, table, rows, name_rows, description_rows, fuzzy_rows)
         self.gui.current_page = 0  # Zurück zu Seite 1
-        self._apply_search_filter()
         self._update_pagination_controls()
-        self._populate_current_view()
+
+        if self.gui.continuous_mode:
+            # Kein Neuaufbau: Filter inkrementell neu anwenden, Namens-Treffer nach oben
+            self.search_filter.changed(self._get_filter_change(
+                previous_query, previous_tolerance, query, self._search_tolerance
+            ))
+            self.sorter.changed(Gtk.SorterChange.DIFFERENT)
+        else:
+            self._populate_current_view()
 
         # Status Update
-        if self.gui.search_query:
-            self._set_status(f"{len(self.gui.search_filtered_packages)} Apps " + _("gefunden"))
+        if query:
+            self._set_status(f"{len(self.gui.search_rows)} Apps " + _("gefunden"))
         else:
-            self._set_status(f"{len(self.gui.filtered_packages)} Apps " + _("geladen"))
+            self._set_status(f"{len(self.gui.filtered_rows)} Apps " + _("geladen"))
+        return GLib.SOURCE_REMOVE
+
+    def _get_filter_change(self, previous_query: str, previous_tolerance: int,
+                           query: str, tolerance: int):
+        """
+        Bestimmt, wie sich die Treffermenge bei einer neuen Suchanfrage ändert
+
+        Bei gleicher Tippfehler-Toleranz gilt auch für die unscharfe Suche:
+        Eine verlängerte Anfrage kann nur Treffer verlieren, eine gekürzte nur
+        hinzugewinnen. Nur wenn sich die Toleranz ändert (ab 4 bzw. 10 Zeichen),
+        müssen alle Zeilen neu geprüft werden.
+
+        Args:
+            previous_query: Bisherige Suchanfrage
+            previous_tolerance: Tippfehler-Toleranz der bisherigen Suche
+            query: Neue Suchanfrage
+            tolerance: Tippfehler-Toleranz der neuen Suche
+
+        Returns:
+            Gtk.FilterChange (MORE_STRICT, LESS_STRICT oder DIFFERENT)
+        """
+        if not previous_query:
+            return Gtk.FilterChange.MORE_STRICT  # Bisher wurde alles angezeigt
+        if not query:
+            return Gtk.FilterChange.LESS_STRICT  # Jetzt wird alles angezeigt
+        if previous_tolerance != tolerance:
+            return Gtk.FilterChange.DIFFERENT
+        if previous_query in query:
+            return Gtk.FilterChange.MORE_STRICT  # Nur Treffer können wegfallen
+        if query in previous_query:
+            return Gtk.FilterChange.LESS_STRICT  # Nur Treffer können hinzukommen
+        return Gtk.FilterChange.DIFFERENT
 
     def _apply_search_filter(self):
-        """Wendet Suchfilter auf filtered_packages an"""
-        if not self.gui.search_query:
-            # Keine Suche: Zeige alle gefilterten Pakete
-            self.gui.search_filtered_packages = self.gui.filtered_packages
-            return
+        """Wendet Suchfilter synchron auf filtered_rows an (nach dem Laden)"""
+        table = self.gui.table
+        rows = self.gui.filtered_rows
+        name_rows, description_rows, fuzzy_rows = self._run_search(
+            self.gui.search_query, table, rows, self._last_search, self.gui.search_rows
+        )
+        self._set_search_results(self.gui.search_query, table, rows, name_rows, description_rows, fuzzy_rows)
+
+    def _run_search(self, query, table, rows, last_search, previous_results, generation=None):
+        """
+        Sucht in Name und Beschreibung (ohne GTK-Zugriffe, läuft im Such-Worker)
+
+        Treffer im Namen stehen vor Treffern in der Beschreibung, innerhalb
+        beider Gruppen bleibt die Sortierung von rows erhalten.
+        Ist der Such-Index fertig, werden nur dessen Kandidaten geprüft, sonst
+        wird linear gesucht (bei verfeinerter Suche nur in den bisherigen Treffern).
+        Mit aktivierter unscharfer Suche folgen Namen mit Tippfehlern, sortiert
+        nach Editierdistanz (nur mit Such-Index).
+
+        Args:
+            query: Suchanfrage (klein geschrieben)
+            table: Inventar-Tabelle
+            rows: Zu durchsuchende Zeilen-IDs (filtered_rows)
+            last_search: (Suchanfrage, Zeilen-IDs) der zuletzt übernommenen Suche
+            previous_results: Treffer der zuletzt übernommenen Suche
+            generation: Such-Generation; die lineare Suche bricht ab, sobald sie veraltet ist
+
+        Returns:
+            Tupel (Namens-Treffer, Beschreibungs-Treffer, [(Zeilen-ID, Distanz)]
+            oder None ohne unscharfe Suche) oder None wenn abgebrochen
+        """
+        if not query:
+            return None, None, None
+
+        index = self.gui.search_index
+        if index is not None and index.rows is rows:
+            # Trigramm-Index: Nur Kandidaten aus den Posting-Listen prüfen
+            name_rows, description_rows = index.search(query)
+            fuzzy_rows = None
+            if self.gui.fuzzy_search:
+                exact_rows = set(name_rows)
+                exact_rows.update(description_rows)
+                fuzzy_rows = [hit for hit in index.fuzzy_search(query) if hit[0] not in exact_rows]
+            return name_rows, description_rows, fuzzy_rows
+
+        previous_query, previous_source = last_search
+        if previous_query and previous_query in query and previous_source is rows:
+            candidates = previous_results  # Suche wurde verfeinert
+        else:
+            candidates = rows
+        names = table.names
+        descriptions = table.descriptions
+        name_rows = []
+        description_rows = []
 
-        # Suche in Name und Beschreibung
-        query = self.gui.search_query
-        matching = []
+        for i, row in enumerate(candidates):
+            # Regelmäßig prüfen, ob inzwischen weitergetippt wurde
+            if generation is not None and i % 2048 == 0 and generation != self._search_generation:
+                return None
 
-        for pkg in self.gui.filtered_packages:
             # Suche in Name (case-insensitive)
-            if query in pkg.name.lower():
-                matching.append(pkg)
+            if query in names[row].lower():
+                name_rows.append(row)
                 continue
 
             # Suche in Beschreibung (falls vorhanden)
-            if pkg.description and query in pkg.description.lower():
-                matching.append(pkg)
+            description = descriptions[row]
+            if description and query in description.lower():
+                description_rows.append(row)
                 continue
 
-        self.gui.search_filtered_packages = matching
+        return name_rows, description_rows, None
+
+    def _set_search_results(self, query, table, rows, name_rows, description_rows, fuzzy_rows):
+        """Übernimmt ein Suchergebnis in search_rows und den Suchfilter"""
+        self._last_search = (query, rows)
+        self._search_tolerance = SearchIndex.fuzzy_tolerance(query) if fuzzy_rows is not None else 0
+
+        if not query:
+            # Keine Suche: Zeige alle gefilterten Pakete
+            self.gui.search_rows = rows
+            self._search_ranks = None
+            return
+
+        fuzzy_rows = fuzzy_rows or ()
+
+        search_rows = array('I', name_rows)
+        search_rows.extend(description_rows)
+        search_rows.extend(row for row, distance in fuzzy_rows)
+        self.gui.search_rows = search_rows
+
+        ranks = bytearray(len(table))
+        for row in name_rows:
+            ranks[row] = 1
+        for row in description_rows:
+            ranks[row] = 2
+        for row, distance in fuzzy_rows:
+            ranks[row] = min(3 + distance, 255)
+        self._search_ranks = ranks
 
     def _on_loading_error(self, error_msg):
         """Callback bei Lade-Fehler"""
@@ -673,103 +1235,137 @@ class MyAppsWindow(Adw.ApplicationWindow):
     def _populate_current_view(self):
         """Füllt die aktuelle View mit Daten (paginiert)"""
         current_view = self.stack.get_visible_child_name()
+        start = time.perf_counter()
 
         if current_view == "list":
             self._populate_list_view()
         else:
             self._populate_table_view()
 
-    def _populate_list_view(self):
-        """Füllt ListView (paginiert) mit lokalisierten Beschreibungen"""
-        # Clear
-        self.list_store.remove_all()
+        logger.debug(f"View '{current_view}' gefüllt in {time.perf_counter() - start:.4f}s")
 
-        # Pagination Range (verwendet search_filtered_packages!)
+    def _get_view_rows(self):
+        """
+        Gibt die Zeilen-IDs zurück, mit denen die Views gefüllt werden
+
+        Returns:
+            Tupel (Quelle, Zeilen-IDs): Im Endlos-Modus alle gefilterten Apps
+            (Suche und Sortierung übernehmen die Models), sonst die aktuelle Seite
+        """
+        if self.gui.continuous_mode:
+            return self.gui.filtered_rows, self.gui.filtered_rows
+
+        # Pagination Range (verwendet search_rows, bereits sortiert!)
         start_idx = self.gui.current_page * self.gui.items_per_page
-        end_idx = min(start_idx + self.gui.items_per_page, len(self.gui.search_filtered_packages))
-
-        # Sortieren
-        sorted_packages = sorted(self.gui.search_filtered_packages, key=lambda p: (p.package_type, p.name))
-        page_packages = sorted_packages[start_idx:end_idx]
-
-        # Hole lokalisierte Beschreibungen PARALLEL für dpkg-Pakete
-        deb_packages = [pkg for pkg in page_packages if pkg.package_type == "deb"]
-        localized_descriptions = {}
-
-        if deb_packages:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # Starte parallele apt-cache Aufrufe
-                future_to_pkg = {
-                    executor.submit(self._get_localized_description, pkg.name): pkg.name
-                    for pkg in deb_packages
-                }
-
-                # Sammle Ergebnisse
-                for future in as_completed(future_to_pkg):
-                    pkg_name = future_to_pkg[future]
-                    try:
-                        desc = future.result()
-                        if desc:
-                            localized_descriptions[pkg_name] = desc
-                    except Exception:
-                        pass  # Fallback auf englische Beschreibung
-
-        # Add to Model (wrapped in PackageItem) mit lokalisierten Beschreibungen
-        from .package_manager import Package
-        for pkg in page_packages:
-            # Nutze lokalisierte Beschreibung falls vorhanden
-            if pkg.name in localized_descriptions:
-                pkg = Package(
-                    name=pkg.name,
-                    version=pkg.version,
-                    package_type=pkg.package_type,
-                    description=localized_descriptions[pkg.name]
-                )
+        end_idx = min(start_idx + self.gui.items_per_page, len(self.gui.search_rows))
 
-            self.list_store.append(PackageItem(pkg))
+        return None, self.gui.search_rows[start_idx:end_idx]
 
-    def _populate_table_view(self):
-        """Füllt Table View (paginiert)"""
-        # Clear
-        self.table_store.remove_all()
+    def _populate_list_view(self):
+        """Füllt ListView (paginiert oder alle Apps) mit lokalisierten Beschreibungen"""
+        source, page_rows = self._get_view_rows()
 
-        # Pagination Range (verwendet search_filtered_packages!)
-        start_idx = self.gui.current_page * self.gui.items_per_page
-        end_idx = min(start_idx + self.gui.items_per_page, len(self.gui.search_filtered_packages))
+        # Endlos-Modus: Model nur neu füllen, wenn sich die Zeilen geändert haben
+        if source is not None and self.list_model.source is source:
+            return
+
+        # Laufende Beschreibungs-Anfrage für die vorherige Seite abbrechen
+        self._description_generation += 1
+        if self._description_future is not None:
+            self._description_future.cancel()
+            self._description_future = None
+
+        # Model füllen: Sofort mit dpkg-Beschreibungen, bereits bekannte
+        # lokalisierte Beschreibungen werden direkt übernommen
+        table = self.gui.table
+        deb_type = table.types.index("deb") if "deb" in table.types else -1
+        descriptions = {}
+        pending = []
+        for row in page_rows:
+            if table.type_ids[row] == deb_type:
+                name = table.names[row]
+                if name not in self._localized_cache:
+                    pending.append(name)
+                elif self._localized_cache[name]:
+                    descriptions[row] = self._localized_cache[name]
+
+        self.list_model.set_rows(table, page_rows, descriptions, source)
+
+        # Fehlende lokalisierte Beschreibungen im Hintergrund nachladen
+        if pending:
+            self._description_future = self._description_executor.submit(
+                self._load_descriptions_worker, self._description_generation, pending
+            )
+
+    def _load_descriptions_worker(self, generation, package_names):
+        """Worker-Thread: Holt lokalisierte Beschreibungen für eine Seite"""
+        self.gui.description_index_ready.wait()
+
+        # Seite wurde inzwischen verlassen
+        if generation != self._description_generation:
+            return
+
+        results = {name: self._get_localized_description(name) for name in package_names}
+        GLib.idle_add(self._on_descriptions_loaded, generation, results)
+
+    def _on_descriptions_loaded(self, generation, results):
+        """Trägt lokalisierte Beschreibungen in die aktuelle Seite ein"""
+        self._localized_cache.update(results)
+
+        if generation != self._description_generation:
+            return GLib.SOURCE_REMOVE
+
+        # Alle betroffenen Zeilen ersetzen, mit einem einzigen items-changed
+        table = self.list_model.table
+        descriptions = {}
+        for row in self.list_model.rows:
+            desc = results.get(table.names[row])
+            if desc and table.package_type(row) == "deb":
+                descriptions[row] = desc
+
+        if descriptions:
+            self.list_model.set_descriptions(descriptions)
+
+        self._description_future = None
+        return GLib.SOURCE_REMOVE
+
+    def _populate_table_view(self):
+        """Füllt Table View (paginiert oder alle Apps)"""
+        source, page_rows = self._get_view_rows()
 
-        # Sortieren
-        sorted_packages = sorted(self.gui.search_filtered_packages, key=lambda p: (p.package_type, p.name))
-        page_packages = sorted_packages[start_idx:end_idx]
+        # Endlos-Modus: Model nur neu füllen, wenn sich die Zeilen geändert haben
+        if source is not None and self.table_model.source is source:
+            return
 
-        # Add to Model (wrapped in PackageItem)
-        for pkg in page_packages:
-            self.table_store.append(PackageItem(pkg))
+        self.table_model.set_rows(self.gui.table, page_rows, source=source)
 
     def _get_localized_description(self, package_name: str) -> Optional[str]:
-        """Holt lokalisierte Beschreibung via apt-cache (nur für List View)"""
-        import subprocess
-        try:
-            result = subprocess.run(
-                ["apt-cache", "show", package_name],
-                capture_output=True,
-                text=True,
-                timeout=2  # Timeout nach 2 Sekunden
-            )
-            if result.returncode == 0:
-                # Parse für Description (respektiert LANG)
-                for line in result.stdout.splitlines():
-                    if line.startswith("Description:") or line.startswith("Description-de:"):
-                        desc = line.split(":", 1)[1].strip()
-                        return desc if desc else None
-        except Exception:
-            pass  # Bei Fehler: Nutze englische Beschreibung als Fallback
-        return None
+        """Holt lokalisierte Beschreibung aus dem Beschreibungs-Index (nur für List View)"""
+        return self.gui.description_index.get(package_name)
+
+    def _on_continuous_toggled(self, button):
+        """Wechselt zwischen Seitenansicht und Endlos-Modus"""
+        self.gui.continuous_mode = button.get_active()
+        self.gui.current_page = 0
+        self.list_model.source = None
+        self.table_model.source = None
+        self.search_filter.changed(Gtk.FilterChange.DIFFERENT)
+        self._update_pagination_controls()
+        self._populate_current_view()
 
     def _update_pagination_controls(self):
-        """Aktualisiert Pagination Controls (verwendet search_filtered_packages!)"""
-        if self.gui.search_filtered_packages:
-            self.gui.total_pages = (len(self.gui.search_filtered_packages) + self.gui.items_per_page - 1) // self.gui.items_per_page
+        """Aktualisiert Pagination Controls (verwendet search_rows!)"""
+        self.pagination_nav_box.set_visible(not self.gui.continuous_mode)
+        if self.gui.continuous_mode:
+            self.pagination_info_label.set_text(
+                "ℹ️  " + f"{len(self.gui.search_rows)} Apps " + _("in einer Liste")
+            )
+            return
+
+        self.pagination_info_label.set_text("ℹ️  " + _("Zeigt 100 Apps pro Seite"))
+
+        if self.gui.search_rows:
+            self.gui.total_pages = (len(self.gui.search_rows) + self.gui.items_per_page - 1) // self.gui.items_per_page
         else:
             self.gui.total_pages = 0
 
@@ -780,10 +1376,10 @@ class MyAppsWindow(Adw.ApplicationWindow):
         # Update Label
         if self.gui.total_pages > 0:
             start_idx = self.gui.current_page * self.gui.items_per_page + 1
-            end_idx = min((self.gui.current_page + 1) * self.gui.items_per_page, len(self.gui.search_filtered_packages))
+            end_idx = min((self.gui.current_page + 1) * self.gui.items_per_page, len(self.gui.search_rows))
             self.page_label.set_text(
                 f"{_('Seite')} {self.gui.current_page + 1} {_('von')} {self.gui.total_pages}  •  "
-                f"Apps {start_idx}-{end_idx} {_('von')} {len(self.gui.search_filtered_packages)}"
+                f"Apps {start_idx}-{end_idx} {_('von')} {len(self.gui.search_rows)}"
             )
         else:
             self.page_label.set_text(_("Keine Apps"))
@@ -807,14 +1403,23 @@ class MyAppsWindow(Adw.ApplicationWindow):
             self._populate_current_view()
 
     def _on_refresh_clicked(self, button):
-        """Refresh Button Handler"""
+        """Refresh Button Handler (fragt alle Paketmanager neu ab)"""
+        self._reload_packages(force=True)
+
+    def _reload_packages(self, force: bool):
+        """
+        Lädt die Pakete neu
+
+        Args:
+            force: Wenn True, wird der Inventar-Cache ignoriert
+        """
         self.gui.current_page = 0
         self._set_status(_("Aktualisiere") + "...")
-        GLib.idle_add(self.gui._start_loading_packages)
+        GLib.idle_add(self.gui._start_loading_packages, force)
 
     def _on_export_clicked(self, button):
         """Export Button Handler"""
-        if not self.gui.search_filtered_packages:
+        if not self.gui.search_rows:
             dialog = Adw.MessageDialog.new(self)
             dialog.set_heading(_("Keine Pakete"))
             dialog.set_body(_("Keine Pakete zum Exportieren vorhanden"))
@@ -834,21 +1439,21 @@ class MyAppsWindow(Adw.ApplicationWindow):
         )
         dialog.set_current_name("myapps-export.txt")
 
-        # Format Filter
-        filter_txt = Gtk.FileFilter()
-        filter_txt.set_name("Text (.txt)")
-        filter_txt.add_pattern("*.txt")
-        dialog.add_filter(filter_txt)
-
-        filter_csv = Gtk.FileFilter()
-        filter_csv.set_name("CSV (.csv)")
-        filter_csv.add_pattern("*.csv")
-        dialog.add_filter(filter_csv)
-
-        filter_json = Gtk.FileFilter()
-        filter_json.set_name("JSON (.json)")
-        filter_json.add_pattern("*.json")
-        dialog.add_filter(filter_json)
+        # Format Filter (jeweils auch komprimiert, z.B. .json.gz)
+        for name, suffix in (("Text", ".txt"), ("CSV", ".csv"), ("JSON", ".json"), ("JSON Lines", ".jsonl")):
+            file_filter = Gtk.FileFilter()
+            file_filter.set_name(f"{name} ({suffix})")
+            file_filter.add_pattern(f"*{suffix}")
+            for compression in COMPRESSIONS:
+                file_filter.add_pattern(f"*{suffix}{compression}")
+            dialog.add_filter(file_filter)
+
+        # SQLite (mit Host und Distribution, nicht komprimiert)
+        file_filter = Gtk.FileFilter()
+        file_filter.set_name("SQLite (.sqlite, .db)")
+        file_filter.add_pattern("*.sqlite")
+        file_filter.add_pattern("*.db")
+        dialog.add_filter(file_filter)
 
         dialog.connect("response", self._on_export_response)
         dialog.present()
@@ -860,23 +1465,221 @@ class MyAppsWindow(Adw.ApplicationWindow):
             if file:
                 file_path = file.get_path()
 
-                # Format aus Dateiendung ermitteln
-                fmt = "txt"
-                if file_path.endswith(".csv"):
-                    fmt = "csv"
-                elif file_path.endswith(".json"):
-                    fmt = "json"
+                # Export im Hintergrund (verwendet search_rows!): Package-Objekte
+                # entstehen erst beim Schreiben, Zeile für Zeile. Format und
+                # Kompression ergeben sich aus der Dateiendung (z.B. .csv.xz)
+                table = self.gui.table
+                total = len(self.gui.search_rows)
+                packages = (table.package(row) for row in table.sorted_rows(self.gui.search_rows))
+                cancel_event = threading.Event()
+                self._export_cancel = cancel_event
+
+                self.export_btn.set_sensitive(False)
+                self.export_progress.set_fraction(0.0)
+                self.export_progress.set_visible(True)
+                self.export_cancel_btn.set_visible(True)
+                self._set_status(_("Exportiere") + "...")
+
+                threading.Thread(
+                    target=self._export_worker,
+                    args=(packages, file_path, total, cancel_event),
+                    daemon=True
+                ).start()
+
+        dialog.destroy()
+
+    def _export_worker(self, packages, file_path, total, cancel_event):
+        """
+        Worker-Thread: Schreibt (und komprimiert) den Export
+
+        Die Zieldatei wird erst nach vollständigem Schreiben ersetzt; bei
+        Abbruch oder Fehler bleibt eine vorhandene Datei unverändert.
+
+        Args:
+            packages: Pakete (Generator, sortiert)
+            file_path: Zieldatei
+            total: Anzahl der Pakete (für die Fortschrittsanzeige)
+            cancel_event: Wird gesetzt, um den Export abzubrechen
+        """
+        success = Exporter.export(
+            packages, file_path, presorted=True,
+            progress=lambda count: GLib.idle_add(self._on_export_progress, count, total),
+            cancel_event=cancel_event
+        )
+        GLib.idle_add(self._on_export_finished, file_path, success, cancel_event)
+
+    def _on_export_progress(self, count, total):
+        """Aktualisiert die Fortschrittsanzeige (Main-Thread)"""
+        if self._export_cancel is not None and not self._export_cancel.is_set():
+            self.export_progress.set_fraction(min(count / total, 1.0) if total else 0.0)
+            self._set_status(f"{_('Exportiere')}... {count}/{total}")
+        return GLib.SOURCE_REMOVE
+
+    def _on_export_cancel_clicked(self, button):
+        """Bricht den laufenden Export ab"""
+        if self._export_cancel is not None:
+            self._export_cancel.set()
+            self._set_status(_("Breche Export ab") + "...")
+
+    def _on_export_finished(self, file_path, success, cancel_event):
+        """Callback im Main-Thread nach dem Export"""
+        self._export_cancel = None
+        self.export_progress.set_visible(False)
+        self.export_cancel_btn.set_visible(False)
+        self.export_btn.set_sensitive(True)
+
+        if success:
+            self._set_status(f"{_('Exportiert')}: {file_path}")
+        elif cancel_event.is_set():
+            self._set_status(_("Export abgebrochen"))
+        else:
+            self._set_status(_("Export fehlgeschlagen"))
+        return GLib.SOURCE_REMOVE
 
-                # Export durchführen (verwendet search_filtered_packages!)
-                success = Exporter.export(self.gui.search_filtered_packages, file_path, fmt)
+    def _on_compare_snapshot(self, action, param):
+        """Menü-Handler: Gespeicherten Snapshot (Export) zum Vergleich auswählen"""
+        dialog = Gtk.FileChooserDialog(
+            title=_("Snapshot zum Vergleich öffnen"),
+            parent=self,
+            action=Gtk.FileChooserAction.OPEN
+        )
+        dialog.add_buttons(
+            _("Abbrechen"), Gtk.ResponseType.CANCEL,
+            _("Vergleichen"), Gtk.ResponseType.ACCEPT
+        )
 
-                if success:
-                    self._set_status(f"{_('Exportiert')}: {file_path}")
-                else:
-                    self._set_status(_("Export fehlgeschlagen"))
+        # Alle lesbaren Export-Formate (Text-Formate auch komprimiert)
+        file_filter = Gtk.FileFilter()
+        file_filter.set_name(_("MyApps-Exporte"))
+        for suffix, format in FORMAT_SUFFIXES.items():
+            file_filter.add_pattern(f"*{suffix}")
+            if format != 'sqlite':
+                for compression in COMPRESSIONS:
+                    file_filter.add_pattern(f"*{suffix}{compression}")
+        dialog.add_filter(file_filter)
+
+        dialog.connect("response", self._on_compare_response)
+        dialog.present()
+
+    def _on_compare_response(self, dialog, response):
+        """Snapshot-Dialog Response: Vergleich im Hintergrund starten"""
+        if response == Gtk.ResponseType.ACCEPT:
+            file = dialog.get_file()
+            if file:
+                # Verglichen wird mit den User-Apps (ohne Suchfilter)
+                self._set_status(_("Vergleiche") + "...")
+                threading.Thread(
+                    target=self._compare_worker,
+                    args=(file.get_path(), self.gui.table, self.gui.filtered_rows),
+                    daemon=True
+                ).start()
 
         dialog.destroy()
 
+    def _compare_worker(self, snapshot_path, table, rows):
+        """
+        Worker-Thread: Liest den Snapshot und vergleicht ihn mit dem aktuellen Inventar
+
+        Args:
+            snapshot_path: Pfad zum gespeicherten Export
+            table: Inventar-Tabelle
+            rows: Zeilen-IDs des aktuellen Inventars
+        """
+        try:
+            diff = diff_snapshots(load_snapshot(snapshot_path), (table.package(row) for row in rows))
+        except Exception as e:
+            logger.error(f"Fehler beim Vergleich mit {snapshot_path}: {e}")
+            diff = None
+        GLib.idle_add(self._on_compare_finished, snapshot_path, diff)
+
+    def _on_compare_finished(self, snapshot_path, diff):
+        """Callback im Main-Thread nach dem Vergleich"""
+        if diff is None:
+            self._set_status(_("Vergleich fehlgeschlagen"))
+        else:
+            self._set_status(f"{_('Verglichen mit')}: {snapshot_path}")
+            self._show_diff_window(snapshot_path, diff)
+        return GLib.SOURCE_REMOVE
+
+    def _show_diff_window(self, snapshot_path, diff):
+        """
+        Zeigt das Ergebnis eines Snapshot-Vergleichs
+
+        Args:
+            snapshot_path: Pfad zum gespeicherten Export
+            diff: SnapshotDiff (Snapshot -> aktuelles System)
+        """
+        window = Gtk.Window()
+        window.set_transient_for(self)
+        window.set_title(_("Vergleich mit Snapshot"))
+        window.set_default_size(700, 650)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_vexpand(True)
+        window.set_child(scrolled)
+
+        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        main_box.set_margin_start(24)
+        main_box.set_margin_end(24)
+        main_box.set_margin_top(20)
+        main_box.set_margin_bottom(20)
+        scrolled.set_child(main_box)
+
+        title_label = Gtk.Label(label=f"{Path(snapshot_path).name} → {_('Aktuelles System')}")
+        title_label.add_css_class("title-2")
+        title_label.set_wrap(True)
+        main_box.append(title_label)
+
+        summary_label = Gtk.Label(
+            label=f"{len(diff.added)} {_('neu')}  •  {len(diff.removed)} {_('entfernt')}  •  "
+                  f"{len(diff.upgraded)} {_('aktualisiert')}  •  {len(diff.downgraded)} {_('zurückgestuft')}  •  "
+                  f"{diff.unchanged} {_('unverändert')}"
+        )
+        summary_label.add_css_class("dim-label")
+        summary_label.set_margin_bottom(12)
+        main_box.append(summary_label)
+
+        if not diff.has_changes:
+            main_box.append(Gtk.Label(label=_("Keine Unterschiede")))
+
+        sections = (
+            (_("Neu installiert"), [(pkg.name, pkg.package_type, pkg.version) for pkg in diff.added]),
+            (_("Entfernt"), [(pkg.name, pkg.package_type, pkg.version) for pkg in diff.removed]),
+            (_("Aktualisiert"), [(change.name, change.package_type, f"{change.old_version} → {change.new_version}")
+                                 for change in diff.upgraded]),
+            (_("Zurückgestuft"), [(change.name, change.package_type, f"{change.old_version} → {change.new_version}")
+                                  for change in diff.downgraded]),
+        )
+        for title, entries in sections:
+            if not entries:
+                continue
+
+            header_label = Gtk.Label(label=f"{title} ({len(entries)})")
+            header_label.add_css_class("title-4")
+            header_label.set_halign(Gtk.Align.START)
+            header_label.set_margin_top(12)
+            main_box.append(header_label)
+
+            # Große Abschnitte kürzen (ListBox erzeugt ein Widget pro Zeile)
+            list_box = Gtk.ListBox()
+            list_box.set_selection_mode(Gtk.SelectionMode.NONE)
+            list_box.add_css_class("boxed-list")
+            for name, package_type, version in entries[:self.DIFF_SECTION_LIMIT]:
+                row = Adw.ActionRow()
+                row.set_title(GLib.markup_escape_text(name))
+                row.set_subtitle(GLib.markup_escape_text(f"{package_type.upper()}  •  {version}"))
+                list_box.append(row)
+            main_box.append(list_box)
+
+            if len(entries) > self.DIFF_SECTION_LIMIT:
+                more_label = Gtk.Label(
+                    label=f"... {_('und')} {len(entries) - self.DIFF_SECTION_LIMIT} {_('weitere')}"
+                )
+                more_label.add_css_class("dim-label")
+                main_box.append(more_label)
+
+        window.present()
+
     def _on_about(self, action, param):
         """About Dialog - Alles auf einer Seite wie vorher!"""
         import webbrowser
@@ -4,9 +4,14 @@ Lädt Icons aus System-Verzeichnissen mit Fallback auf generische Icons
 """
 
 import os
+import struct
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Dict, List, Tuple
 from PIL import Image
 
 # Optional imports für verschiedene GUI-Backends
@@ -20,7 +25,7 @@ except ImportError:
 try:
     import gi
     gi.require_version('GdkPixbuf', '2.0')
-    from gi.repository import GdkPixbuf
+    from gi.repository import GdkPixbuf, GLib
     HAS_GTK = True
 except (ImportError, ValueError):
     HAS_GTK = False
@@ -28,9 +33,535 @@ except (ImportError, ValueError):
 logger = logging.getLogger(__name__)
 
 
+# Flags in icon-theme.cache (siehe gtk/gtkiconcache.c)
+_CACHE_HAS_SUFFIX_XPM = 1 << 0
+_CACHE_HAS_SUFFIX_SVG = 1 << 1
+_CACHE_HAS_SUFFIX_PNG = 1 << 2
+
+
+def read_icon_theme_cache(cache_path: Path) -> Dict[str, List[str]]:
+    """
+    Liest die Dateinamen aus einer GTK icon-theme.cache
+
+    Args:
+        cache_path: Pfad zur icon-theme.cache eines Themes (z.B. hicolor)
+
+    Returns:
+        Dictionary Unterverzeichnis (z.B. "32x32/apps") -> Liste von Dateinamen
+
+    Raises:
+        Exception: Bei Lese- oder Formatfehlern
+    """
+    with open(cache_path, 'rb') as f:
+        data = f.read()
+
+    def u16(offset):
+        return struct.unpack_from(">H", data, offset)[0]
+
+    def u32(offset):
+        return struct.unpack_from(">I", data, offset)[0]
+
+    def c_string(offset):
+        end = data.index(b"\0", offset)
+        return data[offset:end].decode('utf-8', 'replace')
+
+    if u16(0) != 1:
+        raise ValueError(f"Unbekannte icon-theme.cache Version: {u16(0)}")
+
+    hash_offset = u32(4)
+    directory_list_offset = u32(8)
+
+    n_dirs = u32(directory_list_offset)
+    directories = [c_string(u32(directory_list_offset + 4 + 4 * i)) for i in range(n_dirs)]
+    listing: Dict[str, List[str]] = {directory: [] for directory in directories}
+
+    n_buckets = u32(hash_offset)
+    for bucket in range(n_buckets):
+        icon_offset = u32(hash_offset + 4 + 4 * bucket)
+
+        # Hash-Kette durchlaufen (0xFFFFFFFF = Ende)
+        while icon_offset != 0xFFFFFFFF:
+            chain_offset = u32(icon_offset)
+            name = c_string(u32(icon_offset + 4))
+            image_list_offset = u32(icon_offset + 8)
+
+            n_images = u32(image_list_offset)
+            for i in range(n_images):
+                image_offset = image_list_offset + 4 + 8 * i
+                directory = directories[u16(image_offset)]
+                flags = u16(image_offset + 2)
+
+                if flags & _CACHE_HAS_SUFFIX_PNG:
+                    listing[directory].append(f"{name}.png")
+                if flags & _CACHE_HAS_SUFFIX_SVG:
+                    listing[directory].append(f"{name}.svg")
+                if flags & _CACHE_HAS_SUFFIX_XPM:
+                    listing[directory].append(f"{name}.xpm")
+
+            icon_offset = chain_offset
+
+    return listing
+
+
+class IconIndex:
+    """
+    Index der Icon-Dateien einer geordneten Liste von Verzeichnissen
+
+    Die Verzeichnisse werden einmal eingelesen (bzw. aus der icon-theme.cache
+    des Themes gelesen) statt pro Paket hunderte Pfade per stat() zu prüfen.
+    Der Index wird nur neu aufgebaut, wenn sich ein Verzeichnis geändert hat.
+    """
+
+    def __init__(self, directories: List[Path], extensions: List[str]):
+        """
+        Initialisiert den IconIndex
+
+        Args:
+            directories: Verzeichnisse in Prioritätsreihenfolge
+            extensions: Datei-Endungen in Prioritätsreihenfolge
+        """
+        self.directories = directories
+        self.extensions = extensions
+        self._extension_rank = {ext: rank for rank, ext in enumerate(extensions)}
+        # Icon-Name -> (Verzeichnis-Rang, Endungs-Rang, Pfad) der besten Datei
+        self._icons: Dict[str, Tuple[int, int, Path]] = {}
+        self._mtimes: Dict[Path, Optional[int]] = {}
+        self._built = False
+        self._lock = threading.Lock()
+
+    def _stat_mtimes(self) -> Dict[Path, Optional[int]]:
+        """Ermittelt die mtimes aller Verzeichnisse (None = existiert nicht)"""
+        mtimes = {}
+        for directory in self.directories:
+            try:
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtimes[directory] = None
+        return mtimes
+
+    def build(self) -> None:
+        """Baut den Index (neu) auf"""
+        with self._lock:
+            self._build_locked(self._stat_mtimes())
+
+    def refresh(self) -> bool:
+        """
+        Baut den Index neu auf, falls sich ein Verzeichnis geändert hat
+
+        Returns:
+            True wenn neu aufgebaut wurde
+        """
+        with self._lock:
+            mtimes = self._stat_mtimes()
+            if self._built and mtimes == self._mtimes:
+                return False
+
+            self._build_locked(mtimes)
+            return True
+
+    def _build_locked(self, mtimes: Dict[Path, Optional[int]]) -> None:
+        """Baut den Index auf (Lock muss gehalten werden)"""
+        icons: Dict[str, Tuple[int, int, Path]] = {}
+        theme_caches: Dict[Path, Optional[Tuple[int, Dict[str, List[str]]]]] = {}
+
+        for dir_rank, directory in enumerate(self.directories):
+            dir_mtime = mtimes.get(directory)
+            if dir_mtime is None:
+                continue
+
+            for filename in self._list_directory(directory, dir_mtime, theme_caches):
+                stem, ext = os.path.splitext(filename)
+                ext_rank = self._extension_rank.get(ext)
+                if ext_rank is None:
+                    continue
+
+                # Die erste (höchst priorisierte) Fundstelle gewinnt
+                best = icons.get(stem)
+                if best is None or (dir_rank, ext_rank) < best[:2]:
+                    icons[stem] = (dir_rank, ext_rank, directory / filename)
+
+        self._icons = icons
+        self._mtimes = mtimes
+        self._built = True
+        logger.debug(f"Icon-Index aufgebaut: {len(icons)} Icons in {len(self.directories)} Verzeichnissen")
+
+    def _list_directory(self, directory: Path, dir_mtime: int,
+                        theme_caches: Dict[Path, Optional[Tuple[int, Dict[str, List[str]]]]]) -> List[str]:
+        """
+        Listet die Dateinamen eines Verzeichnisses auf
+
+        Nutzt die icon-theme.cache des Themes (z.B. .../hicolor/32x32/apps -> .../hicolor),
+        sofern sie nicht älter als das Verzeichnis ist.
+        """
+        theme_dir = directory.parent.parent
+        if theme_dir not in theme_caches:
+            theme_caches[theme_dir] = None
+            cache_path = theme_dir / "icon-theme.cache"
+            if cache_path.exists():
+                try:
+                    theme_caches[theme_dir] = (os.stat(cache_path).st_mtime_ns, read_icon_theme_cache(cache_path))
+                except Exception as e:
+                    logger.debug(f"icon-theme.cache nicht lesbar ({cache_path}): {e}")
+
+        cached = theme_caches[theme_dir]
+        if cached is not None:
+            cache_mtime, listing = cached
+            subdir = f"{directory.parent.name}/{directory.name}"
+            if cache_mtime >= dir_mtime and subdir in listing:
+                return listing[subdir]
+
+        try:
+            return [entry.name for entry in os.scandir(directory)]
+        except OSError:
+            return []
+
+    def find(self, names: List[str], extension_first: bool = False) -> Optional[Path]:
+        """
+        Sucht das am höchsten priorisierte Icon für eine Liste von Namen
+
+        Args:
+            names: Icon-Namen (ohne Endung) in Prioritätsreihenfolge
+            extension_first: Wenn True, hat die Endung Vorrang vor der Namensreihenfolge
+
+        Returns:
+            Pfad zum Icon oder None
+        """
+        if not self._built:
+            self.refresh()
+
+        best_key = None
+        best_path = None
+        for name_rank, name in enumerate(names):
+            entry = self._icons.get(name)
+            if entry is None:
+                continue
+
+            dir_rank, ext_rank, path = entry
+            if extension_first:
+                key = (dir_rank, ext_rank, name_rank)
+            else:
+                key = (dir_rank, name_rank, ext_rank)
+
+            if best_key is None or key < best_key:
+                best_key = key
+                best_path = path
+
+        return best_path
+
+
+class IconDiskCache:
+    """
+    Persistenter Cache für bereits skalierte Icons
+
+    Speichert die RGBA-Pixel eines skalierten Icons unter ~/.cache/myapps/icons,
+    gemeinsam für IconManager (Tk) und IconManagerGTK. Da beide unterschiedlich
+    skalieren (PIL thumbnail vergrößert nie, GdkPixbuf schon), gehört die
+    Variante des Skalierers zum Schlüssel. Ein Treffer kostet einen einzigen
+    Lesezugriff ohne Dekodieren oder Skalieren. Die Größe des Caches ist
+    begrenzt, bei Überschreitung werden die am längsten nicht genutzten Icons gelöscht.
+    """
+
+    # Datei-Header: Magic, Breite, Höhe (Pixel folgen als RGBA, ohne Padding)
+    HEADER = struct.Struct(">4sHH")
+    MAGIC = b"MAI1"
+
+    # Zugriffszeit (mtime, für LRU) höchstens so oft aktualisieren (Sekunden)
+    TOUCH_INTERVAL = 24 * 60 * 60
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Initialisiert den IconDiskCache
+
+        Args:
+            cache_dir: Cache-Verzeichnis (Standard: ~/.cache/myapps/icons)
+            max_bytes: Maximale Gesamtgröße des Caches in Bytes
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "myapps" / "icons"
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None  # Wird beim ersten Schreiben ermittelt
+        self._lock = threading.Lock()
+
+    def _entry_path(self, icon_path: Path, icon_size: int, variant: str) -> Optional[Path]:
+        """Ermittelt die Cache-Datei für (Quelle, mtime, Dateigröße, Zielgröße, Skalierer)"""
+        try:
+            st = os.stat(icon_path)
+        except OSError:
+            return None
+
+        key = f"{icon_path}\0{st.st_mtime_ns}\0{st.st_size}\0{icon_size}\0{variant}"
+        return self.cache_dir / (hashlib.sha1(key.encode('utf-8', 'surrogateescape')).hexdigest() + ".rgba")
+
+    def get(self, icon_path: Path, icon_size: int, variant: str) -> Optional[Tuple[int, int, bytes]]:
+        """
+        Holt ein skaliertes Icon aus dem Cache
+
+        Args:
+            icon_path: Pfad zum Original-Icon
+            icon_size: Zielgröße in Pixeln
+            variant: Skalierer, der das Icon erzeugt hat (z.B. "tk" oder "gtk")
+
+        Returns:
+            Tupel (Breite, Höhe, RGBA-Pixel) oder None
+        """
+        entry_path = self._entry_path(icon_path, icon_size, variant)
+        if entry_path is None:
+            return None
+
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+                modified = os.fstat(f.fileno()).st_mtime
+        except OSError:
+            return None
+
+        if len(data) < self.HEADER.size:
+            return None
+
+        magic, width, height = self.HEADER.unpack_from(data)
+        pixels = data[self.HEADER.size:]
+        if magic != self.MAGIC or len(pixels) != width * height * 4:
+            return None
+
+        # Zuletzt genutzt markieren (für LRU-Verdrängung) - nur selten, damit
+        # ein Treffer nicht jedes Mal zum Schreibzugriff wird
+        if time.time() - modified > self.TOUCH_INTERVAL:
+            try:
+                os.utime(entry_path)
+            except OSError:
+                pass
+
+        return width, height, pixels
+
+    def put(self, icon_path: Path, icon_size: int, variant: str, width: int, height: int,
+            pixels: bytes) -> None:
+        """
+        Legt ein skaliertes Icon im Cache ab
+
+        Args:
+            icon_path: Pfad zum Original-Icon
+            icon_size: Zielgröße in Pixeln
+            variant: Skalierer, der das Icon erzeugt hat (z.B. "tk" oder "gtk")
+            width: Breite des skalierten Icons
+            height: Höhe des skalierten Icons
+            pixels: RGBA-Pixel (width * height * 4 Bytes, ohne Zeilen-Padding)
+        """
+        entry_path = self._entry_path(icon_path, icon_size, variant)
+        if entry_path is None:
+            return
+
+        data = self.HEADER.pack(self.MAGIC, width, height) + bytes(pixels)
+
+        # Ein vorhandener Eintrag wird ersetzt und zählt nicht doppelt
+        try:
+            replaced_bytes = os.stat(entry_path).st_size
+        except OSError:
+            replaced_bytes = 0
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_name(f"{entry_path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.debug(f"Icon konnte nicht gecacht werden ({icon_path}): {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(data) - replaced_bytes
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan_total_bytes(self) -> int:
+        """Summiert die Größe aller Cache-Dateien"""
+        total = 0
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".rgba"):
+                    total += entry.stat().st_size
+        except OSError:
+            pass
+        return total
+
+    def _evict(self) -> None:
+        """Löscht die am längsten nicht genutzten Icons bis 90% des Limits erreicht sind"""
+        try:
+            entries = [
+                (entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith(".rgba")
+            ]
+        except OSError:
+            return
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+
+        self._total_bytes = total
+        logger.debug(f"Icon-Disk-Cache: {removed} Icons verdrängt, {total} Bytes belegt")
+
+    def clear(self) -> None:
+        """Löscht alle gecachten Icons"""
+        with self._lock:
+            try:
+                for entry in os.scandir(self.cache_dir):
+                    if entry.name.endswith(".rgba"):
+                        os.unlink(entry.path)
+            except OSError:
+                pass
+            self._total_bytes = 0
+
+
+class IconLRUCache:
+    """
+    Speicherbegrenzter LRU-Cache für geladene Icons
+
+    Schlüssel ist "typ:name". Einträge, die auf das gemeinsame Platzhalter-Icon
+    verweisen, belegen kein Budget. Zugriffe sind thread-sicher.
+    """
+
+    def __init__(self, max_bytes: int, size_of: Callable[[Any], int]):
+        """
+        Initialisiert den IconLRUCache
+
+        Args:
+            max_bytes: Speicherbudget für Icons in Bytes
+            size_of: Funktion, die den Speicherbedarf eines Icons in Bytes liefert
+        """
+        self.max_bytes = max_bytes
+        self._size_of = size_of
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Statistiken
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[Any]:
+        """
+        Holt ein Icon und markiert es als zuletzt genutzt
+
+        Args:
+            key: Cache-Schlüssel ("typ:name")
+            count_miss: False, wenn der Aufrufer das Icon anschließend über get_icon
+                lädt (dort wird der Fehlschlag gezählt, sonst zählte er doppelt)
+
+        Returns:
+            Icon oder None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, icon: Any, shared: bool = False) -> None:
+        """
+        Legt ein Icon im Cache ab und verdrängt bei Bedarf alte Einträge
+
+        Args:
+            key: Cache-Schlüssel ("typ:name")
+            icon: Icon-Objekt
+            shared: True für das gemeinsame Platzhalter-Icon (belegt kein Budget)
+        """
+        size = 0 if shared else self._size_of(icon)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._entries[key] = (icon, size)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Leert den Cache (Statistiken bleiben erhalten)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """
+        Gibt Statistiken über den Cache zurück
+
+        Returns:
+            Dictionary mit Treffern, Fehlschlägen, Verdrängungen und Speicherbelegung
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def create_icon_indexes(manager) -> Tuple[IconIndex, IconIndex, IconIndex]:
+    """
+    Erstellt die Icon-Indizes (System, Snap, Flatpak) für einen IconManager
+
+    Args:
+        manager: IconManager oder IconManagerGTK (liefert Pfade und Endungen)
+
+    Returns:
+        Tupel (System-Index, Snap-Index, Flatpak-Index)
+    """
+    extensions = manager.ICON_EXTENSIONS
+
+    system_index = IconIndex(manager.icon_search_paths, extensions)
+    snap_index = IconIndex([
+        base / "hicolor" / size_dir / "apps"
+        for base in manager.snap_icon_paths
+        for size_dir in manager.SNAP_ICON_SIZES
+    ], extensions)
+    flatpak_index = IconIndex([
+        Path(base).expanduser() / "hicolor" / size_dir / "apps"
+        for base in manager.FLATPAK_ICON_PATHS
+        for size_dir in manager.FLATPAK_ICON_SIZES
+    ], extensions)
+
+    return system_index, snap_index, flatpak_index
+
+
 class IconManager:
     """Verwaltet App-Icons mit System-Integration und Fallbacks"""
 
+    # Schlüssel-Variante im Disk-Cache (PIL thumbnail: verkleinert nur, vergrößert nie)
+    DISK_CACHE_VARIANT = "tk"
+
     # Standard-Icon-Suchpfade (in Prioritätsreihenfolge)
     ICON_SEARCH_PATHS = [
         "/usr/share/pixmaps",
@@ -51,10 +582,21 @@ class IconManager:
         "/var/lib/snapd/desktop/icons",
     ]
 
+    # Größen-Unterverzeichnisse für Snap-Icons (unter <pfad>/hicolor/<größe>/apps)
+    SNAP_ICON_SIZES = ["32x32", "48x48", "64x64", "scalable"]
+
+    # Flatpak-Icon-Basispfade und Größen-Unterverzeichnisse
+    FLATPAK_ICON_PATHS = [
+        "/var/lib/flatpak/exports/share/icons",
+        "~/.local/share/flatpak/exports/share/icons",
+    ]
+    FLATPAK_ICON_SIZES = ["32x32", "48x48", "64x64", "128x128", "scalable"]
+
     # Icon-Datei-Endungen (in Prioritätsreihenfolge)
     ICON_EXTENSIONS = [".png", ".svg", ".xpm", ".jpg", ".jpeg"]
 
-    def __init__(self, icon_size: int = 32, fallback_dir: Optional[str] = None, use_shared_icon: bool = False):
+    def __init__(self, icon_size: int = 32, fallback_dir: Optional[str] = None, use_shared_icon: bool = False,
+                 cache_bytes: int = 16 * 1024 * 1024):
         """
         Initialisiert den IconManager
 
@@ -63,11 +605,12 @@ class IconManager:
             fallback_dir: Verzeichnis mit Fallback-Icons
             use_shared_icon: Wenn True, wird für alle Pakete dasselbe Icon verwendet
                             (Performance-Optimierung für viele Pakete)
+            cache_bytes: Speicherbudget des Icon-Caches in Bytes
         """
         self.icon_size = icon_size
         self.fallback_dir = Path(fallback_dir) if fallback_dir else None
         self.use_shared_icon = use_shared_icon
-        self._icon_cache: Dict[str, "ImageTk.PhotoImage"] = {}
+        self._icon_cache = IconLRUCache(cache_bytes, lambda icon: icon.width() * icon.height() * 4)
         self._default_icon: Optional["ImageTk.PhotoImage"] = None
 
         # Erweitere Suchpfade mit expanduser
@@ -78,6 +621,12 @@ class IconManager:
             Path(p).expanduser() for p in self.SNAP_ICON_PATHS
         ]
 
+        # Icon-Indizes (werden beim ersten Zugriff aufgebaut)
+        self._system_index, self._snap_index, self._flatpak_index = create_icon_indexes(self)
+
+        # Persistenter Cache für skalierte Icons (gemeinsam für Tk und GTK)
+        self._disk_cache = IconDiskCache()
+
     def get_icon(self, package_name: str, package_type: str) -> "ImageTk.PhotoImage":
         """
         Holt das Icon für ein Paket
@@ -96,23 +645,24 @@ class IconManager:
 
         # Prüfe Cache
         cache_key = f"{package_type}:{package_name}"
-        if cache_key in self._icon_cache:
-            return self._icon_cache[cache_key]
+        icon = self._icon_cache.get(cache_key)
+        if icon is not None:
+            return icon
 
         # Versuche Icon zu finden
         icon_path = self._find_icon(package_name, package_type)
 
-        if icon_path and icon_path.exists():
+        if icon_path:
             try:
                 icon = self._load_and_resize_icon(icon_path)
-                self._icon_cache[cache_key] = icon
+                self._icon_cache.put(cache_key, icon)
                 return icon
             except Exception as e:
                 logger.debug(f"Fehler beim Laden von Icon {icon_path}: {e}")
 
-        # Fallback auf Standard-Icon
+        # Fallback auf Standard-Icon (gemeinsam genutzt, belegt kein Budget)
         default_icon = self._get_default_icon()
-        self._icon_cache[cache_key] = default_icon
+        self._icon_cache.put(cache_key, default_icon, shared=True)
         return default_icon
 
     def _find_icon(self, package_name: str, package_type: str) -> Optional[Path]:
@@ -153,18 +703,10 @@ class IconManager:
         # Bereinige Paketnamen (entferne Arch-Suffix, Version-Nummern etc.)
         clean_names = self._get_icon_name_variants(package_name)
 
-        for icon_dir in self.icon_search_paths:
-            if not icon_dir.exists():
-                continue
-
-            for name in clean_names:
-                for ext in self.ICON_EXTENSIONS:
-                    icon_path = icon_dir / f"{name}{ext}"
-                    if icon_path.exists():
-                        logger.debug(f"Icon gefunden: {icon_path}")
-                        return icon_path
-
-        return None
+        icon_path = self._system_index.find(clean_names)
+        if icon_path:
+            logger.debug(f"Icon gefunden: {icon_path}")
+        return icon_path
 
     def _find_snap_icon(self, package_name: str) -> Optional[Path]:
         """
@@ -176,28 +718,15 @@ class IconManager:
         Returns:
             Pfad zum Icon oder None
         """
-        for icon_dir in self.snap_icon_paths:
-            if not icon_dir.exists():
-                continue
-
-            # Snap-Icons haben oft die Form: snap.package-name.icon-name
-            for size_dir in ["32x32", "48x48", "64x64", "scalable"]:
-                search_dir = icon_dir / "hicolor" / size_dir / "apps"
-                if not search_dir.exists():
-                    continue
-
-                for ext in self.ICON_EXTENSIONS:
-                    # Versuche verschiedene Snap-Icon-Namenskonventionen
-                    candidates = [
-                        search_dir / f"snap.{package_name}.{package_name}{ext}",
-                        search_dir / f"snap.{package_name}{ext}",
-                        search_dir / f"{package_name}{ext}",
-                    ]
-
-                    for candidate in candidates:
-                        if candidate.exists():
-                            logger.debug(f"Snap-Icon gefunden: {candidate}")
-                            return candidate
+        # Snap-Icons haben oft die Form: snap.package-name.icon-name
+        icon_path = self._snap_index.find([
+            f"snap.{package_name}.{package_name}",
+            f"snap.{package_name}",
+            package_name,
+        ], extension_first=True)
+        if icon_path:
+            logger.debug(f"Snap-Icon gefunden: {icon_path}")
+            return icon_path
 
         # Fallback auf Standard-Suche
         return self._find_system_icon(package_name)
@@ -213,25 +742,10 @@ class IconManager:
             Pfad zum Icon oder None
         """
         # Flatpak-Icons sind meist unter dem vollen App-ID zu finden
-        flatpak_icon_bases = [
-            Path("/var/lib/flatpak/exports/share/icons"),
-            Path.home() / ".local/share/flatpak/exports/share/icons",
-        ]
-
-        for icon_base in flatpak_icon_bases:
-            if not icon_base.exists():
-                continue
-
-            for size_dir in ["32x32", "48x48", "64x64", "128x128", "scalable"]:
-                search_dir = icon_base / "hicolor" / size_dir / "apps"
-                if not search_dir.exists():
-                    continue
-
-                for ext in self.ICON_EXTENSIONS:
-                    icon_path = search_dir / f"{package_name}{ext}"
-                    if icon_path.exists():
-                        logger.debug(f"Flatpak-Icon gefunden: {icon_path}")
-                        return icon_path
+        icon_path = self._flatpak_index.find([package_name])
+        if icon_path:
+            logger.debug(f"Flatpak-Icon gefunden: {icon_path}")
+            return icon_path
 
         # Fallback: Versuche letzten Teil des App-IDs (z.B. "firefox" aus "org.mozilla.firefox")
         if "." in package_name:
@@ -282,6 +796,12 @@ class IconManager:
         Raises:
             Exception: Bei Fehler beim Laden
         """
+        # Bereits skaliert im Disk-Cache?
+        cached = self._disk_cache.get(icon_path, self.icon_size, self.DISK_CACHE_VARIANT)
+        if cached:
+            width, height, pixels = cached
+            return ImageTk.PhotoImage(Image.frombytes("RGBA", (width, height), pixels))
+
         img = Image.open(icon_path)
 
         # Konvertiere zu RGBA falls nötig
@@ -291,6 +811,9 @@ class IconManager:
         # Skaliere auf Zielgröße (erhält Seitenverhältnis)
         img.thumbnail((self.icon_size, self.icon_size), Image.Resampling.LANCZOS)
 
+        self._disk_cache.put(icon_path, self.icon_size, self.DISK_CACHE_VARIANT,
+                             img.width, img.height, img.tobytes())
+
         return ImageTk.PhotoImage(img)
 
     def _get_default_icon(self) -> "ImageTk.PhotoImage":
@@ -333,6 +856,22 @@ class IconManager:
         self._icon_cache.clear()
         logger.info("Icon-Cache geleert")
 
+    def refresh_index(self) -> None:
+        """Baut die Icon-Indizes neu auf, falls sich Icon-Verzeichnisse geändert haben"""
+        for index in (self._system_index, self._snap_index, self._flatpak_index):
+            if index.refresh():
+                # Icons könnten hinzugekommen oder entfernt worden sein
+                self._icon_cache.clear()
+
+    def get_cache_stats(self) -> dict:
+        """
+        Gibt Statistiken über den Icon-Cache zurück
+
+        Returns:
+            Dictionary mit hits, misses, evictions, entries, bytes, max_bytes
+        """
+        return self._icon_cache.get_stats()
+
     def preload_icons(self, packages: list) -> None:
         """
         Lädt Icons für eine Liste von Paketen vor (für bessere Performance)
@@ -354,20 +893,27 @@ class IconManagerGTK:
     # Nutzt die gleichen Pfade wie IconManager
     ICON_SEARCH_PATHS = IconManager.ICON_SEARCH_PATHS
     SNAP_ICON_PATHS = IconManager.SNAP_ICON_PATHS
+    SNAP_ICON_SIZES = IconManager.SNAP_ICON_SIZES
+    FLATPAK_ICON_PATHS = IconManager.FLATPAK_ICON_PATHS
+    FLATPAK_ICON_SIZES = IconManager.FLATPAK_ICON_SIZES
     ICON_EXTENSIONS = IconManager.ICON_EXTENSIONS
 
-    def __init__(self, icon_size: int = 32):
+    # Schlüssel-Variante im Disk-Cache (GdkPixbuf skaliert auch kleine Icons hoch)
+    DISK_CACHE_VARIANT = "gtk"
+
+    def __init__(self, icon_size: int = 32, cache_bytes: int = 16 * 1024 * 1024):
         """
         Initialisiert den GTK4 IconManager
 
         Args:
             icon_size: Zielgröße für Icons in Pixeln (Standard: 32)
+            cache_bytes: Speicherbudget des Icon-Caches in Bytes
         """
         if not HAS_GTK:
             raise RuntimeError("GTK4/GdkPixbuf nicht verfügbar")
 
         self.icon_size = icon_size
-        self._icon_cache: Dict[str, GdkPixbuf.Pixbuf] = {}
+        self._icon_cache = IconLRUCache(cache_bytes, lambda pixbuf: pixbuf.get_byte_length())
         self._default_icon: Optional[GdkPixbuf.Pixbuf] = None
 
         # Erweitere Suchpfade
@@ -378,6 +924,12 @@ class IconManagerGTK:
             Path(p).expanduser() for p in self.SNAP_ICON_PATHS
         ]
 
+        # Icon-Indizes (werden beim ersten Zugriff aufgebaut)
+        self._system_index, self._snap_index, self._flatpak_index = create_icon_indexes(self)
+
+        # Persistenter Cache für skalierte Icons (gemeinsam für Tk und GTK)
+        self._disk_cache = IconDiskCache()
+
     def get_icon(self, package_name: str, package_type: str) -> GdkPixbuf.Pixbuf:
         """
         Holt das Icon für ein Paket
@@ -391,25 +943,63 @@ class IconManagerGTK:
         """
         # Prüfe Cache
         cache_key = f"{package_type}:{package_name}"
-        if cache_key in self._icon_cache:
-            return self._icon_cache[cache_key]
+        icon = self._icon_cache.get(cache_key)
+        if icon is not None:
+            return icon
 
         # Versuche Icon zu finden
         icon_path = self._find_icon(package_name, package_type)
 
-        if icon_path and icon_path.exists():
+        if icon_path:
             try:
                 icon = self._load_and_resize_icon(icon_path)
-                self._icon_cache[cache_key] = icon
+                self._icon_cache.put(cache_key, icon)
                 return icon
             except Exception as e:
                 logger.debug(f"Fehler beim Laden von Icon {icon_path}: {e}")
 
-        # Fallback auf Standard-Icon
+        # Fallback auf Standard-Icon (gemeinsam genutzt, belegt kein Budget)
         default_icon = self._get_default_icon()
-        self._icon_cache[cache_key] = default_icon
+        self._icon_cache.put(cache_key, default_icon, shared=True)
         return default_icon
 
+    def get_cached_icon(self, package_name: str, package_type: str) -> Optional[GdkPixbuf.Pixbuf]:
+        """
+        Gibt das Icon zurück, falls es bereits geladen ist (ohne Dateizugriff)
+
+        Treffer werden gezählt, Fehlschläge nicht: Der Aufrufer lädt das Icon
+        danach per get_icon, das den Fehlschlag zählt.
+
+        Args:
+            package_name: Name des Pakets
+            package_type: Typ des Pakets
+
+        Returns:
+            GdkPixbuf.Pixbuf-Objekt oder None wenn noch nicht geladen
+        """
+        return self._icon_cache.get(f"{package_type}:{package_name}", count_miss=False)
+
+    def get_cache_stats(self) -> dict:
+        """
+        Gibt Statistiken über den Icon-Cache zurück
+
+        Returns:
+            Dictionary mit hits, misses, evictions, entries, bytes, max_bytes
+        """
+        return self._icon_cache.get_stats()
+
+    def get_placeholder_icon(self) -> GdkPixbuf.Pixbuf:
+        """
+        Gibt das Platzhalter-Icon zurück
+
+        Muss beim ersten Aufruf im GTK-Main-Thread aufgerufen werden (Icon-Theme).
+        Danach kann get_icon() auch aus Worker-Threads genutzt werden.
+
+        Returns:
+            GdkPixbuf.Pixbuf-Objekt mit Platzhalter
+        """
+        return self._get_default_icon()
+
     def _find_icon(self, package_name: str, package_type: str) -> Optional[Path]:
         """Sucht das Icon für ein Paket (gleiche Logik wie IconManager)"""
         if package_type == "snap":
@@ -427,65 +1017,30 @@ class IconManagerGTK:
         """Sucht ein Icon in den Standard-System-Verzeichnissen"""
         clean_names = self._get_icon_name_variants(package_name)
 
-        for icon_dir in self.icon_search_paths:
-            if not icon_dir.exists():
-                continue
-
-            for name in clean_names:
-                for ext in self.ICON_EXTENSIONS:
-                    icon_path = icon_dir / f"{name}{ext}"
-                    if icon_path.exists():
-                        logger.debug(f"Icon gefunden: {icon_path}")
-                        return icon_path
-
-        return None
+        icon_path = self._system_index.find(clean_names)
+        if icon_path:
+            logger.debug(f"Icon gefunden: {icon_path}")
+        return icon_path
 
     def _find_snap_icon(self, package_name: str) -> Optional[Path]:
         """Sucht ein Icon für ein Snap-Paket"""
-        for icon_dir in self.snap_icon_paths:
-            if not icon_dir.exists():
-                continue
-
-            for size_dir in ["32x32", "48x48", "64x64", "scalable"]:
-                search_dir = icon_dir / "hicolor" / size_dir / "apps"
-                if not search_dir.exists():
-                    continue
-
-                for ext in self.ICON_EXTENSIONS:
-                    candidates = [
-                        search_dir / f"snap.{package_name}.{package_name}{ext}",
-                        search_dir / f"snap.{package_name}{ext}",
-                        search_dir / f"{package_name}{ext}",
-                    ]
-
-                    for candidate in candidates:
-                        if candidate.exists():
-                            logger.debug(f"Snap-Icon gefunden: {candidate}")
-                            return candidate
+        icon_path = self._snap_index.find([
+            f"snap.{package_name}.{package_name}",
+            f"snap.{package_name}",
+            package_name,
+        ], extension_first=True)
+        if icon_path:
+            logger.debug(f"Snap-Icon gefunden: {icon_path}")
+            return icon_path
 
         return self._find_system_icon(package_name)
 
     def _find_flatpak_icon(self, package_name: str) -> Optional[Path]:
         """Sucht ein Icon für ein Flatpak-Paket"""
-        flatpak_icon_bases = [
-            Path("/var/lib/flatpak/exports/share/icons"),
-            Path.home() / ".local/share/flatpak/exports/share/icons",
-        ]
-
-        for icon_base in flatpak_icon_bases:
-            if not icon_base.exists():
-                continue
-
-            for size_dir in ["32x32", "48x48", "64x64", "128x128", "scalable"]:
-                search_dir = icon_base / "hicolor" / size_dir / "apps"
-                if not search_dir.exists():
-                    continue
-
-                for ext in self.ICON_EXTENSIONS:
-                    icon_path = search_dir / f"{package_name}{ext}"
-                    if icon_path.exists():
-                        logger.debug(f"Flatpak-Icon gefunden: {icon_path}")
-                        return icon_path
+        icon_path = self._flatpak_index.find([package_name])
+        if icon_path:
+            logger.debug(f"Flatpak-Icon gefunden: {icon_path}")
+            return icon_path
 
         if "." in package_name:
             short_name = package_name.split(".")[-1]
@@ -524,6 +1079,20 @@ class IconManagerGTK:
         Raises:
             Exception: Bei Fehler beim Laden
         """
+        # Bereits skaliert im Disk-Cache?
+        cached = self._disk_cache.get(icon_path, self.icon_size, self.DISK_CACHE_VARIANT)
+        if cached:
+            width, height, pixels = cached
+            return GdkPixbuf.Pixbuf.new_from_bytes(
+                GLib.Bytes.new(pixels),
+                GdkPixbuf.Colorspace.RGB,
+                True,  # has_alpha
+                8,
+                width,
+                height,
+                width * 4
+            )
+
         # GdkPixbuf kann direkt laden und skalieren
         pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
             str(icon_path),
@@ -531,6 +1100,17 @@ class IconManagerGTK:
             self.icon_size,
             True  # preserve_aspect_ratio
         )
+
+        # Für den Disk-Cache als RGBA ohne Zeilen-Padding ablegen
+        rgba = pixbuf if pixbuf.get_has_alpha() else pixbuf.add_alpha(False, 0, 0, 0)
+        width = rgba.get_width()
+        height = rgba.get_height()
+        rowstride = rgba.get_rowstride()
+        data = rgba.read_pixel_bytes().get_data()
+        if rowstride != width * 4:
+            data = b"".join(data[row * rowstride:row * rowstride + width * 4] for row in range(height))
+        self._disk_cache.put(icon_path, self.icon_size, self.DISK_CACHE_VARIANT, width, height, data)
+
         return pixbuf
 
     def _get_default_icon(self) -> GdkPixbuf.Pixbuf:
@@ -619,3 +1199,10 @@ class IconManagerGTK:
         """Leert den Icon-Cache"""
         self._icon_cache.clear()
         logger.info("Icon-Cache geleert")
+
+    def refresh_index(self) -> None:
+        """Baut die Icon-Indizes neu auf, falls sich Icon-Verzeichnisse geändert haben"""
+        for index in (self._system_index, self._snap_index, self._flatpak_index):
+            if index.refresh():
+                # Icons könnten hinzugekommen oder entfernt worden sein
+                self._icon_cache.clear()
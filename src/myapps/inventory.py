@@ -0,0 +1,133 @@
+"""
+Spaltenorientierte Paket-Tabelle für MyApps
+Hält das Inventar als Spalten (Struct of Arrays) statt als Liste von
+Package-Objekten; Filter, Suche und Seiten arbeiten mit Zeilen-IDs
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from .package_manager import Package
+
+
+class PackageTable:
+    """
+    Inventar als Spalten mit ganzzahligen Zeilen-IDs
+
+    Pakettypen werden als Index in eine kleine Typ-Tabelle gespeichert,
+    Namen, Versionen und Beschreibungen über einen gemeinsamen String-Pool
+    dedupliziert (gleiche Texte liegen nur einmal im Speicher).
+    """
+
+    def __init__(self):
+        """Initialisiert eine leere PackageTable"""
+        self.names: List[str] = []
+        self.versions: List[str] = []
+        self.descriptions: List[Optional[str]] = []
+        self.type_ids = array('B')
+        self.types: List[str] = []
+
+        self._type_index: Dict[str, int] = {}
+        self._pool: Dict[str, str] = {}
+
+    @classmethod
+    def from_packages(cls, packages: Iterable[Package]) -> "PackageTable":
+        """
+        Erstellt eine Tabelle aus Package-Objekten
+
+        Args:
+            packages: Pakete (Zeilen-IDs entsprechen der Reihenfolge)
+
+        Returns:
+            Neue PackageTable
+        """
+        table = cls()
+        table.extend(packages)
+        return table
+
+    def _intern(self, value: Optional[str]) -> Optional[str]:
+        """Gibt die gepoolte Instanz eines Strings zurück"""
+        if value is None:
+            return None
+        return self._pool.setdefault(value, value)
+
+    def _type_id(self, package_type: str) -> int:
+        """Ermittelt (oder vergibt) die ID eines Pakettyps"""
+        type_id = self._type_index.get(package_type)
+        if type_id is None:
+            type_id = self._type_index[package_type] = len(self.types)
+            self.types.append(package_type)
+        return type_id
+
+    def append(self, name: str, version: str, package_type: str, description: Optional[str] = None) -> int:
+        """
+        Fügt eine Zeile hinzu
+
+        Returns:
+            Zeilen-ID
+        """
+        row = len(self.names)
+        self.names.append(self._intern(name))  # Gleicher Name bei mehreren Typen/Architekturen möglich
+        self.versions.append(self._intern(version))
+        self.descriptions.append(self._intern(description))
+        self.type_ids.append(self._type_id(package_type))
+        return row
+
+    def extend(self, packages: Iterable[Package]) -> range:
+        """
+        Fügt Package-Objekte hinzu
+
+        Args:
+            packages: Pakete
+
+        Returns:
+            Bereich der neuen Zeilen-IDs
+        """
+        start = len(self.names)
+        for pkg in packages:
+            self.append(pkg.name, pkg.version, pkg.package_type, pkg.description)
+        return range(start, len(self.names))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def package_type(self, row: int) -> str:
+        """Gibt den Pakettyp einer Zeile zurück"""
+        return self.types[self.type_ids[row]]
+
+    def package(self, row: int) -> Package:
+        """
+        Erzeugt ein Package-Objekt für eine Zeile (z.B. für Export)
+
+        Args:
+            row: Zeilen-ID
+
+        Returns:
+            Package
+        """
+        return Package(
+            name=self.names[row],
+            version=self.versions[row],
+            package_type=self.types[self.type_ids[row]],
+            description=self.descriptions[row]
+        )
+
+    def packages(self, rows: Iterable[int]) -> List[Package]:
+        """Erzeugt Package-Objekte für mehrere Zeilen"""
+        return [self.package(row) for row in rows]
+
+    def sort_key(self, row: int):
+        """Sortierschlüssel einer Zeile (wie package_sort_key: Typ, Name)"""
+        return self.types[self.type_ids[row]], self.names[row]
+
+    def sorted_rows(self, rows: Iterable[int]) -> array:
+        """
+        Sortiert Zeilen-IDs nach Typ und Name
+
+        Args:
+            rows: Zeilen-IDs
+
+        Returns:
+            Sortiertes Index-Array
+        """
+        return array('I', sorted(rows, key=self.sort_key))
@@ -17,23 +17,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def get_base_dir() -> Path:
+    """
+    Bestimmt das Basis-Verzeichnis (wo sich das Projekt befindet)
+
+    Im installierten Zustand: /usr/share/myapps oder ähnlich
+    Im Development: projekte/app_lister
+    """
+    if getattr(sys, 'frozen', False):
+        # PyInstaller/Frozen
+        return Path(sys._MEIPASS)
+
+    # Versuche zuerst /usr/share/myapps (System-Installation via OBS/DEB)
+    system_base = Path("/usr/share/myapps")
+    if system_base.exists() and (system_base / "filters").exists():
+        return system_base
+
+    # Development oder GitHub DEB (Fallback)
+    return Path(__file__).parent.parent.parent
+
+
 def main():
     """Hauptfunktion"""
+    # CLI-Unterkommandos (myapps list/export/diff/matrix) laufen ohne GUI-Importe
+    if len(sys.argv) > 1 and sys.argv[1] in ("list", "export", "diff", "matrix", "-h", "--help"):
+        from .cli import main as cli_main
+        try:
+            sys.exit(cli_main(sys.argv[1:], get_base_dir()))
+        except KeyboardInterrupt:
+            sys.exit(130)
+
     try:
-        # Bestimme Basis-Verzeichnis (wo sich das Projekt befindet)
-        # Im installierten Zustand: /usr/share/myapps oder ähnlich
-        # Im Development: projekte/app_lister
-        if getattr(sys, 'frozen', False):
-            # PyInstaller/Frozen
-            base_dir = Path(sys._MEIPASS)
-        else:
-            # Versuche zuerst /usr/share/myapps (System-Installation via OBS/DEB)
-            system_base = Path("/usr/share/myapps")
-            if system_base.exists() and (system_base / "filters").exists():
-                base_dir = system_base
-            else:
-                # Development oder GitHub DEB (Fallback)
-                base_dir = Path(__file__).parent.parent.parent
+        base_dir = get_base_dir()
 
         logger.info(f"MyApps startet...")
         logger.info(f"Basis-Verzeichnis: {base_dir}")
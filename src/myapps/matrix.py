@@ -0,0 +1,343 @@
+"""
+Host-Matrix für MyApps
+Führt die Exporte vieler Rechner zu einer Paket × Host-Matrix zusammen
+
+Exporte werden nacheinander gestreamt. Pro eindeutigem Paket (Typ, Name)
+gibt es eine Zeile mit einem Bitset der Hosts und einem Bitset je Version;
+Namen und Versionen werden interniert. Der Speicherbedarf wächst damit mit
+der Anzahl eindeutiger Pakete (plus einem Bit pro Host), nicht mit
+Hosts × Pakete Objekten.
+"""
+
+import csv
+import logging
+import sys
+from array import array
+from dataclasses import dataclass
+from functools import cmp_to_key
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .export import ExportReader, FORMAT_SUFFIXES, detect_format, split_compression
+from .package_manager import Package
+from .snapshot import compare_versions
+
+logger = logging.getLogger(__name__)
+
+
+def host_label(input_path: str) -> str:
+    """
+    Ermittelt den Host-Namen eines Exports
+
+    SQLite-Exporte enthalten den Host in den Metadaten, sonst wird der
+    Dateiname ohne Format- und Kompressions-Endung verwendet
+    (z.B. "ws042.json.gz" -> "ws042").
+
+    Args:
+        input_path: Pfad zum Export
+
+    Returns:
+        Host-Name
+    """
+    if detect_format(input_path) == 'sqlite':
+        host = ExportReader.read_metadata(input_path).get('host')
+        if host:
+            return host
+
+    name = Path(input_path).name
+    format_suffix, compression = split_compression(input_path)
+    if compression:
+        name = name[:-len(compression)]
+    if format_suffix in FORMAT_SUFFIXES:
+        name = name[:-len(format_suffix)]
+    return name
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Liefert die Positionen der gesetzten Bits (aufsteigend)"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def count_bits(bits: int) -> int:
+    """Anzahl gesetzter Bits (int.bit_count erst ab Python 3.10)"""
+    return bin(bits).count("1")
+
+
+@dataclass
+class LaggingPackage:
+    """Paket, das auf einem Host älter ist als die neueste Version im Bestand"""
+    host: str
+    name: str
+    package_type: str
+    version: str
+    newest_version: str
+
+
+class InventoryMatrix:
+    """
+    Paket × Host-Matrix mit Bitsets
+
+    Zeile = eindeutiges Paket (Typ, Name). Pro Zeile gibt es ein Bitset der
+    Hosts, auf denen es installiert ist, und ein Dictionary Version -> Bitset.
+    Bit i steht für self.hosts[i].
+    """
+
+    def __init__(self):
+        """Initialisiert eine leere Matrix"""
+        self.hosts: List[str] = []
+        self.names: List[str] = []
+        self.type_ids = array('B')
+        self.types: List[str] = []
+        self.presence: List[int] = []
+        self.versions: List[Dict[str, int]] = []
+
+        self._rows: Dict[Tuple[int, str], int] = {}
+        self._type_index: Dict[str, int] = {}
+        self._pool: Dict[str, str] = {}
+
+    @classmethod
+    def from_exports(cls, input_paths: Iterable[str]) -> "InventoryMatrix":
+        """
+        Erstellt eine Matrix aus Export-Dateien (ein Export pro Host)
+
+        Dateien, die nicht gelesen werden können, werden mit Warnung übersprungen.
+
+        Args:
+            input_paths: Pfade zu Exporten (beliebiges Format, auch komprimiert)
+
+        Returns:
+            Neue InventoryMatrix
+        """
+        matrix = cls()
+        for input_path in input_paths:
+            matrix.add_export(input_path)
+        return matrix
+
+    def _intern(self, value: str) -> str:
+        """Gibt die gepoolte Instanz eines Strings zurück"""
+        return self._pool.setdefault(value, value)
+
+    def _type_id(self, package_type: str) -> int:
+        """Ermittelt (oder vergibt) die ID eines Pakettyps"""
+        type_id = self._type_index.get(package_type)
+        if type_id is None:
+            type_id = self._type_index[package_type] = len(self.types)
+            self.types.append(package_type)
+        return type_id
+
+    def add_host(self, host: str, packages: Iterable[Package]) -> int:
+        """
+        Fügt das Inventar eines Hosts hinzu
+
+        Bricht das Lesen der Pakete ab (z.B. defekter Export), wird der Host
+        wieder vollständig entfernt und die Ausnahme weitergereicht.
+
+        Args:
+            host: Host-Name
+            packages: Pakete des Hosts (Liste oder Generator)
+
+        Returns:
+            Host-ID (Bit-Position)
+        """
+        if host in self.hosts:
+            logger.warning(f"Host {host} ist mehrfach vorhanden")
+
+        host_id = len(self.hosts)
+        self.hosts.append(host)
+        bit = 1 << host_id
+        first_new_row = len(self.names)
+
+        rows = self._rows
+        presence = self.presence
+        versions = self.versions
+        try:
+            for pkg in packages:
+                key = (self._type_id(pkg.package_type), pkg.name)
+                row = rows.get(key)
+                if row is None:
+                    row = rows[key] = len(self.names)
+                    self.names.append(self._intern(pkg.name))
+                    self.type_ids.append(key[0])
+                    presence.append(0)
+                    versions.append({})
+
+                presence[row] |= bit
+                version = self._intern(pkg.version)
+                row_versions = versions[row]
+                row_versions[version] = row_versions.get(version, 0) | bit
+        except BaseException:
+            self._remove_last_host(first_new_row)
+            raise
+
+        return host_id
+
+    def _remove_last_host(self, first_new_row: int) -> None:
+        """
+        Entfernt den zuletzt hinzugefügten Host wieder
+
+        Args:
+            first_new_row: Anzahl der Zeilen vor dem Hinzufügen des Hosts
+        """
+        mask = ~(1 << (len(self.hosts) - 1))
+        for row in range(first_new_row):
+            if self.presence[row] & ~mask:
+                self.presence[row] &= mask
+                row_versions = self.versions[row]
+                for version in list(row_versions):
+                    row_versions[version] &= mask
+                    if not row_versions[version]:
+                        del row_versions[version]
+
+        for row in range(first_new_row, len(self.names)):
+            del self._rows[(self.type_ids[row], self.names[row])]
+        del self.names[first_new_row:]
+        del self.type_ids[first_new_row:]
+        del self.presence[first_new_row:]
+        del self.versions[first_new_row:]
+        self.hosts.pop()
+
+    def add_export(self, input_path: str, host: Optional[str] = None) -> Optional[int]:
+        """
+        Fügt einen Export als Host hinzu (Pakete werden gestreamt, nicht zwischengespeichert)
+
+        Args:
+            input_path: Pfad zum Export
+            host: Host-Name (None = aus Metadaten bzw. Dateiname)
+
+        Returns:
+            Host-ID oder None, falls der Export nicht gelesen werden kann
+        """
+        try:
+            if host is None:
+                host = host_label(input_path)
+            return self.add_host(host, ExportReader.read(input_path))
+        except Exception as e:
+            logger.warning(f"Export {input_path} konnte nicht gelesen werden: {e}")
+            return None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def package_type(self, row: int) -> str:
+        """Gibt den Pakettyp einer Zeile zurück"""
+        return self.types[self.type_ids[row]]
+
+    def hosts_of(self, bits: int) -> List[str]:
+        """Wandelt ein Host-Bitset in Host-Namen um"""
+        hosts = self.hosts
+        return [hosts[host_id] for host_id in iter_bits(bits)]
+
+    def find(self, name: str, package_type: Optional[str] = None) -> Dict[str, str]:
+        """
+        Ermittelt, auf welchen Hosts ein Paket in welcher Version installiert ist
+
+        Args:
+            name: Paketname
+            package_type: Pakettyp (None = alle Typen)
+
+        Returns:
+            Dictionary Host -> Version
+        """
+        result = {}
+        for type_id, known_type in enumerate(self.types):
+            if package_type is not None and known_type != package_type:
+                continue
+            row = self._rows.get((type_id, name))
+            if row is None:
+                continue
+            for version, bits in self.versions[row].items():
+                for host in self.hosts_of(bits):
+                    result[host] = version
+        return result
+
+    def rare_packages(self, min_hosts: int) -> List[Tuple[str, str, List[str]]]:
+        """
+        Pakete, die auf weniger als min_hosts Hosts installiert sind
+
+        Args:
+            min_hosts: Schwelle k
+
+        Returns:
+            Liste von (Typ, Name, Hosts), sortiert nach Typ und Name
+        """
+        result = []
+        for row, bits in enumerate(self.presence):
+            if count_bits(bits) < min_hosts:
+                result.append((self.package_type(row), self.names[row], self.hosts_of(bits)))
+        result.sort(key=lambda entry: (entry[0], entry[1]))
+        return result
+
+    def newest_version(self, row: int) -> Tuple[str, int]:
+        """
+        Ermittelt die neueste Version einer Zeile
+
+        Args:
+            row: Zeile
+
+        Returns:
+            Tupel (Version, Bitset der Hosts mit dieser Version)
+        """
+        row_versions = self.versions[row]
+        if len(row_versions) == 1:
+            return next(iter(row_versions.items()))
+
+        package_type = self.package_type(row)
+        newest = max(row_versions, key=cmp_to_key(
+            lambda a, b: compare_versions(a, b, package_type)
+        ))
+        return newest, row_versions[newest]
+
+    def lagging(self) -> List[LaggingPackage]:
+        """
+        Hosts, auf denen ein Paket älter ist als die neueste Version im Bestand
+
+        Nur Zeilen mit mehreren Versionen werden verglichen; die Hosts ohne
+        neueste Version ergeben sich per Bit-Operation. Hat ein Host mehrere
+        Versionen (z.B. Kernel), zählt er nur, wenn die neueste fehlt.
+
+        Returns:
+            Liste von LaggingPackage, sortiert nach Host, Typ und Name
+        """
+        result = []
+        for row, row_versions in enumerate(self.versions):
+            if len(row_versions) < 2:
+                continue
+
+            newest, newest_bits = self.newest_version(row)
+            lagging_bits = self.presence[row] & ~newest_bits
+            if not lagging_bits:
+                continue
+
+            package_type = self.package_type(row)
+            name = self.names[row]
+            for version, bits in row_versions.items():
+                for host in self.hosts_of(bits & lagging_bits):
+                    result.append(LaggingPackage(host, name, package_type, version, newest))
+
+        result.sort(key=lambda entry: (entry.host, entry.package_type, entry.name))
+        return result
+
+    def write_csv(self, f=None) -> None:
+        """
+        Schreibt die Matrix als CSV (Typ, Name, eine Spalte pro Host mit der Version)
+
+        Zeilen werden einzeln erzeugt; mehrere Versionen auf einem Host
+        werden mit "|" getrennt.
+
+        Args:
+            f: Textdatei (Standard: sys.stdout)
+        """
+        writer = csv.writer(f or sys.stdout)
+        writer.writerow(['Typ', 'Name'] + self.hosts)
+
+        host_count = len(self.hosts)
+        rows = sorted(range(len(self.names)), key=lambda row: (self.package_type(row), self.names[row]))
+        for row in rows:
+            cells = [''] * host_count
+            for version, bits in self.versions[row].items():
+                for host_id in iter_bits(bits):
+                    cells[host_id] = f"{cells[host_id]}|{version}" if cells[host_id] else version
+            writer.writerow([self.package_type(row), self.names[row]] + cells)
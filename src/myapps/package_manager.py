@@ -3,9 +3,13 @@ Paketmanager-Abstraktionsmodul für MyApps
 Unterstützt verschiedene Paketmanager auf unterschiedlichen Linux-Distributionen
 """
 
+import os
+import mmap
+import time
 import subprocess
 import logging
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
@@ -21,6 +25,23 @@ class Package:
     description: Optional[str] = None
 
 
+def package_sort_key(package: Package) -> tuple:
+    """
+    Sortierschlüssel für die Anzeige (nach Typ, dann Name)
+
+    Args:
+        package: Package-Objekt
+
+    Returns:
+        Tupel (package_type, name)
+    """
+    return (package.package_type, package.name)
+
+
+class PackageQueryError(Exception):
+    """Wird ausgelöst, wenn ein Paketmanager nicht abgefragt werden konnte"""
+
+
 class PackageManagerBase(ABC):
     """Basis-Klasse für alle Paketmanager"""
 
@@ -62,6 +83,27 @@ class PackageManagerBase(ABC):
             logger.warning(f"Befehl nicht gefunden: {command[0]}")
             return None
 
+    def _run_query(self, command: List[str]) -> str:
+        """
+        Führt eine Paket-Abfrage aus (wie _run_command, Fehler werden aber gemeldet)
+
+        Eine leere Ausgabe bedeutet "keine Pakete", ein fehlgeschlagener Befehl
+        darf dagegen nicht als leeres Inventar gelten (z.B. im Inventar-Cache).
+
+        Args:
+            command: Liste von Befehlsargumenten
+
+        Returns:
+            Ausgabe des Befehls
+
+        Raises:
+            PackageQueryError: Wenn der Befehl fehlschlägt oder nicht gefunden wird
+        """
+        output = self._run_command(command)
+        if output is None:
+            raise PackageQueryError(f"{' '.join(command)} fehlgeschlagen")
+        return output
+
 
 class DpkgPackageManager(PackageManagerBase):
     """Paketmanager für Debian/Ubuntu/Mint (dpkg)"""
@@ -69,17 +111,132 @@ class DpkgPackageManager(PackageManagerBase):
     def __init__(self):
         super().__init__("deb")
 
+    # Status-Datenbank von dpkg (wird direkt gelesen, ohne dpkg-query zu starten)
+    STATUS_PATH = "/var/lib/dpkg/status"
+
+    # Nur Pakete mit diesem Zustand (drittes Wort des Status-Felds) gelten als installiert.
+    # Die Auswahl (erstes Wort) wird ignoriert, damit z.B. "hold ok installed" mitzählt.
+    INSTALLED_STATE = b"installed"
+
     def get_installed_packages(self) -> List[Package]:
         """Gibt alle installierten DEB-Pakete zurück"""
+        # Schneller Weg: Status-Datei direkt lesen (kein Fork)
+        packages = self._read_status_file()
+
+        # Fallback: dpkg-query (z.B. wenn die Status-Datei nicht lesbar ist)
+        if packages is None:
+            packages = self._query_installed_packages()
+
+        logger.info(f"DEB: {len(packages)} Pakete gefunden")
+        return packages
+
+    def _read_status_file(self) -> Optional[List[Package]]:
+        """
+        Liest installierte Pakete direkt aus /var/lib/dpkg/status
+
+        Die Datei wird per mmap eingeblendet und Stanza für Stanza als Bytes
+        durchlaufen. Dekodiert werden nur die benötigten Felder.
+
+        Returns:
+            Liste von Package-Objekten oder None wenn die Datei nicht lesbar ist
+        """
+        try:
+            with open(self.STATUS_PATH, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._parse_status_data(data)
+        except (OSError, ValueError) as e:
+            logger.warning(f"dpkg-Status-Datei nicht lesbar, nutze dpkg-query: {e}")
+            return None
+
+    @classmethod
+    def _parse_status_data(cls, data) -> List[Package]:
+        """
+        Parst den Inhalt der dpkg-Status-Datei (RFC822-Stanzas)
+
+        Args:
+            data: Dateiinhalt als bytes oder mmap
+
+        Returns:
+            Liste von Package-Objekten (nur Status "... installed", auch gehaltene Pakete)
+        """
+        packages = []
+        size = len(data)
+        pos = 0
+
+        while pos < size:
+            end = data.find(b"\n\n", pos)
+            if end == -1:
+                end = size
+
+            stanza = data[pos:end]
+            pos = end + 2
+
+            if stanza.startswith(b"\n"):
+                # Mehrere Leerzeilen zwischen Stanzas
+                stanza = stanza.lstrip(b"\n")
+            if not stanza:
+                continue
+
+            # Status: Auswahl, Fehlerflag, Zustand (z.B. "hold ok installed")
+            status = (cls._status_field(stanza, b"Status: ") or b"").split()
+            if len(status) != 3 or status[2] != cls.INSTALLED_STATE:
+                continue
+
+            name = cls._status_field(stanza, b"Package: ")
+            version = cls._status_field(stanza, b"Version: ")
+            if not name or version is None:
+                continue
+
+            # Nur die Kurzbeschreibung (erste Zeile), wie bei dpkg-query
+            description = cls._status_field(stanza, b"Description: ")
+
+            packages.append(Package(
+                name=name.decode('utf-8', 'replace'),
+                version=version.decode('utf-8', 'replace'),
+                package_type="deb",
+                description=description.decode('utf-8', 'replace').strip() if description else None
+            ))
+
+        return packages
+
+    @staticmethod
+    def _status_field(stanza: bytes, key: bytes) -> Optional[bytes]:
+        """
+        Gibt die erste Zeile eines Feldes aus einer Stanza zurück
+
+        Args:
+            stanza: Eine Stanza der Status-Datei
+            key: Feldname inklusive ": " (z.B. b"Package: ")
+
+        Returns:
+            Feldwert (bytes, ohne Zeilenumbruch) oder None wenn nicht vorhanden
+        """
+        if stanza.startswith(key):
+            start = len(key)
+        else:
+            idx = stanza.find(b"\n" + key)
+            if idx == -1:
+                return None
+            start = idx + 1 + len(key)
+
+        stop = stanza.find(b"\n", start)
+        if stop == -1:
+            stop = len(stanza)
+
+        return stanza[start:stop].rstrip()
+
+    def _query_installed_packages(self) -> List[Package]:
+        """Fallback: Holt installierte DEB-Pakete via dpkg-query"""
         packages = []
 
         # Hole Pakete MIT Beschreibungen in einem Befehl (schnell)
-        output = self._run_command([
+        output = self._run_query([
             "dpkg-query", "-W",
             "--showformat=${Package}\t${Version}\t${Description}\n"
         ])
-        if not output:
-            return packages
 
         for line in output.splitlines():
             if not line.strip():
@@ -98,7 +255,6 @@ class DpkgPackageManager(PackageManagerBase):
                     description=description
                 ))
 
-        logger.info(f"DEB: {len(packages)} Pakete gefunden")
         return packages
 
     def get_package_description(self, package_name: str) -> Optional[str]:
@@ -154,9 +310,7 @@ class PacmanPackageManager(PackageManagerBase):
         """Gibt alle installierten Pacman-Pakete zurück"""
         packages = []
 
-        output = self._run_command(["pacman", "-Q"])
-        if not output:
-            return packages
+        output = self._run_query(["pacman", "-Q"])
 
         for line in output.splitlines():
             if not line.strip():
@@ -188,9 +342,7 @@ class RpmPackageManager(PackageManagerBase):
         packages = []
 
         # rpm -qa gibt alle installierten Pakete aus
-        output = self._run_command(["rpm", "-qa", "--queryformat", "%{NAME} %{VERSION}-%{RELEASE}\n"])
-        if not output:
-            return packages
+        output = self._run_query(["rpm", "-qa", "--queryformat", "%{NAME} %{VERSION}-%{RELEASE}\n"])
 
         for line in output.splitlines():
             if not line.strip():
@@ -221,9 +373,7 @@ class EopkgPackageManager(PackageManagerBase):
         """Gibt alle installierten eopkg-Pakete zurück"""
         packages = []
 
-        output = self._run_command(["eopkg", "list-installed"])
-        if not output:
-            return packages
+        output = self._run_query(["eopkg", "list-installed"])
 
         for line in output.splitlines():
             if not line.strip():
@@ -256,9 +406,7 @@ class SnapPackageManager(PackageManagerBase):
         """Gibt alle installierten Snap-Pakete zurück"""
         packages = []
 
-        output = self._run_command(["snap", "list"])
-        if not output:
-            return packages
+        output = self._run_query(["snap", "list"])
 
         for line in output.splitlines()[1:]:  # Überspringe Header
             if not line.strip():
@@ -289,9 +437,7 @@ class FlatpakPackageManager(PackageManagerBase):
         """Gibt alle installierten Flatpak-Apps zurück"""
         packages = []
 
-        output = self._run_command(["flatpak", "list", "--app", "--columns=name,application,version"])
-        if not output:
-            return packages
+        output = self._run_query(["flatpak", "list", "--app", "--columns=name,application,version"])
 
         for line in output.splitlines():
             if not line.strip():
@@ -347,6 +493,59 @@ class PackageManagerFactory:
             logger.warning(f"Unbekannter Paketmanager: {pm_name}")
             return None
 
+    @classmethod
+    def get_packages(cls, pm_name: str) -> Optional[List[Package]]:
+        """
+        Holt alle Pakete eines einzelnen Paketmanagers
+
+        Args:
+            pm_name: Name des Paketmanagers
+
+        Returns:
+            Liste der Pakete oder None bei Fehler oder unbekanntem Paketmanager
+            (eine leere Liste heißt: keine Pakete installiert)
+        """
+        pm = cls.create(pm_name)
+        if not pm:
+            return None
+
+        start = time.perf_counter()
+        try:
+            packages = pm.get_installed_packages()
+        except Exception as e:
+            logger.error(f"Fehler beim Abrufen der Pakete von {pm_name}: {e}")
+            return None
+
+        logger.info(f"{pm_name}: {len(packages)} Pakete in {time.perf_counter() - start:.3f}s")
+        return packages
+
+    @classmethod
+    def get_packages_by_manager(cls, package_managers: List[str]) -> Dict[str, Optional[List[Package]]]:
+        """
+        Holt die Pakete aller angegebenen Paketmanager, getrennt nach Paketmanager
+
+        Die Paketmanager werden parallel abgefragt (die Wartezeit entspricht dem
+        langsamsten statt der Summe aller), das Ergebnis ist trotzdem immer in der
+        Reihenfolge von package_managers.
+
+        Args:
+            package_managers: Liste von Paketmanager-Namen
+
+        Returns:
+            Dictionary Paketmanager-Name -> Pakete (in der Reihenfolge von package_managers),
+            None für Paketmanager, die nicht abgefragt werden konnten
+        """
+        if len(package_managers) <= 1:
+            return {pm_name: cls.get_packages(pm_name) for pm_name in package_managers}
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(package_managers)) as executor:
+            futures = [(pm_name, executor.submit(cls.get_packages, pm_name)) for pm_name in package_managers]
+            results = {pm_name: future.result() for pm_name, future in futures}
+
+        logger.info(f"{len(package_managers)} Paketmanager parallel abgefragt in {time.perf_counter() - start:.3f}s")
+        return results
+
     @classmethod
     def get_all_packages(cls, package_managers: List[str]) -> List[Package]:
         """
@@ -360,14 +559,9 @@ class PackageManagerFactory:
         """
         all_packages = []
 
-        for pm_name in package_managers:
-            pm = cls.create(pm_name)
-            if pm:
-                try:
-                    packages = pm.get_installed_packages()
-                    all_packages.extend(packages)
-                except Exception as e:
-                    logger.error(f"Fehler beim Abrufen der Pakete von {pm_name}: {e}")
+        for packages in cls.get_packages_by_manager(package_managers).values():
+            if packages is not None:
+                all_packages.extend(packages)
 
         logger.info(f"Insgesamt {len(all_packages)} Pakete von {len(package_managers)} Paketmanagern gefunden")
         return all_packages
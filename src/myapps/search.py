@@ -0,0 +1,314 @@
+"""
+Such-Index für MyApps
+Invertierter Trigramm-Index über Paketnamen und Beschreibungen
+"""
+
+import logging
+import re
+import time
+from array import array
+from collections import Counter, OrderedDict
+from typing import Dict, List, Sequence, Tuple
+
+from .inventory import PackageTable
+
+logger = logging.getLogger(__name__)
+
+# Trennzeichen, die bei der unscharfen Suche ignoriert werden ("libre-office" == "LibreOffice")
+_SEPARATORS = re.compile(r"[\s\-._+]+")
+
+
+def normalize_key(text: str) -> str:
+    """
+    Normalisiert einen Text für die unscharfe Suche
+
+    Args:
+        text: Paketname oder Suchanfrage
+
+    Returns:
+        Casefold-Text ohne Leerzeichen, Binde- und Unterstriche, Punkte und Pluszeichen
+    """
+    return _SEPARATORS.sub("", text.casefold())
+
+
+def get_search_keys(name: str) -> List[str]:
+    """
+    Ermittelt die normalisierten Suchschlüssel eines Paketnamens
+
+    Bei Flatpak-IDs (org.mozilla.firefox) wird zusätzlich der letzte
+    Bestandteil als eigener Schlüssel verwendet.
+
+    Args:
+        name: Paketname
+
+    Returns:
+        Liste normalisierter Schlüssel (ohne Duplikate)
+    """
+    keys = [normalize_key(name)]
+    if "." in name:
+        tail = normalize_key(name.rsplit(".", 1)[1])
+        if tail and tail not in keys:
+            keys.append(tail)
+    return keys
+
+
+def bounded_substring_distance(pattern: str, text: str, max_distance: int) -> int:
+    """
+    Minimale Editierdistanz von pattern zu einem beliebigen Teilstring von text
+
+    Vertauschte Nachbarzeichen ("pyhton") zählen als ein Fehler.
+    Die Berechnung endet vorzeitig bei einem exakten Treffer.
+
+    Args:
+        pattern: Gesuchter Text
+        text: Durchsuchter Text
+        max_distance: Obergrenze
+
+    Returns:
+        Distanz oder max_distance + 1, falls die Obergrenze überschritten wird
+    """
+    m = len(pattern)
+    limit = max_distance + 1
+    if m - max_distance > len(text):
+        return limit
+
+    # column[i] = Distanz von pattern[:i] zu einem Teilstring, der an der aktuellen Position endet
+    # (Werte über der Obergrenze werden auf limit gekappt)
+    older = None
+    column = [min(i, limit) for i in range(m + 1)]
+    best = column[m]
+    previous_char = ""
+    active = min(max_distance, m)  # Letzte Zeile mit Wert <= max_distance
+    older_active = -1
+
+    for char in text:
+        current = [0] + [limit] * m  # Teilstring darf überall beginnen
+        # Zeilen hinter der letzten aktiven Zeile können die Grenze nicht mehr unterschreiten
+        last = min(m, max(active, older_active + 1) + 1)
+        for i in range(1, last + 1):
+            value = column[i - 1] if pattern[i - 1] == char else column[i - 1] + 1
+            if column[i] + 1 < value:
+                value = column[i] + 1
+            if current[i - 1] + 1 < value:
+                value = current[i - 1] + 1
+            if (older is not None and i > 1 and pattern[i - 1] == previous_char
+                    and pattern[i - 2] == char and older[i - 2] + 1 < value):
+                value = older[i - 2] + 1
+            current[i] = value if value < limit else limit
+
+        older, column, previous_char = column, current, char
+        older_active = active
+        active = last
+        while active > 0 and column[active] >= limit:
+            active -= 1
+
+        if column[m] < best:
+            best = column[m]
+            if best == 0:
+                return 0
+
+    return best if best < limit else limit
+
+
+class SearchIndex:
+    """
+    Trigramm-Index über eine (sortierte) Auswahl von Zeilen einer PackageTable
+
+    Eine Suchanfrage schneidet die Posting-Listen ihrer Trigramme und prüft nur
+    die verbleibenden Kandidaten. Treffer im Namen stehen vor Treffern in der
+    Beschreibung, innerhalb beider Gruppen bleibt die Reihenfolge der Zeilen.
+    Posting-Listen enthalten Positionen in rows, Ergebnisse sind Zeilen-IDs.
+    """
+
+    # Länge der indizierten N-Gramme
+    N = 3
+
+    # Anzahl gemerkter Ergebnisse der unscharfen Suche
+    FUZZY_CACHE_SIZE = 64
+
+    def __init__(self, table: PackageTable, rows: Sequence[int]):
+        """
+        Baut den Index auf
+
+        Args:
+            table: Inventar-Tabelle
+            rows: Zu indizierende Zeilen-IDs in Anzeigereihenfolge
+        """
+        start = time.perf_counter()
+
+        self.table = table
+        self.rows = rows
+        self._names: List[str] = []
+        self._descriptions: List[str] = []
+        self._postings: Dict[str, array] = {}
+
+        # Unscharfe Suche: normalisierte Schlüssel und deren Bigramm-Posting-Listen
+        self._keys: List[List[str]] = []
+        self._key_postings: Dict[str, array] = {}
+        self._fuzzy_cache: "OrderedDict[str, List[Tuple[int, int]]]" = OrderedDict()
+
+        n = self.N
+        postings = self._postings
+        key_postings = self._key_postings
+        names = table.names
+        descriptions = table.descriptions
+        for position, row in enumerate(rows):
+            name = names[row].lower()
+            description = (descriptions[row] or "").lower()
+            self._names.append(name)
+            self._descriptions.append(description)
+
+            grams = {name[i:i + n] for i in range(len(name) - n + 1)}
+            grams.update(description[i:i + n] for i in range(len(description) - n + 1))
+
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array('I')
+                posting.append(position)
+
+            keys = get_search_keys(names[row])
+            self._keys.append(keys)
+            for bigram in {key[i:i + 2] for key in keys for i in range(len(key) - 1)}:
+                posting = key_postings.get(bigram)
+                if posting is None:
+                    posting = key_postings[bigram] = array('I')
+                posting.append(position)
+
+        logger.info(
+            f"Such-Index aufgebaut: {len(rows)} Pakete, {len(postings)} Trigramme "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+
+    def search(self, query: str) -> Tuple[List[int], List[int]]:
+        """
+        Sucht Pakete, deren Name oder Beschreibung die Anfrage enthält
+
+        Args:
+            query: Suchanfrage (wird in Kleinbuchstaben verglichen)
+
+        Returns:
+            Tupel (Zeilen-IDs mit Treffer im Namen, Zeilen-IDs mit Treffer nur in der Beschreibung)
+        """
+        query = query.lower()
+        n = self.N
+
+        if len(query) < n:
+            # Zu kurz für Trigramme: Alle Zeilen prüfen
+            candidates = range(len(self.rows))
+        else:
+            posting_lists = []
+            for gram in {query[i:i + n] for i in range(len(query) - n + 1)}:
+                posting = self._postings.get(gram)
+                if posting is None:
+                    return [], []
+                posting_lists.append(posting)
+
+            # Mit der kürzesten Liste beginnen
+            posting_lists.sort(key=len)
+            candidate_set = set(posting_lists[0])
+            for posting in posting_lists[1:]:
+                candidate_set.intersection_update(posting)
+                if not candidate_set:
+                    return [], []
+            candidates = sorted(candidate_set)
+
+        # Kandidaten verifizieren (Trigramme können aus beiden Feldern stammen)
+        rows = self.rows
+        names = self._names
+        descriptions = self._descriptions
+        name_hits = []
+        description_hits = []
+        for position in candidates:
+            if query in names[position]:
+                name_hits.append(rows[position])
+            elif query in descriptions[position]:
+                description_hits.append(rows[position])
+
+        return name_hits, description_hits
+
+    @staticmethod
+    def max_distance(query_length: int) -> int:
+        """Erlaubte Tippfehler abhängig von der Länge der (normalisierten) Anfrage"""
+        if query_length < 10:
+            return 1
+        return 2
+
+    @classmethod
+    def fuzzy_tolerance(cls, query: str) -> int:
+        """
+        Erlaubte Tippfehler für eine Suchanfrage
+
+        Returns:
+            0 bei Anfragen unter 4 Zeichen (keine unscharfe Suche), sonst max_distance
+        """
+        key_length = len(normalize_key(query))
+        if key_length < 4:
+            return 0  # Zu kurz für sinnvolle Tippfehler-Toleranz
+        return cls.max_distance(key_length)
+
+    def fuzzy_search(self, query: str) -> List[Tuple[int, int]]:
+        """
+        Sucht Pakete, deren normalisierter Name der Anfrage bis auf wenige Tippfehler entspricht
+
+        Kandidaten stammen aus den Bigramm-Posting-Listen: Bei k Tippfehlern
+        fehlen einem passenden Namen höchstens 3k der Bigramme der Anfrage.
+        Nur diese Kandidaten werden per beschränkter Editierdistanz bewertet.
+        Ergebnisse werden pro Anfrage gemerkt (z.B. beim Löschen von Zeichen).
+
+        Args:
+            query: Suchanfrage
+
+        Returns:
+            Liste von (Zeilen-ID, Distanz), sortiert nach Distanz und Anzeigereihenfolge
+        """
+        key = normalize_key(query)
+        cached = self._fuzzy_cache.get(key)
+        if cached is not None:
+            self._fuzzy_cache.move_to_end(key)
+            return cached
+
+        results = self._fuzzy_search(key)
+
+        self._fuzzy_cache[key] = results
+        if len(self._fuzzy_cache) > self.FUZZY_CACHE_SIZE:
+            self._fuzzy_cache.popitem(last=False)
+        return results
+
+    def _fuzzy_search(self, key: str) -> List[Tuple[int, int]]:
+        """Bewertet die Kandidaten einer normalisierten Anfrage (ohne Cache)"""
+        max_distance = self.fuzzy_tolerance(key)
+        if max_distance == 0:
+            return []
+        bigrams = {key[i:i + 2] for i in range(len(key) - 1)}
+        required = len(bigrams) - 3 * max_distance
+
+        counts = Counter()
+        for bigram in bigrams:
+            posting = self._key_postings.get(bigram)
+            if posting is not None:
+                counts.update(posting)
+
+        if required > 0:
+            candidates = [position for position, count in counts.items() if count >= required]
+        else:
+            candidates = list(counts)
+
+        hits = []
+        keys = self._keys
+        for position in candidates:
+            row_keys = keys[position]
+            if any(key in name_key for name_key in row_keys):
+                hits.append((0, position))  # Normalisierter Teilstring-Treffer
+                continue
+
+            distance = min(
+                bounded_substring_distance(key, name_key, max_distance)
+                for name_key in row_keys
+            )
+            if distance <= max_distance:
+                hits.append((distance, position))
+
+        hits.sort()
+        rows = self.rows
+        return [(rows[position], distance) for distance, position in hits]
@@ -0,0 +1,388 @@
+"""
+Snapshot-Vergleich für MyApps
+Vergleicht zwei Inventare (Exporte oder das aktuelle System) und ermittelt
+neu installierte, entfernte sowie aktualisierte/zurückgestufte Pakete
+
+Der Vergleich ist ein Hash-Join über (Typ, Name) mit linearer Laufzeit.
+Versionen werden nach den Regeln des jeweiligen Paketmanagers verglichen
+(dpkg für deb, rpmvercmp mit Epoch/Release für rpm, pacman und eopkg).
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .export import ExportReader
+from .package_manager import Package, package_sort_key
+
+logger = logging.getLogger(__name__)
+
+
+def _is_digit(char: str) -> bool:
+    """ASCII-Ziffer (wie isdigit() in C)"""
+    return "0" <= char <= "9"
+
+
+def _is_alpha(char: str) -> bool:
+    """ASCII-Buchstabe (wie isalpha() in C)"""
+    return "a" <= char <= "z" or "A" <= char <= "Z"
+
+
+def _dpkg_order(char: str) -> int:
+    """Sortiergewicht eines Nicht-Ziffer-Zeichens nach dpkg (~ vor Ende vor Buchstaben vor Rest)"""
+    if _is_alpha(char):
+        return ord(char)
+    if char == "~":
+        return -1
+    return ord(char) + 256
+
+
+def _dpkg_compare_part(a: str, b: str) -> int:
+    """Vergleicht Upstream-Version oder Revision nach dpkg (verrevcmp)"""
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a or j < len_b:
+        # Nicht-numerischer Abschnitt
+        while (i < len_a and not _is_digit(a[i])) or (j < len_b and not _is_digit(b[j])):
+            order_a = _dpkg_order(a[i]) if i < len_a and not _is_digit(a[i]) else 0
+            order_b = _dpkg_order(b[j]) if j < len_b and not _is_digit(b[j]) else 0
+            if order_a != order_b:
+                return -1 if order_a < order_b else 1
+            i += 1
+            j += 1
+
+        # Numerischer Abschnitt (führende Nullen zählen nicht)
+        while i < len_a and a[i] == "0":
+            i += 1
+        while j < len_b and b[j] == "0":
+            j += 1
+        first_diff = 0
+        while i < len_a and _is_digit(a[i]) and j < len_b and _is_digit(b[j]):
+            if not first_diff and a[i] != b[j]:
+                first_diff = -1 if a[i] < b[j] else 1
+            i += 1
+            j += 1
+        if i < len_a and _is_digit(a[i]):
+            return 1
+        if j < len_b and _is_digit(b[j]):
+            return -1
+        if first_diff:
+            return first_diff
+    return 0
+
+
+def _split_evr(version: str) -> Tuple[int, str, str]:
+    """
+    Zerlegt eine Version in Epoch, Version und Release ("1:2.0-3" -> (1, "2.0", "3"))
+
+    Returns:
+        Tupel (Epoch, Version, Release oder "")
+    """
+    epoch = 0
+    head, colon, rest = version.partition(":")
+    if colon and head.isdigit():
+        epoch = int(head)
+        version = rest
+    upstream, dash, release = version.rpartition("-")
+    if not dash:
+        return epoch, version, ""
+    return epoch, upstream, release
+
+
+def compare_deb_versions(a: str, b: str) -> int:
+    """
+    Vergleicht zwei Debian-Versionen wie dpkg --compare-versions
+
+    Returns:
+        -1, 0 oder 1
+    """
+    epoch_a, upstream_a, revision_a = _split_evr(a)
+    epoch_b, upstream_b, revision_b = _split_evr(b)
+    if epoch_a != epoch_b:
+        return -1 if epoch_a < epoch_b else 1
+    return _dpkg_compare_part(upstream_a, upstream_b) or _dpkg_compare_part(revision_a, revision_b)
+
+
+def rpmvercmp(a: str, b: str) -> int:
+    """
+    Vergleicht zwei Versionsstrings wie rpmvercmp (ohne Epoch/Release)
+
+    Ziffern- und Buchstabenblöcke werden einzeln verglichen, Zahlen sind
+    größer als Buchstaben; "~" sortiert vor allem, "^" nach dem Ende.
+
+    Returns:
+        -1, 0 oder 1
+    """
+    if a == b:
+        return 0
+
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a or j < len_b:
+        # Trennzeichen überspringen
+        while i < len_a and not (_is_digit(a[i]) or _is_alpha(a[i])) and a[i] not in "~^":
+            i += 1
+        while j < len_b and not (_is_digit(b[j]) or _is_alpha(b[j])) and b[j] not in "~^":
+            j += 1
+
+        # Tilde: Vorabversion, sortiert vor allem anderen
+        tilde_a = i < len_a and a[i] == "~"
+        tilde_b = j < len_b and b[j] == "~"
+        if tilde_a or tilde_b:
+            if not tilde_a:
+                return 1
+            if not tilde_b:
+                return -1
+            i += 1
+            j += 1
+            continue
+
+        # Caret: Nachversion, sortiert nach dem Ende, aber vor weiteren Blöcken
+        caret_a = i < len_a and a[i] == "^"
+        caret_b = j < len_b and b[j] == "^"
+        if caret_a or caret_b:
+            if i >= len_a:
+                return -1
+            if j >= len_b:
+                return 1
+            if not caret_a:
+                return 1
+            if not caret_b:
+                return -1
+            i += 1
+            j += 1
+            continue
+
+        if i >= len_a or j >= len_b:
+            break
+
+        # Nächsten Block gleicher Art aus beiden Strings lesen
+        start_a, start_b = i, j
+        numeric = _is_digit(a[i])
+        same_kind = _is_digit if numeric else _is_alpha
+        while i < len_a and same_kind(a[i]):
+            i += 1
+        while j < len_b and same_kind(b[j]):
+            j += 1
+        block_a, block_b = a[start_a:i], b[start_b:j]
+
+        if not block_b:
+            # Unterschiedliche Blockarten: Zahlen sind neuer als Buchstaben
+            return 1 if numeric else -1
+
+        if numeric:
+            block_a = block_a.lstrip("0")
+            block_b = block_b.lstrip("0")
+            if len(block_a) != len(block_b):
+                return -1 if len(block_a) < len(block_b) else 1
+        if block_a != block_b:
+            return -1 if block_a < block_b else 1
+
+    if i >= len_a and j >= len_b:
+        return 0
+    return -1 if i >= len_a else 1
+
+
+def compare_evr_versions(a: str, b: str) -> int:
+    """
+    Vergleicht zwei Versionen der Form [Epoch:]Version[-Release] (rpm, pacman, eopkg)
+
+    Das Release wird wie bei pacman (vercmp) nur verglichen, wenn beide Seiten eines haben.
+
+    Returns:
+        -1, 0 oder 1
+    """
+    epoch_a, version_a, release_a = _split_evr(a)
+    epoch_b, version_b, release_b = _split_evr(b)
+    if epoch_a != epoch_b:
+        return -1 if epoch_a < epoch_b else 1
+    result = rpmvercmp(version_a, version_b)
+    if result == 0 and release_a and release_b:
+        result = rpmvercmp(release_a, release_b)
+    return result
+
+
+# Pakettyp -> Versionsvergleich (snap, flatpak und Unbekanntes: rpmvercmp ohne EVR)
+VERSION_COMPARATORS = {
+    "deb": compare_deb_versions,
+    "rpm": compare_evr_versions,
+    "pkg": compare_evr_versions,
+    "eopkg": compare_evr_versions,
+}
+
+
+def compare_versions(a: str, b: str, package_type: str) -> int:
+    """
+    Vergleicht zwei Versionen nach den Regeln des Paketmanagers
+
+    Args:
+        a: Erste Version
+        b: Zweite Version
+        package_type: Pakettyp ("deb", "rpm", "pkg", ...)
+
+    Returns:
+        -1 wenn a älter ist, 0 bei gleicher Version, 1 wenn a neuer ist
+    """
+    return VERSION_COMPARATORS.get(package_type, rpmvercmp)(a, b)
+
+
+@dataclass
+class VersionChange:
+    """Geänderte Version eines Pakets zwischen zwei Snapshots"""
+    name: str
+    package_type: str
+    old_version: str
+    new_version: str
+
+
+@dataclass
+class SnapshotDiff:
+    """Ergebnis eines Snapshot-Vergleichs (Listen sortiert nach Typ und Name)"""
+    added: List[Package] = field(default_factory=list)
+    removed: List[Package] = field(default_factory=list)
+    upgraded: List[VersionChange] = field(default_factory=list)
+    downgraded: List[VersionChange] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """True wenn sich die Snapshots unterscheiden"""
+        return bool(self.added or self.removed or self.upgraded or self.downgraded)
+
+
+def diff_snapshots(old: Iterable[Package], new: Iterable[Package]) -> SnapshotDiff:
+    """
+    Vergleicht zwei Inventare
+
+    Der alte Snapshot wird in eine Hash-Tabelle über (Typ, Name, Version)
+    geladen, der neue läuft als Strom dagegen: Unveränderte Pakete werden
+    sofort abgehakt. Nur die übrigen Pakete werden über (Typ, Name)
+    gepaart, so dass auch mehrfach installierte Pakete (z.B. Kernel unter
+    rpm) korrekt zugeordnet werden.
+
+    Args:
+        old: Pakete des älteren Snapshots
+        new: Pakete des neueren Snapshots (Liste oder Generator)
+
+    Returns:
+        SnapshotDiff
+    """
+    result = SnapshotDiff()
+
+    # Build-Phase: älterer Snapshot (gleiche Einträge mehrfach möglich, z.B. Multiarch)
+    old_index: Dict[Tuple[str, str, str], List[Package]] = {}
+    for pkg in old:
+        old_index.setdefault((pkg.package_type, pkg.name, pkg.version), []).append(pkg)
+
+    # Probe-Phase: unveränderte Pakete einzeln abhaken, Rest merken
+    pending: List[Package] = []
+    for pkg in new:
+        key = (pkg.package_type, pkg.name, pkg.version)
+        matches = old_index.get(key)
+        if matches:
+            matches.pop()
+            if not matches:
+                del old_index[key]
+            result.unchanged += 1
+        else:
+            pending.append(pkg)
+
+    # Übrige alte Pakete nach (Typ, Name) gruppieren
+    old_by_name: Dict[Tuple[str, str], List[Package]] = {}
+    for matches in old_index.values():
+        for pkg in matches:
+            old_by_name.setdefault((pkg.package_type, pkg.name), []).append(pkg)
+
+    for pkg in pending:
+        candidates = old_by_name.get((pkg.package_type, pkg.name))
+        if not candidates:
+            result.added.append(pkg)
+            continue
+
+        previous = candidates.pop()
+        change = VersionChange(pkg.name, pkg.package_type, previous.version, pkg.version)
+        order = compare_versions(previous.version, pkg.version, pkg.package_type)
+        if order < 0:
+            result.upgraded.append(change)
+        elif order > 0:
+            result.downgraded.append(change)
+        else:
+            result.unchanged += 1  # Gleichwertige Schreibweise (z.B. "0:1.0" und "1.0")
+
+    for candidates in old_by_name.values():
+        result.removed.extend(candidates)
+
+    # Nur die Änderungen sortieren (üblicherweise wenige)
+    result.added.sort(key=package_sort_key)
+    result.removed.sort(key=package_sort_key)
+    change_key = lambda change: (change.package_type, change.name)
+    result.upgraded.sort(key=change_key)
+    result.downgraded.sort(key=change_key)
+
+    logger.info(
+        f"Snapshot-Vergleich: {len(result.added)} neu, {len(result.removed)} entfernt, "
+        f"{len(result.upgraded)} aktualisiert, {len(result.downgraded)} zurückgestuft"
+    )
+    return result
+
+
+def load_snapshot(input_path: str) -> Iterator[Package]:
+    """
+    Liest einen gespeicherten Snapshot (beliebiges Export-Format, auch komprimiert)
+
+    Args:
+        input_path: Pfad zum Export
+
+    Yields:
+        Package-Objekte
+    """
+    return ExportReader.read(input_path)
+
+
+def format_diff(diff: SnapshotDiff) -> Iterator[str]:
+    """
+    Formatiert einen Vergleich als Textzeilen
+
+    Zeilen beginnen mit "+" (neu), "-" (entfernt), ">" (aktualisiert) oder "<" (zurückgestuft).
+
+    Args:
+        diff: Ergebnis von diff_snapshots
+
+    Yields:
+        Zeilen ohne Zeilenumbruch
+    """
+    yield (f"# Neu: {len(diff.added)}, Entfernt: {len(diff.removed)}, "
+           f"Aktualisiert: {len(diff.upgraded)}, Zurückgestuft: {len(diff.downgraded)}, "
+           f"Unverändert: {diff.unchanged}")
+
+    for pkg in diff.added:
+        yield f"+ {pkg.package_type} {pkg.name} ({pkg.version})"
+    for pkg in diff.removed:
+        yield f"- {pkg.package_type} {pkg.name} ({pkg.version})"
+    for change in diff.upgraded:
+        yield f"> {change.package_type} {change.name} ({change.old_version} -> {change.new_version})"
+    for change in diff.downgraded:
+        yield f"< {change.package_type} {change.name} ({change.old_version} -> {change.new_version})"
+
+
+def diff_to_json(diff: SnapshotDiff) -> str:
+    """Wandelt einen Vergleich in ein JSON-Dokument um"""
+    def package_entry(pkg: Package) -> dict:
+        return {'name': pkg.name, 'type': pkg.package_type, 'version': pkg.version}
+
+    def change_entry(change: VersionChange) -> dict:
+        return {
+            'name': change.name,
+            'type': change.package_type,
+            'old_version': change.old_version,
+            'new_version': change.new_version
+        }
+
+    return json.dumps({
+        'added': [package_entry(pkg) for pkg in diff.added],
+        'removed': [package_entry(pkg) for pkg in diff.removed],
+        'upgraded': [change_entry(change) for change in diff.upgraded],
+        'downgraded': [change_entry(change) for change in diff.downgraded],
+        'unchanged': diff.unchanged
+    }, indent=2, ensure_ascii=False)
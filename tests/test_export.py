@@ -0,0 +1,99 @@
+"""Tests für Export und Wiedereinlesen (myapps.export)"""
+
+import threading
+
+import pytest
+
+from myapps.export import ExportReader, Exporter
+from myapps.package_manager import Package, package_sort_key
+
+
+PACKAGES = [
+    Package("zsh", "5.9-4+b1", "deb", "Shell mit vielen Erweiterungen"),
+    Package("bash", "5.2.15-2", "deb", "GNU Bourne Again SHell"),
+    Package("libc6", "2.36-9", "deb", "GNU C Library: Shared libraries"),
+    Package("libc6", "2.36-9", "deb", "GNU C Library: Shared libraries"),
+    Package("org.mozilla.firefox", "128.0", "flatpak", "Fast, Private & Safe, \"Web\" Browser"),
+    Package("hello", "2.12", "snap", None),
+    Package("ümlaut-tool", "1:0.1~rc1", "deb", "Beschreibung mit Zeilen-\numbruch"),
+]
+
+EXPECTED = sorted(PACKAGES, key=package_sort_key)
+
+
+def without_descriptions(packages):
+    return [Package(pkg.name, pkg.version, pkg.package_type) for pkg in packages]
+
+
+@pytest.mark.parametrize("compression", ["", ".gz", ".xz", ".bz2"])
+@pytest.mark.parametrize("format", ["csv", "json", "jsonl"])
+def test_round_trip(tmp_path, format, compression):
+    path = str(tmp_path / f"export.{format}{compression}")
+    assert Exporter.export(iter(PACKAGES), path)
+    assert list(ExportReader.read(path)) == EXPECTED
+
+
+@pytest.mark.parametrize("compression", ["", ".gz", ".xz", ".bz2"])
+def test_round_trip_txt(tmp_path, compression):
+    # Der Text-Export enthält keine Beschreibungen
+    path = str(tmp_path / f"export.txt{compression}")
+    assert Exporter.export(iter(PACKAGES), path)
+    assert list(ExportReader.read(path)) == without_descriptions(EXPECTED)
+
+
+def test_txt_name_with_parenthesis(tmp_path):
+    packages = [Package("foo (bar)", "1.0", "flatpak"), Package("Spiel (Demo)", "2.0 beta", "flatpak")]
+    path = str(tmp_path / "export.txt")
+    assert Exporter.export(packages, path)
+    assert list(ExportReader.read(path)) == sorted(packages, key=package_sort_key)
+
+
+def test_round_trip_sqlite(tmp_path):
+    path = str(tmp_path / "export.sqlite")
+    assert Exporter.export(iter(PACKAGES), path)
+    assert list(ExportReader.read(path)) == EXPECTED
+
+    metadata = ExportReader.read_metadata(path)
+    assert metadata['total_packages'] == str(len(PACKAGES))
+    assert metadata['host']
+
+    assert ExportReader.find_package([path], "libc6") == [
+        (metadata['host'], Package("libc6", "2.36-9", "deb", "GNU C Library: Shared libraries"))
+    ] * 2
+
+
+def test_sqlite_rejects_compression(tmp_path):
+    path = tmp_path / "export.sqlite.gz"
+    assert not Exporter.export(PACKAGES, str(path))
+    assert not path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_presorted_is_streamed_unchanged(tmp_path):
+    path = str(tmp_path / "export.jsonl")
+    assert Exporter.export(iter(EXPECTED), path, presorted=True)
+    assert list(ExportReader.read(path)) == EXPECTED
+
+
+def test_cancel_keeps_existing_file(tmp_path):
+    path = tmp_path / "export.json"
+    path.write_text("alt", encoding='utf-8')
+
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert not Exporter.export(PACKAGES, str(path), cancel_event=cancel_event)
+
+    assert path.read_text(encoding='utf-8') == "alt"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_progress_reports_total(tmp_path):
+    counts = []
+    assert Exporter.export(PACKAGES, str(tmp_path / "export.csv"), progress=counts.append)
+    assert counts[-1] == len(PACKAGES)
+
+
+def test_unknown_format(tmp_path):
+    assert not Exporter.export(PACKAGES, str(tmp_path / "export.txt"), format="xml")
+    with pytest.raises(ValueError):
+        list(ExportReader.read(str(tmp_path / "export.txt"), format="xml"))
@@ -0,0 +1,96 @@
+"""Tests für die Host-Matrix (myapps.matrix)"""
+
+import io
+
+import pytest
+
+from myapps.export import Exporter
+from myapps.matrix import InventoryMatrix, host_label
+from myapps.package_manager import Package
+
+
+@pytest.fixture
+def matrix():
+    matrix = InventoryMatrix()
+    matrix.add_host("ws01", [
+        Package("bash", "5.2.15-2", "deb"),
+        Package("vim", "2:9.0.1378-2", "deb"),
+        Package("kernel", "6.5.7-300.fc39", "rpm"),
+    ])
+    matrix.add_host("ws02", [
+        Package("bash", "5.1-6", "deb"),
+        Package("kernel", "6.5.7-300.fc39", "rpm"),
+        Package("kernel", "6.5.8-300.fc39", "rpm"),
+    ])
+    return matrix
+
+
+def snapshot(matrix):
+    return (list(matrix.hosts), list(matrix.names), list(matrix.presence),
+            [dict(row_versions) for row_versions in matrix.versions], dict(matrix._rows))
+
+
+def broken_packages():
+    yield Package("bash", "5.3-1", "deb")
+    yield Package("newpkg", "1.0", "deb")
+    raise ValueError("Export defekt")
+
+
+def test_find(matrix):
+    assert matrix.find("bash") == {"ws01": "5.2.15-2", "ws02": "5.1-6"}
+    assert matrix.find("bash", "rpm") == {}
+
+
+def test_add_host_rollback(matrix):
+    before = snapshot(matrix)
+    with pytest.raises(ValueError):
+        matrix.add_host("ws03", broken_packages())
+
+    assert snapshot(matrix) == before
+    assert matrix.find("bash") == {"ws01": "5.2.15-2", "ws02": "5.1-6"}
+
+    # Danach hinzugefügte Hosts bekommen wieder die nächste Bit-Position
+    assert matrix.add_host("ws03", [Package("bash", "5.2.15-2", "deb")]) == 2
+    assert matrix.find("bash")["ws03"] == "5.2.15-2"
+
+
+def test_add_export_skips_broken_file(matrix, tmp_path):
+    path = tmp_path / "ws03.jsonl"
+    assert Exporter.export([Package("bash", "5.3-1", "deb"), Package("newpkg", "1.0", "deb")], str(path))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("{kein json\n")
+
+    before = snapshot(matrix)
+    assert matrix.add_export(str(path)) is None
+    assert snapshot(matrix) == before
+
+
+def test_add_export(matrix, tmp_path):
+    path = tmp_path / "ws03.csv.gz"
+    assert Exporter.export([Package("bash", "5.3-1", "deb")], str(path))
+    assert host_label(str(path)) == "ws03"
+    assert matrix.add_export(str(path)) == 2
+    assert matrix.find("bash")["ws03"] == "5.3-1"
+
+
+def test_rare_packages(matrix):
+    assert matrix.rare_packages(2) == [("deb", "vim", ["ws01"])]
+    assert matrix.rare_packages(1) == []
+
+
+def test_lagging(matrix):
+    lagging = [(entry.host, entry.name, entry.version, entry.newest_version) for entry in matrix.lagging()]
+    # ws02 hat den neuesten Kernel zusätzlich installiert und zählt daher nicht
+    assert lagging == [
+        ("ws01", "kernel", "6.5.7-300.fc39", "6.5.8-300.fc39"),
+        ("ws02", "bash", "5.1-6", "5.2.15-2"),
+    ]
+
+
+def test_write_csv(matrix):
+    f = io.StringIO()
+    matrix.write_csv(f)
+    lines = f.getvalue().splitlines()
+    assert lines[0] == "Typ,Name,ws01,ws02"
+    assert "rpm,kernel,6.5.7-300.fc39,6.5.7-300.fc39|6.5.8-300.fc39" in lines
+    assert "deb,vim,2:9.0.1378-2," in lines
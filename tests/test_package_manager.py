@@ -0,0 +1,64 @@
+"""Tests für die Paketmanager-Abfragen (myapps.package_manager)"""
+
+from myapps.package_manager import DpkgPackageManager, Package, PackageManagerBase, PackageManagerFactory
+
+
+STATUS = b"""Package: bash
+Status: install ok installed
+Priority: required
+Version: 5.2.15-2+b2
+Description: GNU Bourne Again SHell
+ Bash is an sh-compatible command language interpreter.
+
+Package: linux-image-amd64
+Status: hold ok installed
+Version: 6.1.76-1
+Description: Linux for 64-bit PCs (meta-package)
+
+
+Package: oldtool
+Status: deinstall ok config-files
+Version: 0.9-1
+Description: Removed, only configuration files left
+
+Package: halfdone
+Status: install reinstreq half-installed
+Version: 1.0-1
+
+Package: nodesc
+Status: install ok installed
+Version: 1.0
+"""
+
+
+def test_parse_status_data():
+    assert DpkgPackageManager._parse_status_data(STATUS) == [
+        Package("bash", "5.2.15-2+b2", "deb", "GNU Bourne Again SHell"),
+        Package("linux-image-amd64", "6.1.76-1", "deb", "Linux for 64-bit PCs (meta-package)"),
+        Package("nodesc", "1.0", "deb"),
+    ]
+
+
+def test_parse_status_data_empty():
+    assert DpkgPackageManager._parse_status_data(b"") == []
+
+
+def test_failed_query_is_not_an_empty_inventory(monkeypatch):
+    monkeypatch.setattr(PackageManagerBase, "_run_command", lambda self, command: None)
+    assert PackageManagerFactory.get_packages("flatpak") is None
+    assert PackageManagerFactory.get_packages("unbekannt") is None
+
+
+def test_empty_output_is_an_empty_inventory(monkeypatch):
+    monkeypatch.setattr(PackageManagerBase, "_run_command", lambda self, command: "")
+    assert PackageManagerFactory.get_packages("flatpak") == []
+
+
+def test_get_packages_by_manager_reports_failures(monkeypatch):
+    outputs = {"snap": "Name  Version  Rev\nhello  2.10  42\n", "flatpak": None}
+    monkeypatch.setattr(PackageManagerBase, "_run_command", lambda self, command: outputs[command[0]])
+    assert PackageManagerFactory.get_packages_by_manager(["snap", "flatpak"]) == {
+        "snap": [Package("hello", "2.10", "snap")],
+        "flatpak": None,
+    }
+    assert PackageManagerFactory.get_all_packages(["snap", "flatpak"]) == [Package("hello", "2.10", "snap")]
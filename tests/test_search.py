@@ -0,0 +1,103 @@
+"""Tests für den Such-Index (myapps.search)"""
+
+import itertools
+import random
+
+import pytest
+
+from myapps.inventory import PackageTable
+from myapps.package_manager import Package
+from myapps.search import SearchIndex, bounded_substring_distance, get_search_keys, normalize_key
+
+
+def osa_distance(a: str, b: str) -> int:
+    """Editierdistanz mit Vertauschung von Nachbarzeichen (Referenz, quadratisch)"""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1,
+                          d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+def brute_force_distance(pattern: str, text: str, max_distance: int) -> int:
+    best = min(osa_distance(pattern, text[i:j])
+               for i, j in itertools.combinations_with_replacement(range(len(text) + 1), 2))
+    return min(best, max_distance + 1)
+
+
+@pytest.mark.parametrize("pattern, text, max_distance, expected", [
+    ("python", "python3", 1, 0),
+    ("pyhton", "python3", 1, 1),
+    ("pyton", "libpython", 1, 1),
+    ("firefx", "firefox", 1, 1),
+    ("gimp", "inkscape", 1, 2),
+    ("libreoffice", "libreofficecalc", 2, 0),
+    ("librofice", "libreoffice", 2, 2),
+    ("verylongpattern", "short", 2, 3),
+])
+def test_bounded_substring_distance(pattern, text, max_distance, expected):
+    assert bounded_substring_distance(pattern, text, max_distance) == expected
+
+
+def test_bounded_substring_distance_matches_brute_force():
+    rng = random.Random(42)
+    for _ in range(2000):
+        pattern = "".join(rng.choice("abc") for _ in range(rng.randint(1, 6)))
+        text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 8)))
+        max_distance = rng.randint(0, 3)
+        assert bounded_substring_distance(pattern, text, max_distance) == \
+            brute_force_distance(pattern, text, max_distance), (pattern, text, max_distance)
+
+
+def test_normalize_key_and_search_keys():
+    assert normalize_key("Libre-Office_7.6") == "libreoffice76"
+    assert get_search_keys("org.mozilla.firefox") == ["orgmozillafirefox", "firefox"]
+    assert get_search_keys("bash") == ["bash"]
+
+
+@pytest.fixture
+def index():
+    table = PackageTable.from_packages([
+        Package("python3", "3.11.2-1", "deb", "Interaktive Programmiersprache"),
+        Package("bash", "5.2.15-2", "deb", "GNU Bourne Again SHell"),
+        Package("org.mozilla.firefox", "128.0", "flatpak", "Web-Browser"),
+        Package("vim", "2:9.0.1378-2", "deb", "Editor, kompatibel zu vi (auch für python)"),
+        Package("libreoffice-calc", "4:7.4.7-1", "deb", "Tabellenkalkulation"),
+    ])
+    return SearchIndex(table, table.sorted_rows(range(len(table))))
+
+
+def names(index, rows):
+    return [index.table.names[row] for row in rows]
+
+
+def test_search_name_hits_before_description_hits(index):
+    name_hits, description_hits = index.search("Python")
+    assert names(index, name_hits) == ["python3"]
+    assert names(index, description_hits) == ["vim"]
+
+
+def test_search_short_query_and_no_match(index):
+    assert names(index, index.search("vi")[0]) == ["vim"]
+    assert index.search("emacs") == ([], [])
+
+
+def test_fuzzy_tolerance():
+    assert SearchIndex.fuzzy_tolerance("vim") == 0
+    assert SearchIndex.fuzzy_tolerance("firefx") == 1
+    assert SearchIndex.fuzzy_tolerance("libreofice-calc") == 2
+
+
+def test_fuzzy_search(index):
+    assert [(index.table.names[row], distance) for row, distance in index.fuzzy_search("firefx")] == [
+        ("org.mozilla.firefox", 1)
+    ]
+    assert [index.table.names[row] for row, _ in index.fuzzy_search("LibreOffice Calc")] == ["libreoffice-calc"]
+    assert index.fuzzy_search("vim") == []
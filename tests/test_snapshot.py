@@ -0,0 +1,115 @@
+"""Tests für den Snapshot-Vergleich (myapps.snapshot)"""
+
+import pytest
+
+from myapps.package_manager import Package
+from myapps.snapshot import compare_deb_versions, compare_evr_versions, diff_snapshots, rpmvercmp
+
+
+# Erwartete Ergebnisse wie "dpkg --compare-versions"
+DEB_VECTORS = [
+    ("1.0", "1.0", 0),
+    ("0:1.0-1", "1.0-1", 0),
+    ("1.0~rc1", "1.0", -1),
+    ("1.0~~", "1.0~", -1),
+    ("1.0", "1.0a", -1),
+    ("1.0a", "1.0+b1", -1),  # Buchstaben vor Nicht-Buchstaben
+    ("1.2.3", "1.10", -1),
+    ("1:0.9", "2.0", 1),
+    ("1.0-1", "1.0-2", -1),
+    ("1.0-1ubuntu1", "1.0-1", 1),
+    ("2:9.0.1378-2", "2:9.0.1000-1", 1),
+]
+
+# Erwartete Ergebnisse wie rpmvercmp (Testfälle aus rpm)
+RPM_VECTORS = [
+    ("1.0", "1.0", 0),
+    ("1.0", "2.0", -1),
+    ("2.0.1a", "2.0.1", 1),
+    ("5.5p10", "5.5p1", 1),
+    ("10xyz", "10.1xyz", -1),
+    ("xyz.4", "8", -1),
+    ("6.0.rc1", "6.0", 1),
+    ("1.0~rc1", "1.0", -1),
+    ("1.0^git1", "1.0", 1),
+    ("1.0^git1", "1.01", -1),
+    ("1.0^git1~pre", "1.0^git1", -1),
+    ("a+", "a_", 0),
+    ("2.0", "2_0", 0),
+]
+
+
+def test_identical_snapshots_have_no_changes():
+    packages = [Package("bash", "5.2.15-2", "deb"), Package("firefox", "128.0", "flatpak")]
+    diff = diff_snapshots(packages, list(packages))
+    assert not diff.has_changes
+    assert diff.unchanged == 2
+
+
+def test_duplicate_entries_are_matched_individually():
+    # Multiarch: libc6 für amd64 und i386 in derselben Version
+    packages = [
+        Package("libc6", "2.36-9", "deb"),
+        Package("libc6", "2.36-9", "deb"),
+        Package("bash", "5.2.15-2", "deb"),
+    ]
+    diff = diff_snapshots(packages, list(packages))
+    assert not diff.has_changes
+    assert diff.unchanged == 3
+
+    diff = diff_snapshots(packages, packages[1:])
+    assert diff.removed == [Package("libc6", "2.36-9", "deb")]
+    assert diff.added == []
+    assert diff.unchanged == 2
+
+
+def test_added_removed_upgraded_downgraded():
+    old = [
+        Package("bash", "5.1-6", "deb"),
+        Package("vim", "2:9.0.1378-2", "deb"),
+        Package("gone", "1.0", "deb"),
+    ]
+    new = [
+        Package("bash", "5.2.15-2", "deb"),
+        Package("vim", "2:9.0.1000-1", "deb"),
+        Package("fresh", "0.1", "deb"),
+    ]
+    diff = diff_snapshots(old, iter(new))
+    assert [pkg.name for pkg in diff.added] == ["fresh"]
+    assert [pkg.name for pkg in diff.removed] == ["gone"]
+    assert [(c.name, c.old_version, c.new_version) for c in diff.upgraded] == [("bash", "5.1-6", "5.2.15-2")]
+    assert [c.name for c in diff.downgraded] == ["vim"]
+
+
+def test_multi_version_packages():
+    # rpm installonly: mehrere Kernel gleichzeitig installiert
+    old = [Package("kernel", "6.5.6-300.fc39", "rpm"), Package("kernel", "6.5.7-300.fc39", "rpm")]
+    new = [Package("kernel", "6.5.7-300.fc39", "rpm"), Package("kernel", "6.5.8-300.fc39", "rpm")]
+    diff = diff_snapshots(old, new)
+    assert diff.unchanged == 1
+    assert [(c.old_version, c.new_version) for c in diff.upgraded] == [("6.5.6-300.fc39", "6.5.8-300.fc39")]
+    assert not diff.added and not diff.removed
+
+
+def test_equivalent_version_spelling_is_unchanged():
+    diff = diff_snapshots([Package("foo", "0:1.0-1", "deb")], [Package("foo", "1.0-1", "deb")])
+    assert not diff.has_changes
+
+
+@pytest.mark.parametrize("a, b, expected", DEB_VECTORS)
+def test_compare_deb_versions(a, b, expected):
+    assert compare_deb_versions(a, b) == expected
+    assert compare_deb_versions(b, a) == -expected
+
+
+@pytest.mark.parametrize("a, b, expected", RPM_VECTORS)
+def test_rpmvercmp(a, b, expected):
+    assert rpmvercmp(a, b) == expected
+    assert rpmvercmp(b, a) == -expected
+
+
+def test_compare_evr_versions():
+    assert compare_evr_versions("1:1.0-1", "2.0-1") == 1
+    assert compare_evr_versions("1.0-1.fc39", "1.0-2.fc39") == -1
+    # Release wird nur verglichen, wenn beide Seiten eines haben (pacman)
+    assert compare_evr_versions("1.0", "1.0-3") == 0